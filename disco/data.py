@@ -6,13 +6,15 @@
   Purpose: data container classes.
 """
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from disco.jsktoolbox.attribtool import ReadOnlyClass
 from disco.jsktoolbox.basetool.data import BData
 
-from disco.database import DBProcessor
-from disco.db_models.system import TSystem
+# database modules import SQLAlchemy, they are loaded with the database
+if TYPE_CHECKING:
+    from disco.database import DBProcessor
+    from disco.db_models.system import TSystem
 
 
 class _Keys(object, metaclass=ReadOnlyClass):
@@ -100,25 +102,26 @@ class DiscoData(SimpleData):
     def __init__(self) -> None:
         """Initialize dataset."""
         SimpleData.__init__(self)
-        self._set_data(key=_Keys.SYSTEM, value=None, set_default_type=Optional[TSystem])
+        self._set_data(key=_Keys.SYSTEM, value=None, set_default_type=Optional[object])
         self._set_data(
-            key=_Keys.PROCESSOR, value=None, set_default_type=Optional[DBProcessor]
+            key=_Keys.PROCESSOR, value=None, set_default_type=Optional[object]
         )
         self._set_data(
             key=_Keys.DIALOG,
             value=None,
             set_default_type=Optional[object]
         )
+        self._set_data(key=_Keys.JUMP_RANGE, value=0.0, set_default_type=float)
 
     @property
-    def db_processor(self) -> DBProcessor:
+    def db_processor(self) -> "DBProcessor":
         """Database processor."""
         return self._get_data(
             key=_Keys.PROCESSOR,
         )  # type: ignore
 
     @db_processor.setter
-    def db_processor(self, value: DBProcessor) -> None:
+    def db_processor(self, value: "DBProcessor") -> None:
         """Set database processor."""
         self._set_data(
             key=_Keys.PROCESSOR,
@@ -141,19 +144,34 @@ class DiscoData(SimpleData):
         )
 
     @property
-    def system(self) -> TSystem:
+    def system(self) -> "TSystem":
         """TSystem dataset."""
         return self._get_data(
             key=_Keys.SYSTEM,
         )  # type: ignore
 
     @system.setter
-    def system(self, value: TSystem) -> None:
+    def system(self, value: "TSystem") -> None:
         """Set TSystem dataset."""
         self._set_data(
             key=_Keys.SYSTEM,
             value=value,
         )
 
+    @property
+    def jump_range(self) -> float:
+        """Return maximum configured jump range in ly, 0 if unknown."""
+        return self._get_data(
+            key=_Keys.JUMP_RANGE,
+        )  # type: ignore
+
+    @jump_range.setter
+    def jump_range(self, value: float) -> None:
+        """Set maximum configured jump range in ly."""
+        self._set_data(
+            key=_Keys.JUMP_RANGE,
+            value=float(value),
+        )
+
 
 # #[EOF]#######################################################################
@@ -8,14 +8,16 @@
 
 import datetime
 import time
+from bisect import bisect_left
 from inspect import currentframe
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import create_engine, delete, func, insert, inspect, text
 from sqlalchemy.orm import Session
 from sqlalchemy.engine.base import Engine
 
 from disco.jsktoolbox.basetool.data import BData
+from disco.jsktoolbox.basetool.classes import BClasses
 from disco.jsktoolbox.raisetool import Raise
 from disco.jsktoolbox.attribtool import ReadOnlyClass
 from disco.jsktoolbox.edmctool.ed_keys import EDKeys
@@ -34,6 +36,8 @@ class _Keys(object, metaclass=ReadOnlyClass):
     DB: str = "__db__"
     DEBUG: str = "__debug__"
     ENGINE: str = "__engine__"
+    NEIGHBOUR_RANGE: str = "__neighbour_range__"
+    NAMES: str = "__names__"
     SESSION: str = "__session__"
 
 
@@ -66,6 +70,54 @@ class DataAnalyzer(BData):
         self._set_data(key=_Keys.BODY_SCAN, value=count, set_default_type=int)
 
 
+class SystemNames(BClasses):
+    """Sorted index of system names for case insensitive prefix queries."""
+
+    __keys: List[str] = None  # type: ignore
+    __names: List[str] = None  # type: ignore
+
+    def __init__(self, names: Optional[List[str]] = None) -> None:
+        """Create index.
+
+        params:
+        names: Optional[List[str]] - initial names
+        """
+        pairs: List[Tuple[str, str]] = sorted(
+            {name.lower(): name for name in names or [] if name}.items()
+        )
+        self.__keys = [key for key, _ in pairs]
+        self.__names = [name for _, name in pairs]
+
+    def __len__(self) -> int:
+        """Return number of names."""
+        return len(self.__keys)
+
+    def add(self, name: str) -> None:
+        """Add name to the index."""
+        if not name:
+            return
+        key: str = name.lower()
+        idx: int = bisect_left(self.__keys, key)
+        if idx < len(self.__keys) and self.__keys[idx] == key:
+            return
+        self.__keys.insert(idx, key)
+        self.__names.insert(idx, name)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to limit names starting with prefix, in sorted order."""
+        key: str = prefix.lower()
+        out: List[str] = []
+        idx: int = bisect_left(self.__keys, key)
+        while (
+            idx < len(self.__keys)
+            and len(out) < limit
+            and self.__keys[idx].startswith(key)
+        ):
+            out.append(self.__names[idx])
+            idx += 1
+        return out
+
+
 class Database(BData):
     """Database class engine for store devices variable."""
 
@@ -82,6 +134,12 @@ class Database(BData):
         if self.engine is not None:
             # metadata
             db.DiscoBase.metadata.create_all(self.engine)
+            # columns and indexes added to tables created by previous versions
+            self.__add_columns()
+            for index in db.TSystem.__table__.indexes:
+                index.create(self.engine, checkfirst=True)
+            for index in db.TBody.__table__.indexes:
+                index.create(self.engine, checkfirst=True)
         else:
             raise Raise.error(
                 "Database creation error.",
@@ -90,6 +148,21 @@ class Database(BData):
                 currentframe(),
             )
 
+    def __add_columns(self) -> None:
+        """Add columns missing in tables created by previous versions."""
+        columns: List[str] = [
+            column["name"]
+            for column in inspect(self.engine).get_columns(db.TBody.__tablename__)
+        ]
+        if "sort_key" not in columns:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {db.TBody.__tablename__} "
+                        "ADD COLUMN sort_key VARCHAR NOT NULL DEFAULT ''"
+                    )
+                )
+
     def __create_engine(self) -> Engine:
         engine: Engine = create_engine(
             f"sqlite+pysqlite:///{self.db_path}",
@@ -127,6 +200,20 @@ class DBProcessor(BData):
         """Create instance of class."""
         # self._set_data(key=_Keys.SESSION, value=session, set_default_type=Optional[Session])
         self.session = session
+        self._set_data(key=_Keys.NEIGHBOUR_RANGE, value=100.0, set_default_type=float)
+
+    @property
+    def neighbour_range(self) -> float:
+        """Get range in ly of the stored system neighbours.
+
+        After changing it, update_neighbours() should be called.
+        """
+        return self._get_data(key=_Keys.NEIGHBOUR_RANGE)  # type: ignore
+
+    @neighbour_range.setter
+    def neighbour_range(self, value: float) -> None:
+        """Set range in ly of the stored system neighbours."""
+        self._set_data(key=_Keys.NEIGHBOUR_RANGE, value=float(value))
 
     @property
     def session(self) -> Optional[Session]:
@@ -140,6 +227,36 @@ class DBProcessor(BData):
             key=_Keys.SESSION, value=value, set_default_type=Optional[Session]
         )
 
+    @property
+    def system_names(self) -> SystemNames:
+        """Return index of known system names.
+
+        The index is loaded from database on first use and updated by
+        add_system.
+        """
+        if self._get_data(key=_Keys.NAMES, default_value=None) is None:
+            names: List[str] = (
+                [name for (name,) in self.session.query(db.TSystem.name)]
+                if self.session
+                else []
+            )
+            self._set_data(
+                key=_Keys.NAMES,
+                value=SystemNames(names),
+                set_default_type=SystemNames,
+            )
+        return self._get_data(key=_Keys.NAMES)  # type: ignore
+
+    def new_session(self) -> Optional[Session]:
+        """Return new session bound to the processor database.
+
+        Sessions are not thread safe, worker threads should use their own
+        session and close it after work.
+        """
+        if self.session is None:
+            return None
+        return Session(self.session.get_bind())
+
     def close(self) -> None:
         """Close database session."""
         if self.session is not None:
@@ -176,8 +293,13 @@ class DBProcessor(BData):
                 p_star = db.TBody()
                 p_star.event_parser(entry)
                 system.bodies.append(p_star)
+                p_star.sort_key = self.__sort_key(system, p_star, entry)
             self.session.add(system)
             self.session.commit()
+            if self._get_data(key=_Keys.NAMES, default_value=None) is not None:
+                self.system_names.add(system.name)
+            self.__add_neighbours(system)
+            self.session.commit()
         else:
             # update
             if system.timestamp <= self.str_time(entry[EDKeys.TIMESTAMP]):
@@ -218,6 +340,7 @@ class DBProcessor(BData):
                 system.bodies.append(body)
             body.event_parser(entry)
             body.features.event_parser(entry)
+            body.sort_key = self.__sort_key(system, body, entry)
             if entry[EDKeys.EVENT] == EDKeys.SCAN and entry[EDKeys.SCAN_TYPE] in (
                 EDKeys.BASIC,
                 EDKeys.AUTO_SCAN,
@@ -226,6 +349,8 @@ class DBProcessor(BData):
                 body.features.discovered_first = True
             # add null parents if needed
             self.__add_null_parents(system, entry)
+            # tag systems with boosting primary star
+            self.__update_boost(system, body)
             self.session.commit()
         return system
 
@@ -258,6 +383,7 @@ class DBProcessor(BData):
                 body = db.TBody()
                 system.bodies.append(body)
                 body.event_parser(entry)
+                body.sort_key = self.__sort_key(system, body, entry)
                 self.session.commit()
             if body.signals.event_parser(entry):
                 system.timestamp = entry[EDKeys.TIMESTAMP]
@@ -307,20 +433,248 @@ class DBProcessor(BData):
         if system is None:
             return None
         if EDKeys.PARENTS in entry:
-            for parent in entry[EDKeys.PARENTS]:
+            # BodyIDs of the parents from the system root
+            path: List[int] = [
+                list(parent.values())[0] for parent in reversed(entry[EDKeys.PARENTS])
+            ]
+            for idx, parent in enumerate(entry[EDKeys.PARENTS]):
                 for k_var, v_var in parent.items():
                     test = False
                     for body in system.bodies:
                         if body.bodyid == v_var:
                             test = True
+                            if not body.sort_key:
+                                body.sort_key = db.TBody.make_sort_key(
+                                    path[: len(path) - idx]
+                                )
                     if not test:
                         null = db.TBody()
                         null.bodyid = v_var
+                        null.sort_key = db.TBody.make_sort_key(path[: len(path) - idx])
                         null.features = db.TBodyFeatures()
                         null.features.body_type = k_var
                         system.bodies.append(null)
         return None
 
+    def __sort_key(self, system: db.TSystem, body: db.TBody, entry: Dict) -> str:
+        """Return sort key of the body.
+
+        The path is taken from the event 'Parents' list, if missing from
+        the parents already known in the system.
+        """
+        if entry.get(EDKeys.PARENTS):
+            path: List[int] = [
+                list(parent.values())[0] for parent in reversed(entry[EDKeys.PARENTS])
+            ]
+            return db.TBody.make_sort_key(path + [body.bodyid])
+        if body.sort_key:
+            return body.sort_key
+        return self.__chain_sort_key(
+            body, {item.bodyid: item for item in system.bodies}
+        )
+
+    @staticmethod
+    def __chain_sort_key(body: db.TBody, bodies: Dict[int, db.TBody]) -> str:
+        """Return sort key built from the parentid chain of known bodies."""
+        path: List[int] = [body.bodyid]
+        # parentid is None until the new body is flushed
+        parent: Optional[db.TBody] = bodies.get(body.parentid or 0)
+        while parent is not None and parent.bodyid not in path:
+            if parent.sort_key:
+                return f"{parent.sort_key}/{db.TBody.make_sort_key(path[::-1])}"
+            path.append(parent.bodyid)
+            parent = bodies.get(parent.parentid or 0)
+        return db.TBody.make_sort_key(path[::-1])
+
+    def update_sort_keys(self) -> int:
+        """Set sort keys of bodies stored before the keys were introduced.
+
+        Keys are built from the parentid chain. Returns number of updated
+        bodies.
+        """
+        if self.session is None:
+            return 0
+        systems = (
+            self.session.query(db.TSystem)
+            .join(db.TBody, db.TBody.system_id == db.TSystem.id)
+            .filter(db.TBody.sort_key == "")
+            .distinct()
+        )
+        count: int = 0
+        for system in systems:
+            bodies: Dict[int, db.TBody] = {body.bodyid: body for body in system.bodies}
+            for body in system.bodies:
+                if not body.sort_key:
+                    body.sort_key = self.__chain_sort_key(body, bodies)
+                    count += 1
+        self.session.commit()
+        return count
+
+    def __update_boost(self, system: db.TSystem, body: db.TBody) -> None:
+        """Set FSD supercharge tag if the body is a boosting primary star."""
+        features: db.TBodyFeatures = body.features
+        if not features.star_type or features.distance != 0.0:
+            return None
+        multiplier: float = db.TSystemBoost.star_multiplier(features.star_type)
+        if multiplier == 1.0:
+            return None
+        if system.boost is None:
+            system.boost = db.TSystemBoost()
+        system.boost.star_type = features.star_type
+        system.boost.multiplier = multiplier
+        return None
+
+    def update_boosts(self) -> int:
+        """Tag known systems with boosting primary star.
+
+        Fills the FSD supercharge tags for systems scanned before the
+        tags were introduced. Returns number of tagged systems.
+        """
+        if self.session is None:
+            return 0
+        star_types = db.TSystemBoost.NEUTRON_TYPES + db.TSystemBoost.WHITE_DWARF_TYPES
+        query = (
+            self.session.query(db.TSystem, db.TBody)
+            .join(db.TBody, db.TBody.system_id == db.TSystem.id)
+            .join(db.TBodyFeatures, db.TBodyFeatures.body_id == db.TBody.id)
+            .filter(db.TBodyFeatures.star_type.in_(star_types))
+        )
+        count: int = 0
+        for system, body in query:
+            if system.boost is None:
+                self.__update_boost(system, body)
+                count += system.boost is not None
+        self.session.commit()
+        return count
+
+    def __find_in_range(
+        self, pos: List[float], radius: float
+    ) -> List[Tuple[int, float]]:
+        """Return (id, distance) of systems within radius from the point.
+
+        Uses 'ix_systems_pos' index for the bounding box query.
+        """
+        x, y, z = pos
+        query = self.session.query(  # type: ignore
+            db.TSystem.id, db.TSystem.pos_x, db.TSystem.pos_y, db.TSystem.pos_z
+        ).filter(
+            db.TSystem.pos_x.between(x - radius, x + radius),
+            db.TSystem.pos_y.between(y - radius, y + radius),
+            db.TSystem.pos_z.between(z - radius, z + radius),
+        )
+        out: List[Tuple[int, float]] = []
+        for system_id, pos_x, pos_y, pos_z in query:
+            distance: float = (
+                (pos_x - x) ** 2 + (pos_y - y) ** 2 + (pos_z - z) ** 2
+            ) ** 0.5
+            if distance <= radius:
+                out.append((system_id, distance))
+        return out
+
+    def __add_neighbours(self, system: db.TSystem) -> None:
+        """Store neighbours of the new system in both directions."""
+        if system.id is None or None in system.star_pos:
+            return None
+        rows: List[Dict] = []
+        for system_id, distance in self.__find_in_range(
+            system.star_pos, self.neighbour_range
+        ):
+            if system_id == system.id:
+                continue
+            for pair in ((system.id, system_id), (system_id, system.id)):
+                rows.append(
+                    {
+                        "system_id": pair[0],
+                        "neighbour_id": pair[1],
+                        "distance": distance,
+                    }
+                )
+        if rows:
+            self.session.execute(insert(db.TSystemNeighbour), rows)  # type: ignore
+        return None
+
+    def rebuild_neighbours(self, batch: int = 500) -> int:
+        """Rebuild system neighbours table for the current neighbour range.
+
+        Pairs of every batch systems are searched first and then written
+        in a short transaction, so other sessions can write while the
+        table is rebuilt. Pairs they store meanwhile are kept.
+
+        Returns number of stored pairs.
+        """
+        if self.session is None:
+            return 0
+        self.session.execute(delete(db.TSystemNeighbour))
+        self.session.commit()
+        count: int = 0
+        rows: List[Dict] = []
+        systems = self.session.query(
+            db.TSystem.id, db.TSystem.pos_x, db.TSystem.pos_y, db.TSystem.pos_z
+        ).all()
+        for idx, (system_id, pos_x, pos_y, pos_z) in enumerate(systems, 1):
+            rows.extend(
+                {
+                    "system_id": system_id,
+                    "neighbour_id": neighbour_id,
+                    "distance": distance,
+                }
+                for neighbour_id, distance in self.__find_in_range(
+                    [pos_x, pos_y, pos_z], self.neighbour_range
+                )
+                if neighbour_id != system_id
+            )
+            if rows and (idx % batch == 0 or idx == len(systems)):
+                self.session.execute(
+                    insert(db.TSystemNeighbour).prefix_with("OR IGNORE"), rows
+                )
+                self.session.commit()
+                count += len(rows)
+                rows = []
+        return count
+
+    def update_neighbours(self, built_range: float) -> int:
+        """Rebuild system neighbours table if needed.
+
+        The table is rebuilt if it is empty or was built for other range.
+
+        params:
+        built_range: float - neighbour range the table was built for
+
+        Returns number of stored pairs, 0 if the table was up to date.
+        """
+        if self.session is None:
+            return 0
+        if (
+            built_range == self.neighbour_range
+            and self.session.query(db.TSystemNeighbour).first() is not None
+        ):
+            return 0
+        return self.rebuild_neighbours()
+
+    def get_neighbours(
+        self, system: db.TSystem, radius: Optional[float] = None
+    ) -> List[Tuple[db.TSystem, float]]:
+        """Return known systems within radius sorted by distance.
+
+        Radius defaults to, and is limited by, the neighbour range.
+        """
+        if self.session is None:
+            return []
+        query = (
+            self.session.query(db.TSystem, db.TSystemNeighbour.distance)
+            .join(
+                db.TSystemNeighbour,
+                db.TSystemNeighbour.neighbour_id == db.TSystem.id,
+            )
+            .filter(db.TSystemNeighbour.system_id == system.id)
+        )
+        if radius is not None:
+            query = query.filter(db.TSystemNeighbour.distance <= radius)
+        return [
+            (item, distance)
+            for item, distance in query.order_by(db.TSystemNeighbour.distance)
+        ]
+
     def __get__system(self, system_address: int) -> Optional[db.TSystem]:
         """Get system from database."""
         return (
@@ -333,15 +687,23 @@ class DBProcessor(BData):
             else None
         )
 
-    def get_system_by_name(self, system_name: str) -> Optional[db.TSystem]:
-        """Get TSystem by name."""
+    def get_system_by_name(
+        self, system_name: str, session: Optional[Session] = None
+    ) -> Optional[db.TSystem]:
+        """Get TSystem by name.
+
+        Uses the given session, e.g. one created with new_session() in
+        a worker thread, or the processor session if None.
+        """
+        if session is None:
+            session = self.session
         return (
             (
-                self.session.query(db.TSystem)
+                session.query(db.TSystem)
                 .filter(func.lower(db.TSystem.name) == func.lower(system_name))
                 .first()
             )
-            if self.session
+            if session
             else None
         )
 
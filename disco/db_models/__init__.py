@@ -5,11 +5,14 @@ Created on 02 feb 2023.
 @author: szumak@virthost.pl
 """
 
-from disco.db_models.base import DiscoBase
+from disco.db_models.base import DiscoBase, EdsmBase
 from disco.db_models.body import TBody
 from disco.db_models.body_features import TBodyFeatures
 from disco.db_models.codex import TBodyCodexes, TCodex
+from disco.db_models.edsm_system import TEdsmImport, TEdsmSystem
 from disco.db_models.genuses import TBodyGenuses, TGenusScan, TGenus
 from disco.db_models.signals import TBodySignals, TSignal
 from disco.db_models.system import TSystem
+from disco.db_models.system_boost import TSystemBoost
+from disco.db_models.system_neighbours import TSystemNeighbour
 from disco.db_models.system_features import TSystemFeatures
@@ -13,4 +13,11 @@ class DiscoBase(DeclarativeBase):
     """Declarative Base class."""
 
 
+class EdsmBase(DeclarativeBase):
+    """Declarative Base class of EDSM dump tables.
+
+    Kept apart from DiscoBase metadata, the tables are created by EdsmStore.
+    """
+
+
 # #[EOF]#######################################################################
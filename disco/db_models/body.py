@@ -5,6 +5,8 @@ Created on 30 jan 2023.
 @author: szumak@virthost.pl
 """
 
+from typing import List
+
 from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +24,9 @@ class TBody(DiscoBase):
 
     __tablename__: str = "bodies"
 
+    # digits of the BodyID in the sort key
+    SORT_KEY_WIDTH: int = 5
+
     id: Mapped[int] = mapped_column(
         primary_key=True, nullable=False, autoincrement=True
     )
@@ -30,6 +35,10 @@ class TBody(DiscoBase):
     parentid: Mapped[int] = mapped_column(
         Integer, index=True, nullable=False, default=0
     )
+    # depth-first path of BodyIDs from the system root, see make_sort_key
+    sort_key: Mapped[str] = mapped_column(
+        String, index=True, nullable=False, default=""
+    )
     system_id: Mapped[int] = mapped_column(ForeignKey("systems.id"))
     features: Mapped["TBodyFeatures"] = relationship("TBodyFeatures")
     signals: Mapped["TBodySignals"] = relationship("TBodySignals")
@@ -51,6 +60,7 @@ class TBody(DiscoBase):
             f"system_id='{self.system_id}', "
             f"parentid='{self.parentid}', "
             f"bodyid='{self.bodyid}', "
+            f"sort_key='{self.sort_key}', "
             f"name='{self.name}', "
             f"features='{self.features or ''}', "
             f"signals='{self.signals or ''}', "
@@ -59,6 +69,15 @@ class TBody(DiscoBase):
             f")"
         )
 
+    @classmethod
+    def make_sort_key(cls, path: List[int]) -> str:
+        """Return sort key for the path of BodyIDs from the root to the body.
+
+        Keys sort bodies in depth-first order, children after their parent,
+        siblings by BodyID.
+        """
+        return "/".join(f"{bodyid:0{cls.SORT_KEY_WIDTH}d}" for bodyid in path)
+
     def event_parser(self, entry: dict) -> None:
         """Event parser.
 
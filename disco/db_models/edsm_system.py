@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+"""
+Created on 19 oct 2026.
+
+@author: szumak@virthost.pl
+"""
+
+from sqlalchemy import BigInteger, Boolean, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from disco.db_models.base import EdsmBase
+
+
+class TEdsmSystem(EdsmBase):
+    """Table of systems imported from EDSM dumps."""
+
+    __tablename__: str = "edsm_systems"
+    __table_args__ = (Index("ix_edsm_systems_cell", "cell"),)
+
+    systemaddress: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=False
+    )
+    name: Mapped[str] = mapped_column(String, nullable=False, default="")
+    pos_x: Mapped[float] = mapped_column(Float, nullable=False)
+    pos_y: Mapped[float] = mapped_column(Float, nullable=False)
+    pos_z: Mapped[float] = mapped_column(Float, nullable=False)
+    cell: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string object."""
+        return (
+            f"TEdsmSystem(systemaddress='{self.systemaddress}', "
+            f"name='{self.name}', "
+            f"coords=[{self.pos_x}, {self.pos_y}, {self.pos_z}] "
+            ")"
+        )
+
+
+class TEdsmImport(EdsmBase):
+    """Table of EDSM dump import progress."""
+
+    __tablename__: str = "edsm_imports"
+
+    path: Mapped[str] = mapped_column(String, primary_key=True)
+    size: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mtime: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    offset: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    records: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    done: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    def __repr__(self) -> str:
+        """Return string object."""
+        return (
+            f"TEdsmImport(path='{self.path}', "
+            f"offset='{self.offset}', "
+            f"records='{self.records}', "
+            f"done='{self.done}' "
+            ")"
+        )
+
+
+# #[EOF]#######################################################################
@@ -9,7 +9,7 @@ import datetime
 import time
 from typing import List, Optional, Union, Dict, List
 
-from sqlalchemy import Float, Integer, String
+from sqlalchemy import Float, Index, Integer, String
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,12 +18,14 @@ from disco.db_models.base import DiscoBase
 from disco.db_models.body import TBody
 from disco.db_models.body_features import TBodyFeatures
 from disco.db_models.system_features import TSystemFeatures
+from disco.db_models.system_boost import TSystemBoost
 
 
 class TSystem(DiscoBase):
     """Table of Systems."""
 
     __tablename__: str = "systems"
+    __table_args__ = (Index("ix_systems_pos", "pos_x", "pos_y", "pos_z"),)
 
     id: Mapped[int] = mapped_column(
         primary_key=True, nullable=False, autoincrement=True
@@ -36,7 +38,10 @@ class TSystem(DiscoBase):
     bodycount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     nonbodycount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     features: Mapped["TSystemFeatures"] = relationship("TSystemFeatures")
-    bodies: Mapped[List["TBody"]] = relationship("TBody")
+    bodies: Mapped[List["TBody"]] = relationship(
+        "TBody", order_by=[TBody.sort_key, TBody.bodyid]
+    )
+    boost: Mapped[Optional["TSystemBoost"]] = relationship("TSystemBoost")
     _timestamp: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     def __init__(self) -> None:
@@ -0,0 +1,69 @@
+# -*- coding: UTF-8 -*-
+"""
+Created on 19 oct 2026.
+
+@author: szumak@virthost.pl
+"""
+
+from typing import Tuple
+
+from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from disco.db_models.base import DiscoBase
+
+
+class TSystemBoost(DiscoBase):
+    """Table of FSD supercharge tags of systems with boosting primary star."""
+
+    __tablename__: str = "system_boosts"
+
+    # jump range multipliers after supercharge
+    NEUTRON: float = 4.0
+    WHITE_DWARF: float = 1.5
+
+    NEUTRON_TYPES: Tuple[str, ...] = ("N",)
+    WHITE_DWARF_TYPES: Tuple[str, ...] = (
+        "D",
+        "DA",
+        "DAB",
+        "DAO",
+        "DAV",
+        "DAZ",
+        "DB",
+        "DBV",
+        "DBZ",
+        "DC",
+        "DCV",
+        "DO",
+        "DOV",
+        "DQ",
+        "DX",
+    )
+
+    system_id: Mapped[int] = mapped_column(
+        ForeignKey("systems.id"), primary_key=True, nullable=False
+    )
+    star_type: Mapped[str] = mapped_column(String, nullable=False, default="")
+    multiplier: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
+
+    def __repr__(self) -> str:
+        """Return string object."""
+        return (
+            f"TSystemBoost(system_id='{self.system_id}', "
+            f"star_type='{self.star_type}', "
+            f"multiplier='{self.multiplier}' "
+            ")"
+        )
+
+    @classmethod
+    def star_multiplier(cls, star_type: str) -> float:
+        """Return jump range multiplier for given star type, 1.0 if none."""
+        if star_type in cls.NEUTRON_TYPES:
+            return cls.NEUTRON
+        if star_type in cls.WHITE_DWARF_TYPES:
+            return cls.WHITE_DWARF
+        return 1.0
+
+
+# #[EOF]#######################################################################
@@ -0,0 +1,40 @@
+# -*- coding: UTF-8 -*-
+"""
+Created on 19 oct 2026.
+
+@author: szumak@virthost.pl
+"""
+
+from sqlalchemy import Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from disco.db_models.base import DiscoBase
+
+
+class TSystemNeighbour(DiscoBase):
+    """Table of known systems pairs within the neighbour range.
+
+    Every pair is stored in both directions.
+    """
+
+    __tablename__: str = "system_neighbours"
+
+    system_id: Mapped[int] = mapped_column(
+        ForeignKey("systems.id"), primary_key=True, nullable=False
+    )
+    neighbour_id: Mapped[int] = mapped_column(
+        ForeignKey("systems.id"), primary_key=True, nullable=False
+    )
+    distance: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        """Return string object."""
+        return (
+            f"TSystemNeighbour(system_id='{self.system_id}', "
+            f"neighbour_id='{self.neighbour_id}', "
+            f"distance='{self.distance}' "
+            ")"
+        )
+
+
+# #[EOF]#######################################################################
@@ -6,6 +6,7 @@ Created: 19.12.2023
 Purpose:
 """
 
+from __future__ import annotations
 
 import stat
 import tkinter as tk
@@ -14,15 +15,16 @@ from datetime import datetime
 from queue import Queue, SimpleQueue
 from tkinter import ttk
 from types import FrameType
-from typing import Dict, List, Optional, Union, Any
+from threading import Thread
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union, Any, TYPE_CHECKING
 
 from disco.jsktoolbox.basetool.data import BData
 from disco.jsktoolbox.raisetool import Raise
 from disco.jsktoolbox.attribtool import NoDynamicAttributes
 from disco.jsktoolbox.tktool.widgets import (
     CreateToolTip,
-    VerticalScrolledTkFrame,
     StatusBarTkFrame,
+    VirtualListTkFrame,
 )
 from disco.jsktoolbox.tktool.base import TkBase
 from disco.jsktoolbox.edmctool.base import BLogClient
@@ -31,11 +33,16 @@ from disco.jsktoolbox.edmctool.ed_keys import EDKeys
 from disco.jsktoolbox.edmctool.data import RscanData
 from disco.jsktoolbox.edmctool.stars import StarsSystem
 
-import disco.db_models as db
 from disco.pics import Pics
 from disco.dialogs_helper import DialogKeys
 from disco.data import DiscoData
 
+# used in annotations only, SQLAlchemy is imported with the database
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    import disco.db_models as db
+
 
 class _BDiscoDialog(BData):
     """Base class for Disco Dialogs."""
@@ -128,12 +135,45 @@ class _BDiscoDialog(BData):
         self._set_data(key=DialogKeys.START, value=value, set_default_type=StarsSystem)
 
 
+class _SearchCancelled(Exception):
+    """Raised in the search worker when the search was superseded."""
+
+
 class ImageHelper(NoDynamicAttributes):
     """ImageHelper class.
 
     It analyzes the data and returns the appropriate image and description.
     """
 
+    # decoded Pics images per Tk interpreter, created on first use
+    __registry: Optional[Dict[Any, Dict[bytes, tk.PhotoImage]]] = None
+
+    @classmethod
+    def get_photo(cls, master: tk.Misc, data: bytes) -> tk.PhotoImage:
+        """Return decoded image for base64 encoded image string.
+
+        Every image is decoded once per Tk interpreter of the master widget
+        and shared by all widgets using it.
+        """
+        if cls.__registry is None:
+            cls.__registry = {}
+        images: Dict[bytes, tk.PhotoImage] = cls.__registry.setdefault(master.tk, {})
+        photo: Optional[tk.PhotoImage] = images.get(data)
+        if photo is None:
+            photo = tk.PhotoImage(master=master, data=data)
+            images[data] = photo
+        return photo
+
+    @classmethod
+    def clear_photos(cls, master: Optional[tk.Misc] = None) -> None:
+        """Forget decoded images of the master interpreter, or all if None."""
+        if cls.__registry is None:
+            return
+        if master is None:
+            cls.__registry.clear()
+        else:
+            cls.__registry.pop(master.tk, None)
+
     def get_geo_image(self, body: db.TBody) -> bytes:
         """Return base64 encoded image string."""
         signals: db.TBodySignals = body.signals
@@ -166,54 +206,100 @@ class ImageHelper(NoDynamicAttributes):
 
     def get_bio_description(self, body: db.TBody) -> List[str]:
         """Return description about biological discoveries."""
-        tmp: List[str] = []
+        return self.bio_description(self.bio_data(body))
+
+    @staticmethod
+    def bio_data(body: db.TBody) -> Tuple:
+        """Return plain data for the biological discoveries description.
+
+        (atmosfere, ((genus, ((species, variant, done, count), ...)), ...),
+        (codex name, ...))
+        """
         genuses: db.TBodyGenuses = body.genuses
         codexes: db.TBodyCodexes = body.codexes
         features: db.TBodyFeatures = body.features
+        return (
+            features.atmosfere,
+            tuple(
+                (
+                    genus.genus_localised,
+                    tuple(
+                        (
+                            scan.species_localised,
+                            scan.variant_localised,
+                            scan.done,
+                            scan.count,
+                        )
+                        for scan in genus.scan
+                    ),
+                )
+                for genus in genuses.genuses
+            ),
+            tuple(codex.name_localised for codex in codexes.codexes),
+        )
+
+    @staticmethod
+    def bio_description(data: Tuple) -> List[str]:
+        """Return description about biological discoveries from bio_data."""
+        tmp: List[str] = []
+        atmosfere, genuses, codexes = data
 
-        if features.atmosfere:
-            tmp.append(f"Atmosfere: {features.atmosfere}")
+        if atmosfere:
+            tmp.append(f"Atmosfere: {atmosfere}")
 
-        for item in genuses.genuses:
-            genus: db.TGenus = item
-            name: str = genus.genus_localised
-            for item_scan in genus.scan:
-                scan: db.TGenusScan = item_scan
-                if scan:
-                    name = (
-                        scan.species_localised
-                        if scan.variant_localised == ""
-                        else scan.variant_localised
-                    )
-                if scan.variant_localised == "" and scan.done:
-                    for item in codexes.codexes:
-                        codex: db.TCodex = item
-                        if scan.species_localised in codex.name_localised:
-                            name = codex.name_localised
-                if scan.done:
+        for genus_localised, scans in genuses:
+            name: str = genus_localised
+            for species_localised, variant_localised, done, count in scans:
+                name = (
+                    species_localised if variant_localised == "" else variant_localised
+                )
+                if variant_localised == "" and done:
+                    for codex_name in codexes:
+                        if species_localised in codex_name:
+                            name = codex_name
+                if done:
                     tmp.append(name)
                 else:
-                    tmp.append(f"[{scan.count}]: {name}")
-            if not genus.scan:
+                    tmp.append(f"[{count}]: {name}")
+            if not scans:
                 tmp.append(f"[0]: {name}")
-        if not genuses.genuses:
+        if not genuses:
             tmp.append("Detailed surface scanning needed.")
         return tmp
 
     def get_geo_description(self, body: db.TBody) -> List[str]:
         """Return description about geological discoveries."""
-        tmp: List[str] = []
+        return self.geo_description(self.geo_data(body))
+
+    @staticmethod
+    def geo_data(body: db.TBody) -> Tuple:
+        """Return plain data for the geological discoveries description.
+
+        (volcanism, ((codex subcategory, codex name), ...))
+        """
         codexes: db.TBodyCodexes = body.codexes
         features: db.TBodyFeatures = body.features
+        return (
+            features.volcanism,
+            tuple(
+                (codex.subcategory_localised, codex.name_localised)
+                for codex in codexes.codexes
+            ),
+        )
 
-        if features.volcanism:
-            tmp.append(f"Features: {features.volcanism}")
+    @staticmethod
+    def geo_description(data: Tuple) -> List[str]:
+        """Return description about geological discoveries from geo_data."""
+        tmp: List[str] = []
+        volcanism, codexes = data
 
-        for item in codexes.codexes:
-            codex: db.TCodex = item
-            if "Geology" in codex.subcategory_localised:
-                tmp.append(f"{codex.name_localised}")
-        if not codexes.codexes:
+        if volcanism:
+            tmp.append(f"Features: {volcanism}")
+
+        for subcategory_localised, name_localised in codexes:
+            if "Geology" in subcategory_localised:
+                tmp.append(f"{name_localised}")
+        if not codexes:
             tmp.append("Detailed surface scanning needed.")
         return tmp
 
@@ -300,9 +386,460 @@ class ImageHelper(NoDynamicAttributes):
         return None
 
 
+class DiscoLazyText(NoDynamicAttributes):
+    """Tooltip text built on demand.
+
+    Holds the builder function and plain data it needs. The text is built
+    when the tooltip is shown first and kept for windows sharing the model,
+    and two objects with the same builder and data are equal, so row models
+    can still be compared.
+    """
+
+    __builder: Callable[[Tuple], List[str]] = None  # type: ignore
+    __data: Tuple = None  # type: ignore
+    __text: Optional[Tuple[str, ...]] = None
+
+    def __init__(self, builder: Callable[[Tuple], List[str]], data: Tuple) -> None:
+        """Create lazy text.
+
+        params:
+        builder: Callable - returns text lines for the data
+        data: Tuple - plain, hashable builder data
+        """
+        self.__builder = builder
+        self.__data = data
+
+    def __call__(self) -> List[str]:
+        """Build text."""
+        if self.__text is None:
+            self.__text = tuple(self.__builder(self.__data))
+        return list(self.__text)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare builders and data."""
+        if not isinstance(other, DiscoLazyText):
+            return NotImplemented
+        return self.__builder == other.__builder and self.__data == other.__data
+
+    def __ne__(self, other: object) -> bool:
+        """Compare builders and data."""
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        """Return hash of the builder and data."""
+        return hash((self.__builder, self.__data))
+
+
+class DiscoRowModel(NoDynamicAttributes):
+    """Immutable render model of the bodies list row.
+
+    Holds everything the row displays as (text, image, tooltip) cells, so
+    models of two renders can be compared to find rows that changed.
+    """
+
+    __name: Tuple[str, Optional[bytes], Union[str, Tuple[str, ...], DiscoLazyText]] = None  # type: ignore
+    __cells: Dict[str, Tuple[str, Optional[bytes], Union[str, Tuple[str, ...], DiscoLazyText]]] = None  # type: ignore
+
+    def __init__(
+        self,
+        name: Tuple[str, Optional[bytes], Union[str, List[str], DiscoLazyText]],
+        cells: Optional[
+            Dict[str, Tuple[str, Optional[bytes], Union[str, List[str], DiscoLazyText]]]
+        ] = None,
+    ) -> None:
+        """Create model.
+
+        params:
+        name: tuple - (text, image, tooltip) of the body name label
+        cells: dict - (text, image, tooltip) of the visible DiscoBodyRow.SLOTS
+        """
+        self.__name = self.__freeze(name)
+        self.__cells = {}
+        if cells:
+            for slot, cell in cells.items():
+                self.__cells[slot] = self.__freeze(cell)
+
+    @staticmethod
+    def __freeze(
+        cell: Tuple[str, Optional[bytes], Union[str, List[str], DiscoLazyText]]
+    ) -> Tuple[str, Optional[bytes], Union[str, Tuple[str, ...], DiscoLazyText]]:
+        """Return cell with tooltip lines as tuple."""
+        text, image, tooltip = cell
+        if isinstance(tooltip, List):
+            return text, image, tuple(tooltip)
+        return text, image, tooltip
+
+    def __eq__(self, other: object) -> bool:
+        """Compare models."""
+        if not isinstance(other, DiscoRowModel):
+            return NotImplemented
+        return self.__name == other.name and self.__cells == other.__cells
+
+    def __ne__(self, other: object) -> bool:
+        """Compare models."""
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        """Return hash of the model."""
+        return hash((self.__name, tuple(self.__cells.items())))
+
+    @property
+    def name(
+        self,
+    ) -> Tuple[str, Optional[bytes], Union[str, Tuple[str, ...], DiscoLazyText]]:
+        """Return (text, image, tooltip) of the body name label."""
+        return self.__name
+
+    @property
+    def slots(self) -> Tuple[str, ...]:
+        """Return visible slots."""
+        return tuple(self.__cells.keys())
+
+    def cell(
+        self, slot: str
+    ) -> Optional[
+        Tuple[str, Optional[bytes], Union[str, Tuple[str, ...], DiscoLazyText]]
+    ]:
+        """Return (text, image, tooltip) of the slot or None if hidden."""
+        return self.__cells.get(slot)
+
+
+class DiscoSystemModel(NoDynamicAttributes):
+    """Detached render snapshot of the system.
+
+    Contains only plain data: the system summary and row models of the
+    bodies in hierarchy order, so it can be built in a worker thread with
+    its own database session and shown after the session is closed. The
+    snapshot is immutable, so one instance is shared by all windows showing
+    the system.
+    """
+
+    __id: int = None  # type: ignore
+    __name: str = None  # type: ignore
+    __summary: Tuple[str, ...] = None  # type: ignore
+    __rows: Tuple[DiscoRowModel, ...] = None  # type: ignore
+
+    def __init__(
+        self,
+        system: db.TSystem,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Build snapshot.
+
+        params:
+        system: db.TSystem - system to render
+        progress: Optional[Callable] - called with (done, all) number of rows
+        """
+        self.__id = system.id
+        self.__name = system.name
+        features: db.TSystemFeatures = system.features
+        self.__summary = (
+            f"Security: {features.security}",
+            f"Allegiance: {features.allegiance or 'None'}",
+            f"Population: {features.population}",
+            f"Body count: {system.bodycount}",
+            f"Discovered: {system.scanned_body_count}",
+            f"Last update: {datetime.fromtimestamp(system.timestamp)}",
+        )
+        bodies: List[Union[db.TBody, str]] = self.__sort_bodies(system)
+        rows: List[DiscoRowModel] = []
+        for body in bodies:
+            rows.append(self.__row_model(body))
+            if progress is not None:
+                progress(len(rows), len(bodies))
+        self.__rows = tuple(rows)
+
+    @property
+    def id(self) -> int:
+        """Return system id."""
+        return self.__id
+
+    @property
+    def name(self) -> str:
+        """Return system name."""
+        return self.__name
+
+    @property
+    def summary(self) -> Tuple[str, ...]:
+        """Return system summary lines."""
+        return self.__summary
+
+    @property
+    def rows(self) -> Tuple[DiscoRowModel, ...]:
+        """Return row models of the bodies in hierarchy order."""
+        return self.__rows
+
+    @staticmethod
+    def __body_data(body: db.TBody) -> Tuple:
+        """Return plain data for the body summary tooltip."""
+        features: db.TBodyFeatures = body.features
+        return (
+            features.star_type,
+            features.subclass,
+            features.luminosity,
+            features.stellarmass,
+            features.radius,
+            features.surfacetemperature,
+            features.body_type,
+            features.planet_class,
+            features.surfacegravity,
+            features.massem,
+            features.surfacepressure,
+            features.volcanism,
+            features.atmosfere,
+            features.atmosferetype,
+            features.terraformstate,
+        )
+
+    @staticmethod
+    def body_summary(data: Tuple) -> List[str]:
+        """Create body info string for tooltip from body data."""
+        tmp = []
+        (
+            star_type,
+            subclass,
+            luminosity,
+            stellarmass,
+            radius,
+            surfacetemperature,
+            body_type,
+            planet_class,
+            surfacegravity,
+            massem,
+            surfacepressure,
+            volcanism,
+            atmosfere,
+            atmosferetype,
+            terraformstate,
+        ) = data
+        # star
+        if star_type:
+            tmp.append(
+                f"Spectral class: {star_type or ''}{subclass or ''} {luminosity or ''}"
+            )
+            tmp.append(f"Solar masses: {stellarmass:.3f}")
+            if radius:
+                tmp.append(f"Solar radius: {int(radius)}")
+            if surfacetemperature:
+                tmp.append(f"Surface temperature: {int(surfacetemperature or '??')} K")
+        # planet
+        if body_type and body_type == "Planet":
+            tmp.append(f"Planet class: {planet_class}")
+            if surfacegravity:
+                tmp.append(f"Gravity: {surfacegravity:.3f}")
+            if massem:
+                tmp.append(f"Earth mass: {massem:.3f}")
+            if radius:
+                tmp.append(f"Radius: {int(radius)}")
+            if surfacetemperature:
+                tmp.append(f"Surface temp.: {int(surfacetemperature) or '??'} K")
+            if surfacepressure:
+                tmp.append(f"Surface press.: {int(surfacepressure / 100)} hPa")
+            if volcanism:
+                tmp.append(f"Volcanism: {volcanism}")
+            tmp.append(f"Atmosfere: {atmosfere or atmosferetype}")
+            if terraformstate:
+                tmp.append(f"Terraforming: {terraformstate}")
+
+        return tmp
+
+    @staticmethod
+    def __sort_bodies(system: db.TSystem) -> List[Union[db.TBody, str]]:
+        """Return bodies in hierarchy order.
+
+        TSystem.bodies are loaded ordered by the stored sort key. Empty
+        string is placed before the first child of unknown parent, "Null"
+        bodies (barycentres) are skipped.
+        """
+        known: Set[int] = {body.bodyid for body in system.bodies}
+        out: List[Union[db.TBody, str]] = []
+        for body in system.bodies:
+            if body.parentid not in known:
+                known.add(body.parentid)
+                out.append("")
+            features: db.TBodyFeatures = body.features
+            if features.body_type and features.body_type == "Null":
+                continue
+            out.append(body)
+        return out
+
+    def __row_model(self, body: Optional[db.TBody]) -> DiscoRowModel:
+        """Build render model of the body row."""
+        ih = ImageHelper()
+        slots: Dict[
+            str, Tuple[str, Optional[bytes], Union[str, List[str], DiscoLazyText]]
+        ] = {}
+
+        if not body:
+            return DiscoRowModel(("???", None, ""))
+
+        name = f"??? id: {body.bodyid}"
+        features: db.TBodyFeatures = body.features
+        if body.name:
+            name = body.name
+            signals: db.TBodySignals = body.signals
+            if not features.star_type and self.__name:
+                name = name.replace(self.__name, "").strip()
+            # get scoopable
+            if features.star_type and features.star_type in (
+                "O",
+                "B",
+                "A",
+                "F",
+                "G",
+                "K",
+                "M",
+            ):
+                slots["scoopable"] = ("", ih.get_scoopable_image(), "Scoopable")
+            # get distance to arrival
+            if features.distance:
+                slots["distance"] = (
+                    f"{int(features.distance)} ls",
+                    ih.get_distance_image(),
+                    "Distance to arrival",
+                )
+            # get landable flag
+            if features.landable:
+                # get temperature
+                slots["temperature"] = (
+                    f"{int(features.surfacetemperature)}K",  # type: ignore
+                    ih.get_thermometer_image(),
+                    "Surface temperature",
+                )
+                slots["landable"] = (
+                    "",
+                    ih.get_landable_image(),
+                    "Planetary Landing",
+                )
+            # get terraformstate state
+            if features.terraformstate:
+                slots["terraform"] = (
+                    "",
+                    ih.get_terraform_image(),
+                    f"Terraform state: {features.terraformstate}",
+                )
+            # get human signals
+            if signals.count_humans_signals > 0:
+                slots["humans"] = (
+                    f"{signals.count_humans_signals}",
+                    ih.get_human_image(),
+                    "Human signals",
+                )
+            # get biological signals count
+            if signals.count_bio_signals > 0:
+                slots["bio"] = (
+                    f"{signals.count_bio_signals}",
+                    ih.get_bio_image(body),
+                    DiscoLazyText(ih.bio_description, ih.bio_data(body)),
+                )
+            # get geological signals count
+            if signals.count_geo_signals > 0:
+                slots["geo"] = (
+                    f"{signals.count_geo_signals}",
+                    ih.get_geo_image(body),
+                    DiscoLazyText(ih.geo_description, ih.geo_data(body)),
+                )
+            # first mapped
+            if features.mapped_first:
+                slots["mapped"] = ("", ih.get_map_image(), "First mapped")
+            # first discovered
+            if features.discovered_first:
+                slots["first"] = ("", ih.get_first_image(), "First discovered")
+        elif features.body_type and features.body_type == EDKeys.RING:
+            name = EDKeys.RING
+
+        # generate body summaries tooltip
+        return DiscoRowModel(
+            (
+                name,
+                ih.get_body_image(body),
+                DiscoLazyText(self.body_summary, self.__body_data(body)),
+            ),
+            slots,
+        )
+
+
+class DiscoBodyRow(tk.Frame, TkBase):
+    """Recyclable row of the bodies list.
+
+    The row has a fixed set of labels which are shown or hidden depending
+    on the displayed body, so the same widget can be reused for any body.
+    """
+
+    # labels packed from the right side of the row
+    SLOTS: Tuple[str, ...] = (
+        "scoopable",
+        "distance",
+        "temperature",
+        "landable",
+        "terraform",
+        "humans",
+        "bio",
+        "geo",
+        "mapped",
+        "first",
+    )
+
+    __name: tk.Label = None  # type: ignore
+    __labels: Dict[str, tk.Label] = None  # type: ignore
+    __tips: Dict[str, CreateToolTip] = None  # type: ignore
+    __model: Optional[DiscoRowModel] = None
+
+    def __init__(self, master: tk.Misc) -> None:
+        """Create empty row."""
+        tk.Frame.__init__(self, master, relief=tk.GROOVE, borderwidth=1)
+        self.__labels = {}
+        self.__tips = {}
+        self.__name = tk.Label(self, compound=tk.LEFT)
+        self.__name.pack(side=tk.LEFT)
+        self.__tips[""] = CreateToolTip(self.__name, "")
+        for slot in self.SLOTS:
+            label = tk.Label(self, compound=tk.LEFT)
+            self.__labels[slot] = label
+            self.__tips[slot] = CreateToolTip(label, "")
+
+    def show(self, model: DiscoRowModel) -> None:
+        """Display body model in the row, patch only changed labels."""
+        old: Optional[DiscoRowModel] = self.__model
+        if old is not None and old == model:
+            return
+        self.__model = model
+        if old is None or old.name != model.name:
+            self.__set(self.__name, self.__tips[""], *model.name)
+        for slot in self.SLOTS:
+            cell = model.cell(slot)
+            if cell is not None and (old is None or old.cell(slot) != cell):
+                self.__set(self.__labels[slot], self.__tips[slot], *cell)
+        if old is None or old.slots != model.slots:
+            for slot in self.SLOTS:
+                self.__labels[slot].pack_forget()
+            for slot in self.SLOTS:
+                if model.cell(slot) is not None:
+                    self.__labels[slot].pack(side=tk.RIGHT)
+
+    @staticmethod
+    def __set(
+        label: tk.Label,
+        tip: CreateToolTip,
+        text: str,
+        image: Optional[bytes],
+        tooltip: Union[str, Tuple[str, ...], DiscoLazyText],
+    ) -> None:
+        """Configure label and its tooltip."""
+        label.configure(
+            text=text, image=ImageHelper.get_photo(label, image) if image else ""
+        )
+        tip.text = tooltip  # type: ignore
+
+
 class DiscoMainDialog(BLogClient, DiscoData, NoDynamicAttributes):
     """Create dialog for main EDMC window."""
 
+    # minimal time between two redraws in ms
+    REFRESH_INTERVAL: int = 100
+
     def __init__(
         self,
         parent: tk.Frame,
@@ -330,6 +867,12 @@ class DiscoMainDialog(BLogClient, DiscoData, NoDynamicAttributes):
         # created dialogs
         self._set_data(key=DialogKeys.WINDOWS, value=[], set_default_type=List)
 
+        # refresh scheduler
+        self._set_data(key=DialogKeys.DIRTY, value={}, set_default_type=Dict)
+        self._set_data(key=DialogKeys.REFRESH_ID, value=None)
+        self._set_data(key=DialogKeys.REQUESTED, value=0, set_default_type=int)
+        self._set_data(key=DialogKeys.PERFORMED, value=0, set_default_type=int)
+
     @property
     def button(self) -> ttk.Button:
         """Create the button for main application frame."""
@@ -348,19 +891,75 @@ class DiscoMainDialog(BLogClient, DiscoData, NoDynamicAttributes):
         return self._get_data(DialogKeys.BUTTON)  # type: ignore
 
     def dialog_update(self, system: db.TSystem) -> None:
-        """Update dialog."""
+        """Request dialog update.
+
+        Requests are coalesced: the system is marked dirty and the dialogs
+        are redrawn at most once per REFRESH_INTERVAL with the latest state.
+        """
+        self._set_data(
+            key=DialogKeys.REQUESTED,
+            value=self._get_data(key=DialogKeys.REQUESTED) + 1,  # type: ignore
+        )
         self.system = system
+        if system is not None:
+            self._get_data(key=DialogKeys.DIRTY)[system.id] = system  # type: ignore
+        if self._get_data(key=DialogKeys.REFRESH_ID) is not None:
+            return
+        parent: Optional[tk.Frame] = self._get_data(key=DialogKeys.PARENT)
+        if parent is None:
+            self.__refresh()
+            return
+        self._set_data(
+            key=DialogKeys.REFRESH_ID,
+            value=parent.after(self.REFRESH_INTERVAL, self.__refresh),
+        )
+
+    @property
+    def refresh_requested(self) -> int:
+        """Return number of requested redraws."""
+        return self._get_data(key=DialogKeys.REQUESTED)  # type: ignore
+
+    @property
+    def refresh_performed(self) -> int:
+        """Return number of performed redraws."""
+        return self._get_data(key=DialogKeys.PERFORMED)  # type: ignore
+
+    def __refresh(self) -> None:
+        """Redraw dialogs with the latest state of dirty systems."""
+        self._set_data(key=DialogKeys.REFRESH_ID, value=None)
+        self._set_data(
+            key=DialogKeys.PERFORMED,
+            value=self._get_data(key=DialogKeys.PERFORMED) + 1,  # type: ignore
+        )
+        dirty: Dict[int, db.TSystem] = self._get_data(key=DialogKeys.DIRTY)  # type: ignore
+        systems: List[db.TSystem] = list(dirty.values())
+        dirty.clear()
         if self.system is not None and self.system.name != "":
             self.button[DialogKeys.TEXT] = (
                 f"{self.system.name} [{self.system.progress}]"
             )
         if self.logger:
             self.logger.debug = f"UPDATE: {self._data}"
+        self.debug(
+            currentframe(),
+            f"redraws performed/requested: "
+            f"{self.refresh_performed}/{self.refresh_requested}",
+        )
 
-        # propagate update
-        for window in self._get_data(key=DialogKeys.WINDOWS):  # type:ignore
-            if not window.is_closed:
-                window.dialog_update(system)
+        # propagate update, snapshot is built once and shared by windows
+        windows: List[DiscoSystemDialog] = [
+            window
+            for window in self._get_data(key=DialogKeys.WINDOWS)  # type: ignore
+            if not window.is_closed
+        ]
+        for system in systems:
+            model: Optional[DiscoSystemModel] = None
+            for window in windows:
+                if window.model is None or window.model.id != system.id:
+                    continue
+                if model is None:
+                    model = DiscoSystemModel(system)
+                window.dialog_update(model)
 
     def __bt_callback(self) -> None:
         """Run main button callback."""
@@ -392,6 +991,11 @@ class DiscoMainDialog(BLogClient, DiscoData, NoDynamicAttributes):
 class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
     """Create new window for showing system features."""
 
+    # search results polling interval in ms
+    POLL_INTERVAL: int = 50
+    # maximum number of system name suggestions
+    COMPLETE_LIMIT: int = 10
+
     def __init__(
         self, log_queue: Union[Queue, SimpleQueue], data: Dict, master=None
     ) -> None:
@@ -416,13 +1020,22 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
         self.widgets[DialogKeys.STATUS] = None  #: Optional[tk.StringVar]
         self.widgets[DialogKeys.SYSTEM] = None  #: Optional[tk.Entry]
         self.widgets[DialogKeys.S_BUTTON] = None  #: Optional[tk.Button]
+        self.widgets[DialogKeys.S_COMPLETE] = None  #: Optional[tk.Listbox]
         self.widgets[DialogKeys.F_DATA] = None  #: Optional[tk.LabelFrame]
         self.widgets[DialogKeys.SCROLLBAR] = None  #: Optional[tk.Scrollbar]
-        self.widgets[DialogKeys.S_PANEL] = None  #: Optional[VerticalScrolledFrame]
+        self.widgets[DialogKeys.S_PANEL] = None  #: Optional[VirtualListTkFrame]
+        self.widgets[DialogKeys.SUMMARY] = None  #: Optional[tk.Frame]
         self.widgets[DialogKeys.S_MENU] = None  #: Optional[tk.Menu]
 
-        # bodies data
-        self.bodies = []
+        # shown system snapshot
+        self._set_data(key=DialogKeys.MODEL, value=None)
+
+        # background search
+        self._set_data(key=DialogKeys.SEARCH_ID, value=0, set_default_type=int)
+        self._set_data(key=DialogKeys.POLL_ID, value=None)
+        self._set_data(
+            key=DialogKeys.RESULTS, value=SimpleQueue(), set_default_type=SimpleQueue
+        )
 
         # init log subsystem
         if isinstance(log_queue, Queue):
@@ -455,20 +1068,13 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
         )  # type: ignore
 
     @property
-    def bodies(self) -> List:
-        """Return bodies list."""
-        return self._get_data(key=DialogKeys.BODIES)  # type: ignore
-
-    @bodies.setter
-    def bodies(self, value: List) -> None:
-        if self._get_data(key=DialogKeys.BODIES):
-            # freeing last object list
-            self._clear_data(key=DialogKeys.BODIES)
-        self._set_data(
-            key=DialogKeys.BODIES,
-            value=value,
-            set_default_type=List,
-        )
+    def model(self) -> Optional[DiscoSystemModel]:
+        """Return snapshot of the shown system."""
+        return self._get_data(key=DialogKeys.MODEL)  # type: ignore
+
+    @model.setter
+    def model(self, value: Optional[DiscoSystemModel]) -> None:
+        self._set_data(key=DialogKeys.MODEL, value=value)
 
     def __build_frame(self) -> None:
         """Create window."""
@@ -529,17 +1135,27 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
         system_name = tk.Entry(command_frame, textvariable=tk.StringVar(value=""))
         system_name.grid(row=0, column=1, sticky=tk.EW)
         system_name.bind("<Return>", self.__search_cb)
+        system_name.bind("<KeyRelease>", self.__complete_cb)
+        system_name.bind("<Down>", self.__complete_focus)
+        system_name.bind("<Escape>", self.__complete_hide)
         if self.system is not None:
             system_name.delete(0, tk.END)
             system_name.insert(0, self.system.name)
         system_name.focus_set()
         self.widgets[DialogKeys.SYSTEM] = system_name
 
-        button_search_img = tk.PhotoImage(data=Pics.SEARCH_16)
+        # system name suggestions, placed under the entry when needed
+        complete = tk.Listbox(self, exportselection=False)
+        complete.bind("<Return>", self.__complete_select)
+        complete.bind("<Double-Button-1>", self.__complete_select)
+        complete.bind("<Escape>", self.__complete_hide)
+        self.widgets[DialogKeys.S_COMPLETE] = complete
+
         button_search = tk.Button(
-            command_frame, image=button_search_img, command=self.__search_cb
+            command_frame,
+            image=ImageHelper.get_photo(command_frame, Pics.SEARCH_16),
+            command=self.__search_cb,
         )
-        button_search.image = button_search_img  # type: ignore
         button_search.grid(row=0, column=2, sticky=tk.E, padx=5)
         CreateToolTip(button_search, "Find system.")
         self.widgets[DialogKeys.S_BUTTON] = button_search
@@ -551,9 +1167,15 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
         )
         self.widgets[DialogKeys.F_DATA] = data_frame
 
-        # create scrolled panel
-        s_panel = VerticalScrolledTkFrame(data_frame)
-        s_panel.pack(ipadx=1, ipady=1, fill=tk.BOTH, expand=tk.TRUE)
+        # create system summary panel
+        summary = tk.Frame(data_frame, borderwidth=1, relief=tk.GROOVE)
+        self.widgets[DialogKeys.SUMMARY] = summary
+
+        # create virtualised bodies list
+        s_panel = VirtualListTkFrame(
+            data_frame, factory=DiscoBodyRow, render=self.__render_row
+        )
+        s_panel.pack(side=tk.BOTTOM, ipadx=1, ipady=1, fill=tk.BOTH, expand=tk.TRUE)
         self.widgets[DialogKeys.S_PANEL] = s_panel
 
         # create status panel
@@ -570,10 +1192,79 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
         """Run on closing event."""
         self.debug(currentframe(), "Window is closing now.")
         self._set_data(key=DialogKeys.CLOSED, value=True)
+        # cancel running search
+        self.__next_search_id()
+        if self._get_data(key=DialogKeys.POLL_ID) is not None:
+            self.after_cancel(self._get_data(key=DialogKeys.POLL_ID))  # type: ignore
+            self._set_data(key=DialogKeys.POLL_ID, value=None)
         self.destroy()
 
+    def __complete_cb(self, event=None) -> None:
+        """Update system name suggestions after key release."""
+        if event is not None and event.keysym in (
+            "Return",
+            "KP_Enter",
+            "Escape",
+            "Down",
+            "Up",
+            "Tab",
+        ):
+            return
+        prefix: str = self.widgets[DialogKeys.SYSTEM].get()
+        if not prefix or not self.db_processor:
+            self.__complete_hide()
+            return
+        names: List[str] = self.db_processor.system_names.complete(
+            prefix, self.COMPLETE_LIMIT
+        )
+        if not names or names == [prefix]:
+            self.__complete_hide()
+            return
+        complete: tk.Listbox = self.widgets[DialogKeys.S_COMPLETE]
+        complete.delete(0, tk.END)
+        complete.insert(tk.END, *names)
+        complete.configure(height=len(names))
+        complete.place(
+            in_=self.widgets[DialogKeys.SYSTEM],
+            x=0,
+            rely=1.0,
+            relwidth=1.0,
+            bordermode=tk.OUTSIDE,
+        )
+        complete.lift()
+
+    def __complete_focus(self, event=None) -> Optional[str]:
+        """Move focus from entry to the suggestions list."""
+        complete: tk.Listbox = self.widgets[DialogKeys.S_COMPLETE]
+        if not complete.winfo_ismapped():
+            return None
+        complete.focus_set()
+        complete.selection_clear(0, tk.END)
+        complete.selection_set(0)
+        complete.activate(0)
+        return "break"
+
+    def __complete_hide(self, event=None) -> None:
+        """Hide system name suggestions."""
+        complete: Optional[tk.Listbox] = self.widgets[DialogKeys.S_COMPLETE]
+        if complete is not None:
+            complete.place_forget()
+
+    def __complete_select(self, event=None) -> None:
+        """Put selected suggestion in the entry and search it."""
+        complete: tk.Listbox = self.widgets[DialogKeys.S_COMPLETE]
+        selection = complete.curselection()
+        if not selection:
+            return
+        system_name: tk.Entry = self.widgets[DialogKeys.SYSTEM]
+        system_name.delete(0, tk.END)
+        system_name.insert(0, complete.get(selection[0]))
+        system_name.focus_set()
+        self.__search_cb()
+
     def __search_cb(self, event=None) -> None:
         """Search system button callback."""
+        self.__complete_hide()
         self.status = ""
         system = self.widgets[DialogKeys.SYSTEM].get()
 
@@ -581,19 +1272,93 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
             self.status = "System name must be set for processing request."
             return
 
-        # search database
-        t_system: Optional[db.TSystem] = self.db_processor.get_system_by_name(system)
-        if t_system is None:
-            self.status = f"System '{system}' not found in local database."
+        session: Optional[Session] = (
+            self.db_processor.new_session() if self.db_processor else None
+        )
+        if session is None:
+            self.status = "Local database is not available."
             return
-        if self.logger:
-            self.logger.debug = f"System found: {t_system}"
-            self.logger.debug = f"SystemName: {t_system.name}"
-            self.logger.debug = f"Bodies count: {t_system.bodycount}"
 
-        # show system
-        self.__system_show(t_system)
-        # self.logger.debug = f"After Show: {self._data}"
+        # search database in background, superseded search is cancelled
+        search_id: int = self.__next_search_id()
+        self.status = f"Searching for '{system}'..."
+        Thread(
+            target=self.__search_worker,
+            args=(search_id, system, session),
+            name=f"{self.plugin_name} search worker",
+            daemon=True,
+        ).start()
+        if self._get_data(key=DialogKeys.POLL_ID) is None:
+            self.__search_poll()
+
+    def __next_search_id(self) -> int:
+        """Start new search, running one becomes superseded."""
+        search_id: int = self._get_data(key=DialogKeys.SEARCH_ID) + 1  # type: ignore
+        self._set_data(key=DialogKeys.SEARCH_ID, value=search_id)
+        return search_id
+
+    def __search_worker(self, search_id: int, system: str, session: Session) -> None:
+        """Search system and build its snapshot in worker thread.
+
+        Results are passed to the Tk thread with the results queue as
+        (search_id, done, status message, snapshot) tuples.
+        """
+        results: SimpleQueue = self._get_data(key=DialogKeys.RESULTS)  # type: ignore
+
+        def progress(done: int, count: int) -> None:
+            if self._get_data(key=DialogKeys.SEARCH_ID) != search_id:
+                raise _SearchCancelled()
+            if done % 10 == 0 or done == count:
+                results.put(
+                    (search_id, False, f"Loading '{system}': {done}/{count}", None)
+                )
+
+        try:
+            t_system: Optional[db.TSystem] = self.db_processor.get_system_by_name(
+                system, session
+            )
+            if t_system is None:
+                results.put(
+                    (
+                        search_id,
+                        True,
+                        f"System '{system}' not found in local database.",
+                        None,
+                    )
+                )
+                return
+            self.debug(
+                currentframe(),
+                f"System found: {t_system.name}, bodies: {t_system.bodycount}",
+            )
+            results.put((search_id, True, "", DiscoSystemModel(t_system, progress)))
+        except _SearchCancelled:
+            self.debug(currentframe(), f"Search for '{system}' cancelled")
+        except Exception as ex:
+            results.put((search_id, True, f"Search error: {ex}", None))
+        finally:
+            session.close()
+
+    def __search_poll(self) -> None:
+        """Take over search results in Tk thread."""
+        self._set_data(key=DialogKeys.POLL_ID, value=None)
+        search_id: int = self._get_data(key=DialogKeys.SEARCH_ID)  # type: ignore
+        results: SimpleQueue = self._get_data(key=DialogKeys.RESULTS)  # type: ignore
+        finished: bool = False
+        while not results.empty():
+            r_id, done, message, model = results.get()
+            if r_id != search_id:
+                continue
+            self.status = message
+            if done:
+                finished = True
+                if model is not None:
+                    self.__system_show(model)
+        if not finished:
+            self._set_data(
+                key=DialogKeys.POLL_ID,
+                value=self.after(self.POLL_INTERVAL, self.__search_poll),
+            )
 
     def __search_bio_cb(self, event=None) -> None:
         """Search system button callback."""
@@ -601,324 +1366,62 @@ class DiscoSystemDialog(tk.Toplevel, TkBase, DiscoData, BLogClient):
     def __search_unx_bio_cb(self, event=None) -> None:
         """Search system button callback."""
 
-    def __system_show(self, system: db.TSystem) -> None:
-        """Show system in frame."""
-        # destroy previous data
-        self.system = system
-        self.__clear_rows()
-        self.__system_summary(system)
-        count = 0
-        for body in sorted(system.bodies, key=lambda x: x.bodyid):
-            if self.logger:
-                self.logger.debug = f"[{count}]: name '{body.name}', bodyid={body.bodyid}, parentid={body.parentid}"
-            count += 1
-        count = 0
-        for body in self.__sort_bodies(system):
-            if body:
-                if self.logger:
-                    self.logger.debug = f"[{count}]: name '{body.name}', bodyid={body.bodyid}, parentid={body.parentid}"
-                if not body.name:
-                    if self.logger:
-                        self.logger.debug = f"Error in TBody: {body}"
-            else:
-                if self.logger:
-                    self.logger.debug = f"[{count}]: None"
-            # add to form
-            self.__build_row_frame(count, body)
-            count += 1
-
-    def __body_summary(self, body: db.TBody) -> List[str]:
-        """Create body info string for tooltip."""
-        tmp = []
-        features: db.TBodyFeatures = body.features
-        # star
-        if features.star_type:
-            tmp.append(
-                f"Spectral class: {features.star_type or ''}{features.subclass or ''} {features.luminosity or ''}"
-            )
-            tmp.append(f"Solar masses: {features.stellarmass:.3f}")
-            if features.radius:
-                tmp.append(f"Solar radius: {int(features.radius)}")
-            if features.surfacetemperature:
-                tmp.append(
-                    f"Surface temperature: {int(features.surfacetemperature or '??')} K"
-                )
-        # planet
-        if features.body_type and features.body_type == "Planet":
-            tmp.append(f"Planet class: {features.planet_class}")
-            if features.surfacegravity:
-                tmp.append(f"Gravity: {features.surfacegravity:.3f}")
-            if features.massem:
-                tmp.append(f"Earth mass: {features.massem:.3f}")
-            if features.radius:
-                tmp.append(f"Radius: {int(features.radius)}")
-            if features.surfacetemperature:
-                tmp.append(
-                    f"Surface temp.: {int(features.surfacetemperature) or '??'} K"
-                )
-            if features.surfacepressure:
-                tmp.append(f"Surface press.: {int(features.surfacepressure / 100)} hPa")
-            if features.volcanism:
-                tmp.append(f"Volcanism: {features.volcanism}")
-            tmp.append(f"Atmosfere: {features.atmosfere or features.atmosferetype}")
-            if features.terraformstate:
-                tmp.append(f"Terraforming: {features.terraformstate}")
-
-        return tmp
+    def __system_show(self, model: DiscoSystemModel) -> None:
+        """Show system snapshot in frame."""
+        # patch rows which render model changed
+        old: Optional[DiscoSystemModel] = self.model
+        new_system: bool = old is None or old.id != model.id
+        self.model = model
+        self.__system_summary(model)
+        changed: List[int] = [
+            idx
+            for idx, row in enumerate(model.rows)
+            if new_system or idx >= len(old.rows) or old.rows[idx] != row  # type: ignore
+        ]
+        self.debug(currentframe(), f"changed rows: {len(changed)}/{len(model.rows)}")
+        s_panel: VirtualListTkFrame = self.widgets[DialogKeys.S_PANEL]
+        s_panel.count = len(model.rows)
+        if new_system:
+            s_panel.reset()
+        else:
+            s_panel.refresh(changed)
 
-    def __system_summary(self, system: db.TSystem) -> None:
+    def __system_summary(self, model: DiscoSystemModel) -> None:
         """Create system info."""
-        list_object = [-1, None]
-        dt_object: datetime = datetime.fromtimestamp(system.timestamp)
-
         # frame
-        frame = tk.Frame(
-            self.widgets[DialogKeys.S_PANEL].interior,
-            borderwidth=1,
-            relief=tk.GROOVE,
-        )
-        frame.pack(fill=tk.X)
-        list_object.append(frame)
-        features: db.TSystemFeatures = system.features
-
-        # grid configure
-        for i in range(3):
-            frame.columnconfigure(i)
-            for j in range(2):
-                frame.rowconfigure(j)
-
-        # create info
-        cell: Dict[str, Any] = {
-            "ipadx": 10,
-            "sticky": tk.W,
-        }
-        tk.Label(frame, text=f"Security: {features.security}").grid(
-            column=0, row=0, **cell
-        )
-        tk.Label(
-            frame,
-            text=f"Allegiance: {features.allegiance or 'None'}",
-        ).grid(column=1, row=0, **cell)
-        tk.Label(frame, text=f"Population: {features.population}").grid(
-            column=2, row=0, **cell
-        )
-        tk.Label(frame, text=f"Body count: {system.bodycount}").grid(
-            column=0, row=1, **cell
-        )
-        tk.Label(
-            frame,
-            text=f"Discovered: {system.scanned_body_count}",
-        ).grid(column=1, row=1, **cell)
-        tk.Label(frame, text=f"Last update: {dt_object}").grid(column=2, row=1, **cell)
-
-        # finish
-        self.bodies.append(list_object)
-
-    def __sort_bodies(self, system: db.TSystem) -> List[db.TBody]:
-        """Return sorted db.Bodies List."""
-        bodies = []
-        # find max bodyid
-        bid = 0
-        for body in system.bodies:
-            if bid < body.bodyid:
-                bid = body.bodyid
-        # generate null table
-        i = 0
-        while i in range(bid + 1):
-            bodies.append(None)
-            i += 1
-        # fill in the table
-        for body in system.bodies:
-            bodies[body.bodyid] = body
-            if bodies[body.parentid] is None:
-                bodies[body.parentid] = ""
-        # copy output table
-        out = []
-        for body in bodies:
-            if body is not None:
-                if not isinstance(body, str):
-                    features: db.TBodyFeatures = body.features
-                    if features.body_type and features.body_type == "Null":
-                        continue
-                out.append(body)
-        return out
-        # return sorted(out, key=lambda x: x.features.distance)
-
-    def __clear_rows(self) -> None:
-        """Destroy previous data."""
-        for item in self.bodies:
-            item[2].pack_forget()
-            item[2].destroy()
-        self.bodies = []
-
-    def __build_row_frame(self, count: int, body: db.TBody) -> None:
-        """Build Frame row for search dialog."""
-        list_object = []
-        ih = ImageHelper()
-
-        # color = 0xD9D9D9
-        # color1: str = hex(color - 20).replace("0x", "#")
-        # color2: str = hex(color + 20).replace("0x", "#")
-
-        # [0] count
-        list_object.append(count)
-
-        # [1] body
-        list_object.append(body)
-
-        # [2] frame
-        frame = tk.Frame(
-            self.widgets[DialogKeys.S_PANEL].interior,
-            # background=color1 if count % 2 else color2,
-            relief=tk.GROOVE,
-            borderwidth=1,
-        )
-
-        frame.pack(fill=tk.X)
-        list_object.append(frame)
-
-        # create labels
-        lname = None
-        if body:
-            name = f"??? id: {body.bodyid}"
-            if body.name:
-                name = body.name
-                signals: db.TBodySignals = body.signals
-                features: db.TBodyFeatures = body.features
-                if not features.star_type and self.system:
-                    name: str = name.replace(self.system.name, "").strip()
-                # get scoopable
-                if features.star_type and features.star_type in (
-                    "O",
-                    "B",
-                    "A",
-                    "F",
-                    "G",
-                    "K",
-                    "M",
-                ):
-                    img = tk.PhotoImage(data=ih.get_scoopable_image())
-                    scoop = tk.Label(frame, image=img)
-                    scoop.image = img  # type: ignore
-                    scoop.pack(side=tk.RIGHT)
-                    CreateToolTip(scoop, "Scoopable")
-                # get distance to arrival
-                if features.distance:
-                    img = tk.PhotoImage(data=ih.get_distance_image())
-                    distance = tk.Label(
-                        frame,
-                        text=f"{int(features.distance)} ls",  # type: ignore
-                        compound=tk.LEFT,
-                        image=img,
-                    )
-                    distance.image = img  # type: ignore
-                    distance.pack(side=tk.RIGHT)
-                    CreateToolTip(distance, "Distance to arrival")
-                # get landable flag
-                if features.landable:
-                    # get temperature
-                    img2 = tk.PhotoImage(data=ih.get_thermometer_image())
-                    temp = tk.Label(
-                        frame,
-                        text=f"{int(features.surfacetemperature)}K",  # type: ignore
-                        compound=tk.LEFT,
-                        image=img2,
-                    )
-                    temp.image = img2  # type: ignore
-                    temp.pack(side=tk.RIGHT)
-                    CreateToolTip(temp, "Surface temperature")
-                    img = tk.PhotoImage(data=ih.get_landable_image())
-                    landable = tk.Label(frame, image=img)
-                    landable.image = img  # type: ignore
-                    landable.pack(side=tk.RIGHT)
-                    CreateToolTip(landable, "Planetary Landing")
-                # get terraformstate state
-                if features.terraformstate:
-                    img = tk.PhotoImage(data=ih.get_terraform_image())
-                    terraform = tk.Label(frame, image=img)
-                    terraform.image = img  # type: ignore
-                    terraform.pack(side=tk.RIGHT)
-                    CreateToolTip(
-                        terraform, f"Terraform state: {features.terraformstate}"
-                    )
-                # get human signals
-                if signals.count_humans_signals > 0:
-                    img = tk.PhotoImage(data=ih.get_human_image())
-                    humans = tk.Label(
-                        frame,
-                        text=f"{signals.count_humans_signals}",
-                        compound=tk.LEFT,
-                        image=img,
-                    )
-                    humans.image = img  # type: ignore
-                    humans.pack(side=tk.RIGHT)
-                    CreateToolTip(humans, "Human signals")
-                # get biological signals count
-                if signals.count_bio_signals > 0:
-                    img = tk.PhotoImage(data=ih.get_bio_image(body))
-                    count_bio = tk.Label(
-                        frame,
-                        text=f"{signals.count_bio_signals }",
-                        compound=tk.LEFT,
-                        image=img,
-                    )
-                    count_bio.image = img  # type: ignore
-                    count_bio.pack(side=tk.RIGHT)
-                    CreateToolTip(count_bio, ih.get_bio_description(body))
-                # get geological signals count
-                if signals.count_geo_signals > 0:
-                    img = tk.PhotoImage(data=ih.get_geo_image(body))
-                    count_geo = tk.Label(
-                        frame,
-                        text=f"{signals.count_geo_signals}",
-                        compound=tk.LEFT,
-                        image=img,
-                    )
-                    count_geo.image = img  # type: ignore
-                    count_geo.pack(side=tk.RIGHT)
-                    CreateToolTip(count_geo, ih.get_geo_description(body))
-                # first mapped
-                if features.mapped_first:
-                    img = tk.PhotoImage(data=ih.get_map_image())
-                    mape = tk.Label(frame, image=img)
-                    mape.image = img  # type: ignore
-                    mape.pack(side=tk.RIGHT)
-                    CreateToolTip(mape, "First mapped")
-                # first discovered
-                if features.discovered_first:
-                    img = tk.PhotoImage(data=ih.get_first_image())
-                    first = tk.Label(frame, image=img)
-                    first.image = img  # type: ignore
-                    first.pack(side=tk.RIGHT)
-                    CreateToolTip(first, "First discovered")
-            elif not body.name:
-                features: db.TBodyFeatures = body.features
-                if features.body_type and features.body_type == EDKeys.RING:
-                    name = EDKeys.RING
-            img_byte: Optional[bytes] = ih.get_body_image(body)
-            if img_byte:
-                img = tk.PhotoImage(data=img_byte)
-                lname = tk.Label(frame, text=f"{name}", compound=tk.LEFT, image=img)
-                lname.image = img  # type: ignore
-            else:
-                lname = tk.Label(frame, text=f"{name}")
-            # generate body summaries tooltip
-            desc: List[str] = self.__body_summary(body)
-            if desc:
-                CreateToolTip(lname, desc)
+        frame: tk.Frame = self.widgets[DialogKeys.SUMMARY]
+
+        # create info labels at first use, then update texts only
+        if not frame.winfo_children():
+            frame.pack(side=tk.TOP, fill=tk.X)
+            # grid configure
+            for i in range(3):
+                frame.columnconfigure(i)
+                for j in range(2):
+                    frame.rowconfigure(j)
+            cell: Dict[str, Any] = {
+                "ipadx": 10,
+                "sticky": tk.W,
+            }
+            for idx in range(len(model.summary)):
+                tk.Label(frame).grid(column=idx % 3, row=idx // 3, **cell)
+        for label, text in zip(frame.winfo_children(), model.summary):
+            if label.cget("text") != text:
+                label.configure(text=text)
+
+    def __render_row(self, row: DiscoBodyRow, count: int) -> None:
+        """Render body model from the list in the recycled row widget."""
+        if self.model is not None and count < len(self.model.rows):
+            row.show(self.model.rows[count])
         else:
-            lname = tk.Label(frame, text="???")
-        lname.pack(side=tk.LEFT)
-
-        # finish
-        self.bodies.append(list_object)
+            row.show(DiscoRowModel(("???", None, "")))
 
-    def dialog_update(self, system: Optional[db.TSystem]) -> None:
-        """Update dialog."""
-        if self.system is None or system is None:
+    def dialog_update(self, model: Optional[DiscoSystemModel]) -> None:
+        """Update dialog with the shared snapshot of the changed system."""
+        if self.model is None or model is None:
             return
-        if self.system.id == system.id:
-            self.__system_show(system)
+        if self.model.id == model.id and self.model is not model:
+            self.__system_show(model)
 
     @property
     def is_closed(self) -> bool:
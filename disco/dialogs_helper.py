@@ -17,13 +17,23 @@ class DialogKeys(object, metaclass=ReadOnlyClass):
     BUTTON: str = "_button_"
     CLOSED: str = "_closed_"
     DATA: str = "__r_data__"
+    DIRTY: str = "_dirty_"
     F_DATA: str = "_f_data_"
     ID: str = "_id_"
+    MODEL: str = "_model_"
     PARENT: str = "_parent_"
+    PERFORMED: str = "_performed_"
+    POLL_ID: str = "_poll_id_"
+    REFRESH_ID: str = "_refresh_id_"
+    REQUESTED: str = "_requested_"
+    RESULTS: str = "_results_"
+    SEARCH_ID: str = "_search_id_"
     SCROLLBAR: str = "_scrollbar_"
+    S_COMPLETE: str = "_s_complete_"
     STARS: str = "__stars__"
     START: str = "__start__"
     STATUS: str = "_status_"
+    SUMMARY: str = "_summary_"
     SYSTEM: str = "_system_"
     S_BUTTON: str = "_s_button_"
     S_MENU: str = "_s_menu_"
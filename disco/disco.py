@@ -6,18 +6,30 @@
   Purpose: main class
 """
 
-from threading import Thread
+from collections import deque
+from threading import Event, Thread
 from queue import Queue
+from typing import Deque, Dict, Optional
 
 from disco.jsktoolbox.edmctool.base import BLogClient, BLogProcessor
 from disco.jsktoolbox.edmctool.logs import LogClient, LogProcessor
 
 from disco.data import DiscoData
-from disco.database import Database, DBProcessor
 
 
 class Disco(BLogProcessor, BLogClient):
-    """Main class."""
+    """Main class.
+
+    The database is opened by start_database in a worker thread, journal
+    events received before it is ready are kept in the events buffer, up
+    to EVENTS_LIMIT latest ones. Only missing body sort keys are filled
+    before the database is ready, boost tags and system neighbours are
+    updated afterwards and db_updated is set when it is done. If the
+    database cannot be opened, db_failed is set.
+    """
+
+    # maximum number of journal events buffered until the database is ready
+    EVENTS_LIMIT: int = 10000
 
     def __init__(self) -> None:
         """Constructor."""
@@ -26,7 +38,14 @@ class Disco(BLogProcessor, BLogClient):
         self.data.version = "1.1.3-dev"
 
         # database
-        self.data.db_processor = DBProcessor(Database(False).session)
+        self._set_data(key="db_ready", value=Event(), set_default_type=Event)
+        self._set_data(key="db_failed", value=Event(), set_default_type=Event)
+        self._set_data(key="db_updated", value=Event(), set_default_type=Event)
+        self._set_data(
+            key="events",
+            value=deque(maxlen=self.EVENTS_LIMIT),
+            set_default_type=deque,
+        )
 
         # logging subsystem
         self.qlog = Queue()
@@ -57,6 +76,89 @@ class Disco(BLogProcessor, BLogClient):
         """Set data access."""
         self._set_data(key="disco", value=value, set_default_type=DiscoData)
 
+    @property
+    def db_ready(self) -> bool:
+        """Check, if database is opened."""
+        return self._get_data(key="db_ready").is_set()  # type: ignore
+
+    @property
+    def db_failed(self) -> bool:
+        """Check, if database worker failed to open database."""
+        return self._get_data(key="db_failed").is_set()  # type: ignore
+
+    @property
+    def db_busy(self) -> bool:
+        """Check, if database worker thread is running."""
+        th_db: Optional[Thread] = self._get_data(key="th_db", default_value=None)
+        return th_db is not None and th_db.is_alive()
+
+    @property
+    def db_updated(self) -> bool:
+        """Check, if system neighbours are rebuilt for the current range."""
+        return self._get_data(key="db_updated").is_set()  # type: ignore
+
+    @property
+    def events(self) -> Deque[Dict]:
+        """Return journal events waiting for the database."""
+        return self._get_data(key="events")  # type: ignore
+
+    def start_database(self, neighbour_range: float = 0.0) -> None:
+        """Open database in the worker thread.
+
+        neighbour_range: range in ly the system neighbours were built for
+        """
+        if self._get_data(key="th_db", default_value=None) is not None:
+            return
+        th_db = Thread(
+            target=self.th_database,
+            args=(neighbour_range,),
+            name=f"{self.data.plugin_name} database worker",
+        )
+        th_db.daemon = True
+        self._set_data(key="th_db", value=th_db, set_default_type=Thread)
+        th_db.start()
+
+    def th_database(self, neighbour_range: float) -> None:
+        """Def th_database - thread opens database and updates its content."""
+        try:
+            # SQLAlchemy and database models are imported here, not with plugin
+            from disco.database import Database, DBProcessor
+
+            database = Database(False)
+            processor = DBProcessor(database.session)
+            # bodies are listed by sort keys, other updates can wait
+            processor.update_sort_keys()
+            if self.data.jump_range:
+                processor.neighbour_range = self.data.jump_range
+            self.data.db_processor = processor
+            self._get_data(key="db_ready").set()  # type: ignore
+            if self.logger:
+                self.logger.debug = f"{self.data.plugin_name} database is ready."
+        except Exception as ex:
+            self._get_data(key="db_failed").set()  # type: ignore
+            if self.logger:
+                self.logger.error = f"{self.data.plugin_name} database error: {ex}"
+            return
+        # the processor is used by the main thread now, use own session
+        maintenance = DBProcessor(database.session)
+        maintenance.neighbour_range = processor.neighbour_range
+        try:
+            boosts: int = maintenance.update_boosts()
+            count: int = maintenance.update_neighbours(neighbour_range)
+            self._get_data(key="db_updated").set()  # type: ignore
+            if self.logger:
+                self.logger.debug = (
+                    f"{self.data.plugin_name} database updated, "
+                    f"boosts: {boosts}, neighbours: {count}"
+                )
+        except Exception as ex:
+            if self.logger:
+                self.logger.error = (
+                    f"{self.data.plugin_name} database update error: {ex}"
+                )
+        finally:
+            maintenance.close()
+
     def th_logger(self) -> None:
         """Def th_logger - thread logs processor."""
         if self.logger:
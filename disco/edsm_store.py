@@ -0,0 +1,310 @@
+# -*- coding: UTF-8 -*-
+"""
+  Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+  Created: 19.10.2026
+
+  Purpose: local store of systems imported from EDSM nightly dumps.
+"""
+
+import gzip
+import json
+import math
+import os
+import time
+
+from inspect import currentframe
+from typing import Optional, List, Dict, Callable, Iterator, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.orm import Session
+
+from disco.jsktoolbox.basetool.classes import BClasses
+from disco.jsktoolbox.raisetool import Raise
+from disco.jsktoolbox.edmctool.edsm_keys import EdsmKeys
+from disco.jsktoolbox.edmctool.stars import StarsSystem
+
+import disco.db_models as db
+
+
+class ImportStats(BClasses):
+    """Progress and throughput of the dump import."""
+
+    __records: int = 0
+    __bytes: int = 0
+    __skipped: int = 0
+    __start: float = 0.0
+
+    def __init__(self) -> None:
+        """Create stats object."""
+        self.__start = time.perf_counter()
+
+    def add(self, records: int, size: int, skipped: int = 0) -> None:
+        """Register processed records and uncompressed bytes."""
+        self.__records += records
+        self.__bytes += size
+        self.__skipped += skipped
+
+    @property
+    def records(self) -> int:
+        """Return number of imported records."""
+        return self.__records
+
+    @property
+    def skipped(self) -> int:
+        """Return number of malformed records."""
+        return self.__skipped
+
+    @property
+    def elapsed(self) -> float:
+        """Return import time in seconds."""
+        return time.perf_counter() - self.__start
+
+    @property
+    def records_per_second(self) -> float:
+        """Return import throughput in records per second."""
+        return self.__records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Return import throughput in MB of uncompressed data per second."""
+        return self.__bytes / 1048576 / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        """Return stats string."""
+        return (
+            f"{self.records} records, {self.skipped} skipped, "
+            f"{self.records_per_second:.0f} rec/s, "
+            f"{self.megabytes_per_second:.2f} MB/s"
+        )
+
+
+class EdsmStore(BClasses):
+    """Local store of systems from EDSM 'systemsWithCoordinates' dumps.
+
+    Dumps are read line by line from the gzip stream, so memory use does
+    not depend on the dump size, and written in batches to the
+    'edsm_systems' table. Every row gets the key of the grid cell it lies
+    in, and radius searches read only the indexed cells covering the
+    search box. Progress is saved with every batch, so an interrupted
+    import continues where it stopped.
+    """
+
+    # grid cell edge in ly and bits per packed cell coordinate
+    CELL_SIZE: float = 100.0
+    CELL_BITS: int = 12
+    # above this number of cells searches use the bounding box only
+    MAX_CELLS: int = 512
+
+    __engine: Engine = None  # type: ignore
+
+    def __init__(self, engine: Engine) -> None:
+        """Create store, create tables if needed.
+
+        params:
+        engine: Engine - database engine
+        """
+        if not isinstance(engine, Engine):
+            raise Raise.error(
+                f"Engine type expected, '{type(engine)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__engine = engine
+        db.EdsmBase.metadata.create_all(engine)
+
+    @staticmethod
+    def cell_index(value: float) -> int:
+        """Return grid cell index of the coordinate."""
+        return math.floor(value / EdsmStore.CELL_SIZE)
+
+    @staticmethod
+    def cell_key(i_x: int, i_y: int, i_z: int) -> int:
+        """Return packed key of the grid cell with given indexes."""
+        bits: int = EdsmStore.CELL_BITS
+        offset: int = 1 << (bits - 1)
+        return (
+            ((i_x + offset) << (2 * bits)) | ((i_y + offset) << bits) | (i_z + offset)
+        )
+
+    @staticmethod
+    def __records(
+        stream: gzip.GzipFile, stats: ImportStats
+    ) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Yield (offset after line, record) for every line of the dump.
+
+        Record is None for lines without system data.
+        """
+        offset: int = stream.tell()
+        for line in stream:
+            offset += len(line)
+            text: str = line.strip().rstrip(b",").decode("utf-8")
+            if not text or text in ("[", "]"):
+                yield offset, None
+                continue
+            try:
+                yield offset, json.loads(text)
+            except ValueError:
+                stats.add(0, 0, 1)
+                yield offset, None
+
+    def load(
+        self,
+        path: str,
+        batch: int = 10000,
+        resume: bool = True,
+        progress: Optional[Callable[[ImportStats], None]] = None,
+    ) -> ImportStats:
+        """Import gzip compressed dump file.
+
+        params:
+        path: str - path to the dump file
+        batch: int - number of records written in one transaction
+        resume: bool - continue previous import of the same file
+        progress: Optional[Callable] - called with stats after each batch
+        """
+        stats = ImportStats()
+        key: str = os.path.abspath(path)
+        f_stat = os.stat(path)
+        with Session(self.__engine) as session:
+            state: Optional[db.TEdsmImport] = session.get(db.TEdsmImport, key)
+            if (
+                state is None
+                or not resume
+                or state.size != f_stat.st_size
+                or state.mtime != f_stat.st_mtime
+            ):
+                if state is None:
+                    state = db.TEdsmImport()
+                    state.path = key
+                    session.add(state)
+                state.size = f_stat.st_size
+                state.mtime = f_stat.st_mtime
+                state.offset = 0
+                state.records = 0
+                state.done = False
+                session.commit()
+            if state.done:
+                return stats
+
+            with gzip.open(path, "rb") as stream:
+                stream.seek(state.offset)  # type: ignore
+                rows: List[Dict] = []
+                size: int = 0
+                last: int = state.offset
+                for offset, record in self.__records(stream, stats):  # type: ignore
+                    size += offset - last
+                    last = offset
+                    row: Optional[Dict] = self.__row(record)
+                    if row is not None:
+                        rows.append(row)
+                    if len(rows) >= batch:
+                        self.__flush(session, state, rows, offset, size, stats)
+                        rows, size = [], 0
+                        if progress is not None:
+                            progress(stats)
+                self.__flush(session, state, rows, last, size, stats)
+                state.done = True
+                session.commit()
+                if progress is not None:
+                    progress(stats)
+        return stats
+
+    @staticmethod
+    def __row(record: Optional[Dict]) -> Optional[Dict]:
+        """Return table row for the dump record or None."""
+        if not record or EdsmKeys.ID64 not in record:
+            return None
+        coords: Optional[Dict] = record.get(EdsmKeys.COORDS)
+        if not coords:
+            return None
+        x: float = coords[EdsmKeys.X]
+        y: float = coords[EdsmKeys.Y]
+        z: float = coords[EdsmKeys.Z]
+        return {
+            "systemaddress": record[EdsmKeys.ID64],
+            "name": record.get(EdsmKeys.NAME, ""),
+            "pos_x": x,
+            "pos_y": y,
+            "pos_z": z,
+            "cell": EdsmStore.cell_key(
+                EdsmStore.cell_index(x),
+                EdsmStore.cell_index(y),
+                EdsmStore.cell_index(z),
+            ),
+        }
+
+    @staticmethod
+    def __flush(
+        session: Session,
+        state: db.TEdsmImport,
+        rows: List[Dict],
+        offset: int,
+        size: int,
+        stats: ImportStats,
+    ) -> None:
+        """Write batch of rows and save progress in one transaction."""
+        if rows:
+            session.execute(insert(db.TEdsmSystem).prefix_with("OR REPLACE"), rows)
+        state.offset = offset
+        state.records += len(rows)
+        session.commit()
+        stats.add(len(rows), size)
+
+    def find(self, star_pos: List[float], radius: float) -> List[StarsSystem]:
+        """Return imported systems within radius sorted by distance.
+
+        Distance is stored in data[EdsmKeys.DISTANCE].
+        """
+        x, y, z = star_pos
+        ranges: List[range] = [
+            range(self.cell_index(value - radius), self.cell_index(value + radius) + 1)
+            for value in (x, y, z)
+        ]
+        out: List[Tuple[float, StarsSystem]] = []
+        with Session(self.__engine) as session:
+            query = session.query(db.TEdsmSystem).filter(
+                db.TEdsmSystem.pos_x.between(x - radius, x + radius),
+                db.TEdsmSystem.pos_y.between(y - radius, y + radius),
+                db.TEdsmSystem.pos_z.between(z - radius, z + radius),
+            )
+            if len(ranges[0]) * len(ranges[1]) * len(ranges[2]) <= self.MAX_CELLS:
+                query = query.filter(
+                    db.TEdsmSystem.cell.in_(
+                        [
+                            self.cell_key(i_x, i_y, i_z)
+                            for i_x in ranges[0]
+                            for i_y in ranges[1]
+                            for i_z in ranges[2]
+                        ]
+                    )
+                )
+            for item in query:
+                distance: float = (
+                    (item.pos_x - x) ** 2
+                    + (item.pos_y - y) ** 2
+                    + (item.pos_z - z) ** 2
+                ) ** 0.5
+                if distance > radius:
+                    continue
+                system = StarsSystem(
+                    item.name, item.systemaddress, [item.pos_x, item.pos_y, item.pos_z]
+                )
+                system.data[EdsmKeys.DISTANCE] = distance
+                out.append((distance, system))
+        out.sort(key=lambda item: item[0])
+        return [system for _, system in out]
+
+    def get(self, system_address: int) -> Optional[StarsSystem]:
+        """Return imported system by SystemAddress."""
+        with Session(self.__engine) as session:
+            item: Optional[db.TEdsmSystem] = session.get(db.TEdsmSystem, system_address)
+            if item is None:
+                return None
+            return StarsSystem(
+                item.name, item.systemaddress, [item.pos_x, item.pos_y, item.pos_z]
+            )
+
+
+# #[EOF]#######################################################################
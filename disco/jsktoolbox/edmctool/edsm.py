@@ -9,36 +9,378 @@ Purpose:
 
 import requests  # type: ignore
 import json
+import sqlite3
+import time
 
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator, Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter  # type: ignore
 from requests.utils import requote_uri  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
 from inspect import currentframe
+from queue import Queue, SimpleQueue
+from threading import Lock
 
 from .edsm_keys import EdsmKeys
 
 
-from ..basetool.data import BData
+from ..basetool.classes import BClasses
 from ..attribtool import ReadOnlyClass
 from ..raisetool import Raise
 from ..edmctool.stars import StarsSystem
+from ..edmctool.system import EnvLocal
+from .base import BLogClient
+from .logs import LogClient
 
 
 class _Keys(object, metaclass=ReadOnlyClass):
     """Internal  keys container class."""
 
+    CACHE: str = "__cache__"
     OPTIONS: str = "__options__"
     SYSTEMS_URL: str = "__systems_url__"
     SYSTEM_URL: str = "__system_url__"
 
 
-class Url(BData):
+class UrlMetrics(BClasses):
+    """Counters and latency of HTTP requests made by Url objects."""
+
+    __lock: Lock = None  # type: ignore
+    __requests: int = 0
+    __failures: int = 0
+    __retries: int = 0
+    __total_time: float = 0.0
+    __max_time: float = 0.0
+    __last_time: float = 0.0
+    __errors: int = 0
+    __last_error: Optional[str] = None
+
+    def __init__(self) -> None:
+        """Create metrics object."""
+        self.__lock = Lock()
+
+    def add(self, latency: float, retries: int, failed: bool) -> None:
+        """Register finished request."""
+        with self.__lock:
+            self.__requests += 1
+            self.__retries += retries
+            self.__failures += failed
+            self.__total_time += latency
+            self.__last_time = latency
+            self.__max_time = max(self.__max_time, latency)
+
+    def error(self, message: str) -> None:
+        """Register error of request or response processing."""
+        with self.__lock:
+            self.__errors += 1
+            self.__last_error = message
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self.__lock:
+            self.__requests = 0
+            self.__failures = 0
+            self.__retries = 0
+            self.__total_time = 0.0
+            self.__max_time = 0.0
+            self.__last_time = 0.0
+            self.__errors = 0
+            self.__last_error = None
+
+    @property
+    def requests(self) -> int:
+        """Return number of requests."""
+        return self.__requests
+
+    @property
+    def failures(self) -> int:
+        """Return number of failed requests."""
+        return self.__failures
+
+    @property
+    def retries(self) -> int:
+        """Return number of retries after 429/5xx responses or errors."""
+        return self.__retries
+
+    @property
+    def average_time(self) -> float:
+        """Return average request latency in seconds."""
+        return self.__total_time / self.__requests if self.__requests else 0.0
+
+    @property
+    def max_time(self) -> float:
+        """Return maximum request latency in seconds."""
+        return self.__max_time
+
+    @property
+    def last_time(self) -> float:
+        """Return latency of the last request in seconds."""
+        return self.__last_time
+
+    @property
+    def errors(self) -> int:
+        """Return number of registered errors."""
+        return self.__errors
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Return message of the last registered error."""
+        return self.__last_error
+
+
+class EdsmCache(BClasses):
+    """On-disk cache of EDSM API responses.
+
+    Responses are stored in SQLite database under normalised URL. Every
+    endpoint has its own time to live, stale entries with ETag or
+    Last-Modified are revalidated with conditional request. If stored
+    responses exceed max_size bytes, the least recently used are evicted.
+    """
+
+    # time to live in seconds for EDSM endpoints
+    TTL: Dict[str, float] = {
+        "system": 24 * 3600.0,
+        "bodies": 3600.0,
+        "sphere-systems": 24 * 3600.0,
+        "cube-systems": 24 * 3600.0,
+    }
+    DEFAULT_TTL: float = 3600.0
+    # file name of the plugin cache in plugin data dir
+    DEFAULT_FILE: str = "edsm_cache.db"
+
+    __default: Optional["EdsmCache"] = None
+    __default_failed: bool = False
+    __default_lock: Lock = Lock()
+    __lock: Lock = None  # type: ignore
+    __db: sqlite3.Connection = None  # type: ignore
+    __max_size: int = 0
+    __ttl: Dict[str, float] = None  # type: ignore
+    __hits: int = 0
+    __misses: int = 0
+    __revalidated: int = 0
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 64 * 1024 * 1024,
+        ttl: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Open or create cache database.
+
+        params:
+        path: str - path to SQLite file, ':memory:' for memory only cache
+        max_size: int - maximum size of stored responses in bytes
+        ttl: Optional[Dict] - TTL overrides for endpoints
+        """
+        self.__lock = Lock()
+        self.__max_size = max_size
+        self.__ttl = dict(self.TTL)
+        if ttl:
+            self.__ttl.update(ttl)
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, "
+            "last_modified TEXT, stored REAL NOT NULL, accessed REAL NOT NULL, "
+            "size INTEGER NOT NULL)"
+        )
+        self.__db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_accessed ON responses(accessed)"
+        )
+        self.__db.commit()
+
+    @classmethod
+    def default(cls) -> Optional["EdsmCache"]:
+        """Return plugin cache stored in plugin data dir, create it if needed.
+
+        The cache is opened once and shared by all callers. Returns None
+        if the cache database cannot be opened, opening is not retried.
+        """
+        with cls.__default_lock:
+            if cls.__default is None and not cls.__default_failed:
+                try:
+                    cls.__default = cls(
+                        f"{EnvLocal().plugin_dir}/data/{cls.DEFAULT_FILE}"
+                    )
+                except sqlite3.Error:
+                    cls.__default_failed = True
+            return cls.__default
+
+    @staticmethod
+    def normalise(url: str) -> str:
+        """Return cache key for url.
+
+        Scheme and host are lowercased, query parameters sorted and
+        system names lowercased, as EDSM ignores their case.
+        """
+        parts = urlsplit(url)
+        query: List[Tuple[str, str]] = sorted(
+            (key, value.lower() if key == "systemName" else value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        )
+        return urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path,
+                urlencode(query),
+                "",
+            )
+        )
+
+    def ttl(self, url: str) -> float:
+        """Return time to live for url endpoint."""
+        endpoint: str = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+        return self.__ttl.get(endpoint, self.DEFAULT_TTL)
+
+    def get(self, url: str) -> Optional[Tuple[str, bool, Dict[str, str]]]:
+        """Return (body, fresh, validators) for url or None if not stored.
+
+        Validators are headers for conditional request of stale entry.
+        """
+        key: str = self.normalise(url)
+        now: float = time.time()
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT body, etag, last_modified, stored FROM responses "
+                "WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.__misses += 1
+                return None
+            self.__db.execute(
+                "UPDATE responses SET accessed = ? WHERE url = ?", (now, key)
+            )
+            self.__db.commit()
+            body, etag, last_modified, stored = row
+            fresh: bool = now - stored < self.ttl(url)
+            if fresh:
+                self.__hits += 1
+        validators: Dict[str, str] = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+        return body, fresh, validators
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store response body and evict old entries if cache is full."""
+        now: float = time.time()
+        size: int = len(body.encode("utf-8"))
+        with self.__lock:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, etag, last_modified, stored, accessed, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.normalise(url), body, etag, last_modified, now, now, size),
+            )
+            total: int = self.__db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            while total > self.__max_size:
+                row = self.__db.execute(
+                    "SELECT url, size FROM responses ORDER BY accessed LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                self.__db.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+                total -= row[1]
+            self.__db.commit()
+
+    def refresh(self, url: str) -> None:
+        """Mark stored response as fresh after successful revalidation."""
+        now: float = time.time()
+        with self.__lock:
+            self.__db.execute(
+                "UPDATE responses SET stored = ?, accessed = ? WHERE url = ?",
+                (now, now, self.normalise(url)),
+            )
+            self.__db.commit()
+            self.__revalidated += 1
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Drop stored response for url, or all responses if None."""
+        with self.__lock:
+            if url is None:
+                self.__db.execute("DELETE FROM responses")
+            else:
+                self.__db.execute(
+                    "DELETE FROM responses WHERE url = ?", (self.normalise(url),)
+                )
+            self.__db.commit()
+
+    def close(self) -> None:
+        """Close cache database."""
+        with self.__lock:
+            self.__db.close()
+
+    @property
+    def hits(self) -> int:
+        """Return number of fresh responses served."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Return number of lookups of not stored urls."""
+        return self.__misses
+
+    @property
+    def revalidated(self) -> int:
+        """Return number of stale responses confirmed by the server."""
+        return self.__revalidated
+
+
+class Url(BLogClient):
     """Url.
 
     Class for serving HTTP/HTTPS requests.
+
+    All instances share one requests.Session with keep-alive connection
+    pool. GET requests answered with 429 or 5xx status are retried with
+    exponential backoff. Failed requests are registered in metrics and
+    logged as warnings if a log queue is given.
     """
 
-    def __init__(self) -> None:
-        """Create Url helper object."""
+    # connection pool and retry policy
+    POOL_SIZE: int = 10
+    RETRIES: int = 3
+    BACKOFF: float = 0.5
+    RETRY_STATUS: tuple = (429, 500, 502, 503, 504)
+
+    __session: Optional[requests.Session] = None
+    __session_lock: Lock = Lock()
+    __metrics: UrlMetrics = UrlMetrics()
+
+    def __init__(
+        self,
+        systems_url: Optional[str] = None,
+        system_url: Optional[str] = None,
+        cache: Optional[EdsmCache] = None,
+        log_queue: Optional[Union[Queue, SimpleQueue]] = None,
+    ) -> None:
+        """Create Url helper object.
+
+        params:
+        systems_url: Optional[str] - base url of EDSM systems API
+        system_url: Optional[str] - base url of EDSM system API
+        cache: Optional[EdsmCache] - responses cache, plugin cache if None
+        log_queue: Optional[Queue] - queue for LogClient
+        """
+        if log_queue is not None:
+            self.logger = LogClient(log_queue)
+        self._set_data(
+            key=_Keys.CACHE,
+            value=cache if cache is not None else EdsmCache.default(),
+            set_default_type=Optional[EdsmCache],
+        )
         self.__options = {
             EdsmKeys.SHOW_ID: 1,
             EdsmKeys.SHOW_PERMIT: 1,
@@ -49,15 +391,123 @@ class Url(BData):
         }
         self._set_data(
             key=_Keys.SYSTEMS_URL,
-            value="https://www.edsm.net/api-v1/",
+            value=systems_url or "https://www.edsm.net/api-v1/",
             set_default_type=str,
         )
         self._set_data(
             key=_Keys.SYSTEM_URL,
-            value="https://www.edsm.net/api-system-v1/",
+            value=system_url or "https://www.edsm.net/api-system-v1/",
             set_default_type=str,
         )
 
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Return shared HTTP session, create it if needed."""
+        with cls.__session_lock:
+            if cls.__session is None:
+                retry = Retry(
+                    total=cls.RETRIES,
+                    backoff_factor=cls.BACKOFF,
+                    status_forcelist=cls.RETRY_STATUS,
+                    allowed_methods=("GET",),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=cls.POOL_SIZE,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls.__session = session
+            return cls.__session
+
+    @classmethod
+    def close(cls) -> None:
+        """Close shared HTTP session."""
+        with cls.__session_lock:
+            if cls.__session is not None:
+                cls.__session.close()
+            cls.__session = None
+
+    @property
+    def cache(self) -> Optional[EdsmCache]:
+        """Return responses cache."""
+        return self._get_data(key=_Keys.CACHE)  # type: ignore
+
+    @cache.setter
+    def cache(self, value: Optional[EdsmCache]) -> None:
+        """Set responses cache, None disables caching."""
+        self._set_data(key=_Keys.CACHE, value=value)
+
+    @property
+    def metrics(self) -> UrlMetrics:
+        """Return shared requests metrics."""
+        return Url.__metrics
+
+    def __error(self, message: str) -> None:
+        """Register and log request error."""
+        self.metrics.error(message)
+        if self.logger:
+            self.logger.warning = f"EDSM: {message}"
+
+    def __get(
+        self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
+        """Make GET request with the shared session and register metrics.
+
+        Returns response or None if request failed.
+        """
+        t_start: float = time.perf_counter()
+        response: Optional[requests.Response] = None
+        retries: int = 0
+        try:
+            response = self.session().get(url, timeout=timeout, headers=headers)
+            history = getattr(response.raw, "retries", None)
+            if history is not None:
+                retries = len(history.history)
+        except Exception as ex:
+            self.__error(f"{url}: {ex}")
+        self.metrics.add(
+            time.perf_counter() - t_start,
+            retries,
+            response is None or response.status_code not in (200, 304),
+        )
+        return response
+
+    def __text(self, url: str, timeout: float, error: str) -> Optional[str]:
+        """Return response body for url, using the cache if set.
+
+        Reports error message with status code if request failed.
+        """
+        cache: Optional[EdsmCache] = self.cache
+        cached: Optional[Tuple[str, bool, Dict[str, str]]] = None
+        if cache is not None:
+            cached = cache.get(url)
+            if cached is not None and cached[1]:
+                return cached[0]
+        response: Optional[requests.Response] = self.__get(
+            url, timeout, cached[2] if cached else None
+        )
+        if response is None:
+            return None
+        if response.status_code == 304 and cache is not None and cached:
+            cache.refresh(url)
+            return cached[0]
+        if response.status_code != 200:
+            self.__error(f"{error}: {response.status_code}")
+            return None
+        if cache is not None:
+            cache.put(
+                url,
+                response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return response.text
+
     @property
     def __options(self) -> Dict:
         return self._get_data(key=_Keys.OPTIONS)  # type: ignore
@@ -176,14 +626,13 @@ class Url(BData):
         if not url:
             return None
 
+        text: Optional[str] = self.__text(url, 30, "Error calling API for system data")
+        if text is None:
+            return None
         try:
-            response: requests.Response = requests.get(url, timeout=30)
-            if response.status_code != 200:
-                print(f"Error calling API for system data: {response.status_code}")
-                return None
-            return json.loads(response.text)
+            return json.loads(text)
         except Exception as ex:
-            print(ex)
+            self.__error(f"{url}: {ex}")
         return None
 
     def url_query(self, url: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -192,15 +641,169 @@ class Url(BData):
         if not url:
             return out
 
+        text: Optional[str] = self.__text(url, 60, "Error calling API for EDSM data")
+        if text is None:
+            return out
         try:
-            response: requests.Response = requests.get(url, timeout=60)
-            if response.status_code != 200:
-                print(f"Error calling API for EDSM data: {response.status_code}")
-            else:
-                out = json.loads(response.text)
+            out = json.loads(text)
         except Exception as ex:
-            print(ex)
+            self.__error(f"{url}: {ex}")
         return out
 
 
+class TokenBucket(BClasses):
+    """Token bucket rate limiter safe for use from many threads."""
+
+    __lock: Lock = None  # type: ignore
+    __rate: float = 0.0
+    __capacity: float = 0.0
+    __tokens: float = 0.0
+    __stamp: float = 0.0
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create limiter.
+
+        params:
+        rate: float - tokens added per second
+        capacity: float - maximum number of tokens (burst size)
+        """
+        if rate <= 0 or capacity < 1:
+            raise Raise.error(
+                f"Positive rate and capacity expected, '{rate}/{capacity}' received.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__lock = Lock()
+        self.__rate = float(rate)
+        self.__capacity = float(capacity)
+        self.__tokens = float(capacity)
+        self.__stamp = time.monotonic()
+
+    def acquire(self) -> None:
+        """Take one token, wait until it is available."""
+        while True:
+            with self.__lock:
+                now: float = time.monotonic()
+                self.__tokens = min(
+                    self.__capacity,
+                    self.__tokens + (now - self.__stamp) * self.__rate,
+                )
+                self.__stamp = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait: float = (1 - self.__tokens) / self.__rate
+            time.sleep(wait)
+
+
+class EdsmBatchClient(BClasses):
+    """Concurrent EDSM lookups for many StarsSystem objects.
+
+    Queries run on a thread pool through the shared Url session. Every
+    request takes a token from the rate limiter, identical urls in flight
+    are sent once and their result is shared.
+    """
+
+    __url: Url = None  # type: ignore
+    __pool: ThreadPoolExecutor = None  # type: ignore
+    __limiter: TokenBucket = None  # type: ignore
+    __lock: Lock = None  # type: ignore
+    __in_flight: Dict[str, Future] = None  # type: ignore
+
+    def __init__(
+        self,
+        url: Optional[Url] = None,
+        workers: int = 4,
+        rate: float = 1.0,
+        burst: int = 10,
+        log_queue: Optional[Union[Queue, SimpleQueue]] = None,
+    ) -> None:
+        """Create client.
+
+        params:
+        url: Optional[Url] - Url helper, new one if None
+        workers: int - number of concurrent requests
+        rate: float - requests per second allowed by the limiter
+        burst: int - requests allowed at once after idle time
+        log_queue: Optional[Queue] - queue for LogClient of the new Url
+        """
+        self.__url = url if url is not None else Url(log_queue=log_queue)
+        self.__pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="EdsmBatchClient"
+        )
+        self.__limiter = TokenBucket(rate, burst)
+        self.__lock = Lock()
+        self.__in_flight = {}
+
+    def __query(self, url: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Make rate limited request."""
+        self.__limiter.acquire()
+        return self.__url.url_query(url)
+
+    def __done(self, url: str, future: Future) -> None:
+        """Forget finished request."""
+        with self.__lock:
+            if self.__in_flight.get(url) is future:
+                del self.__in_flight[url]
+
+    def fetch(self, url: str) -> Future:
+        """Return future with result of url query.
+
+        A request for url already in flight is not repeated.
+        """
+        with self.__lock:
+            future: Optional[Future] = self.__in_flight.get(url)
+            if future is None:
+                future = self.__pool.submit(self.__query, url)
+                self.__in_flight[url] = future
+                future.add_done_callback(lambda item: self.__done(url, item))
+        return future
+
+    def resolve(
+        self, systems: Iterable[StarsSystem], bodies: bool = True
+    ) -> Iterator[StarsSystem]:
+        """Resolve systems concurrently, yield each one when it is updated.
+
+        Every system is updated with EDSM system data (coordinates,
+        address, permit) and, if bodies is True, with bodies count.
+        Systems are yielded in completion order.
+        """
+        pending: Dict[int, List[Future]] = {}
+        owners: Dict[Future, List[StarsSystem]] = {}
+        for s_system in systems:
+            if not isinstance(s_system, StarsSystem):
+                raise Raise.error(
+                    f"StarsSystem type expected, '{type(s_system)}' received",
+                    TypeError,
+                    self._c_name,
+                    currentframe(),
+                )
+            urls: List[str] = [self.__url.system_url(s_system)]
+            if bodies:
+                urls.append(self.__url.bodies_url(s_system))
+            futures: List[Future] = [self.fetch(url) for url in urls if url]
+            if not futures:
+                yield s_system
+                continue
+            pending[id(s_system)] = futures
+            for future in futures:
+                owners.setdefault(future, []).append(s_system)
+        for future in as_completed(list(owners)):
+            for s_system in owners[future]:
+                futures = pending.get(id(s_system), [])
+                if not futures or not all(item.done() for item in futures):
+                    continue
+                del pending[id(s_system)]
+                for item in futures:
+                    data = item.result()
+                    if isinstance(data, Dict):
+                        s_system.update_from_edsm(data)
+                yield s_system
+
+    def close(self) -> None:
+        """Stop worker threads."""
+        self.__pool.shutdown(wait=True)
+
+
 # #[EOF]#######################################################################
@@ -9,7 +9,10 @@ Purpose:
 
 from __future__ import annotations
 
+import atexit
 import math
+import os
+import sys
 import time
 import random
 
@@ -18,7 +21,10 @@ from queue import Queue, SimpleQueue
 from typing import Optional, List, Tuple, Union, Any, Dict
 from types import FrameType, MethodType
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
 from itertools import permutations
+from threading import Lock
 from sys import maxsize
 
 from types import FrameType
@@ -26,11 +32,12 @@ from types import FrameType
 from .ed_keys import EDKeys
 
 from ..attribtool import ReadOnlyClass
+from ..basetool.classes import BClasses
 from ..raisetool import Raise
 from .base import BLogClient
 from .logs import LogClient
 from .data import RscanData
-from .stars import StarsSystem
+from .stars import StarsSystem, StarsSystemArray
 from .edsm_keys import EdsmKeys
 
 try:
@@ -47,10 +54,21 @@ except ModuleNotFoundError:
 class IAlg(ABC):
     """Interface for algorithm class ."""
 
+    __cancelled: bool = False
+
     @abstractmethod
     def run(self) -> None:
         """Run the work."""
 
+    def cancel(self) -> None:
+        """Ask running algorithm to stop and keep the best result so far."""
+        self.__cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """Check, if algorithm was cancelled."""
+        return self.__cancelled
+
     @abstractmethod
     def debug(self, currentframe: Optional[FrameType], message: str) -> None:
         """Debug formatter for logger."""
@@ -73,6 +91,15 @@ class _Keys(object, metaclass=ReadOnlyClass):
     R_DATA: str = "__e_r_data__"
 
 
+class AntVariant(object, metaclass=ReadOnlyClass):
+    """Pheromone update variants for AlgAntColony."""
+
+    # Ant System with additional deposit of the best-so-far ant
+    ELITIST: str = "elitist"
+    # MAX-MIN Ant System, only best ant deposits, bounded pheromone
+    MMAS: str = "mmas"
+
+
 def _filter_reachable_points(
     start: StarsSystem,
     systems: List[StarsSystem],
@@ -90,10 +117,7 @@ def _filter_reachable_points(
     while frontier:
         current = frontier.pop(0)
         for candidate in remaining[:]:
-            if (
-                euclid_alg.distance(current.star_pos, candidate.star_pos)
-                <= jump_range
-            ):
+            if euclid_alg.distance(current.star_pos, candidate.star_pos) <= jump_range:
                 reachable.append(candidate)
                 frontier.append(candidate)
                 remaining.remove(candidate)
@@ -101,6 +125,435 @@ def _filter_reachable_points(
     return reachable
 
 
+def distance_matrix(
+    points: Union[List[StarsSystem], StarsSystemArray], euclid_alg: Euclid
+) -> Any:
+    """Return the symmetric matrix of distances between given points.
+
+    With numpy available the matrix is computed in one vectorised pass,
+    otherwise a list of lists is built with the Euclid object, bypassing
+    the shared distance cache.
+    Both forms can be indexed as `matrix[i][j]`.
+    """
+    if isinstance(points, StarsSystemArray):
+        if np is not None:
+            diff = points.positions[:, None, :] - points.positions[None, :, :]
+            return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        points = points.systems()
+    count: int = len(points)
+    if np is not None:
+        pos = np.array([point.star_pos for point in points], dtype=np.float64)
+        diff = pos[:, None, :] - pos[None, :, :]
+        return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+    matrix: List[List[float]] = [[0.0] * count for _ in range(count)]
+    for idx in range(count):
+        for idx2 in range(idx + 1, count):
+            dist: float = euclid_alg.distance(
+                points[idx].star_pos, points[idx2].star_pos
+            )
+            matrix[idx][idx2] = dist
+            matrix[idx2][idx] = dist
+    return matrix
+
+
+def _route_length(matrix: Any, route: List[int], jump_range: float) -> float:
+    """Return the length of open route given as matrix indexes.
+
+    Returns inf if any jump of the route exceeds the jump range.
+    """
+    if len(route) < 2:
+        return 0.0
+    if np is not None:
+        idx = np.asarray(route, dtype=np.intp)
+        segments = matrix[idx[:-1], idx[1:]]
+        if segments.max() > jump_range:
+            return float("inf")
+        return float(segments.sum())
+    out: float = 0.0
+    for idx in range(len(route) - 1):
+        segment: float = matrix[route[idx]][route[idx + 1]]
+        if segment > jump_range:
+            return float("inf")
+        out += segment
+    return out
+
+
+def _population_lengths(
+    matrix: Any, population: List[List[int]], jump_range: float
+) -> List[float]:
+    """Return route lengths for the whole population.
+
+    Populations of routes with equal length are evaluated with numpy
+    in a single vectorised pass.
+    """
+    if (
+        np is not None
+        and population
+        and len(population[0]) > 1
+        and all(len(route) == len(population[0]) for route in population)
+    ):
+        idx = np.asarray(population, dtype=np.intp)
+        segments = matrix[idx[:, :-1], idx[:, 1:]]
+        lengths = segments.sum(axis=1)
+        lengths[(segments > jump_range).any(axis=1)] = np.inf
+        return lengths.tolist()
+    return [_route_length(matrix, route, jump_range) for route in population]
+
+
+def _roulette_select(weights: List[float], count: int, rnd: Any = random) -> List[int]:
+    """Draw `count` population indexes with probability proportional to weights.
+
+    All draws for a generation are made at once. If all weights are zero,
+    indexes are drawn uniformly. rnd is random module or random.Random.
+    """
+    total: float = sum(weights)
+    if np is not None:
+        rng = np.random.default_rng(rnd.getrandbits(64))
+        if total > 0:
+            probabilities = np.asarray(weights, dtype=np.float64) / total
+            return rng.choice(len(weights), size=count, p=probabilities).tolist()
+        return rng.integers(0, len(weights), size=count).tolist()
+    if total > 0:
+        return rnd.choices(range(len(weights)), weights=weights, k=count)
+    return [rnd.randrange(len(weights)) for _ in range(count)]
+
+
+def _order_crossover(
+    parent1: List[int], parent2: List[int], rnd: Any = random
+) -> List[int]:
+    """Perform Order Crossover (OX) to generate a child route."""
+    start_idx: int = rnd.randint(0, len(parent1) - 1)
+    end_idx: int = rnd.randint(start_idx, len(parent1) - 1)
+
+    child: List[int] = [-1] * len(parent1)
+    child[start_idx:end_idx] = parent1[start_idx:end_idx]
+    used = set(parent1[start_idx:end_idx])
+
+    current_pos: int = end_idx
+    for system in parent2:
+        if system not in used:
+            if current_pos >= len(parent1):
+                current_pos = 0
+            child[current_pos] = system
+            current_pos += 1
+
+    return child
+
+
+def _swap_mutation(route: List[int], mutation_rate: float, rnd: Any = random) -> None:
+    """Perform swap mutation with a given probability."""
+    if len(route) <= 1:
+        return
+    if rnd.random() < mutation_rate:
+        idx1: int = rnd.randint(0, len(route) - 1)
+        idx2: int = rnd.randint(0, len(route) - 1)
+        route[idx1], route[idx2] = route[idx2], route[idx1]
+
+
+def nearest_neighbour_route(matrix: Any, jump_range: float) -> List[int]:
+    """Return greedy route of matrix indexes starting from index 0.
+
+    The start index is not included in the returned route.
+    """
+    route: List[int] = []
+    remaining: List[int] = list(range(1, len(matrix)))
+    current: int = 0
+    while remaining:
+        row = matrix[current]
+        next_point: int = min(remaining, key=row.__getitem__)
+        if row[next_point] > jump_range:
+            break
+        route.append(next_point)
+        remaining.remove(next_point)
+        current = next_point
+    return route
+
+
+def route_prefix(matrix: Any, route: List[int], jump_range: float) -> Tuple[int, float]:
+    """Return (count, length) of the part of the route from index 0.
+
+    The route is cut before the first jump exceeding the jump range.
+    The start index is not included in the given route.
+    """
+    count: int = 0
+    length: float = 0.0
+    current: int = 0
+    for point in route:
+        segment: float = matrix[current][point]
+        if segment > jump_range:
+            break
+        count += 1
+        length += segment
+        current = point
+    return count, length
+
+
+def two_opt(
+    matrix: Any,
+    route: List[int],
+    jump_range: float,
+    deadline: Optional[float] = None,
+) -> List[int]:
+    """Improve route from index 0 with 2-opt moves until no move helps.
+
+    A move is accepted if the route visits more points before the first
+    jump out of range, or the same number over a shorter distance.
+    Search stops at the deadline (time.time() value) if given.
+    """
+    best: List[int] = route[:]
+    count, length = route_prefix(matrix, best, jump_range)
+    improved: bool = True
+    while improved:
+        improved = False
+        for idx in range(len(best) - 1):
+            if deadline is not None and time.time() > deadline:
+                return best
+            for idx2 in range(idx + 1, len(best)):
+                candidate: List[int] = (
+                    best[:idx] + best[idx : idx2 + 1][::-1] + best[idx2 + 1 :]
+                )
+                c_count, c_length = route_prefix(matrix, candidate, jump_range)
+                if c_count > count or (c_count == count and c_length < length - 1e-9):
+                    best, count, length = candidate, c_count, c_length
+                    improved = True
+    return best
+
+
+# process pool shared by AlgGeneticParallel runs, see _island_pool
+_ISLAND_POOL: Dict[str, Any] = {"executor": None, "lock": Lock()}
+
+
+def _island_pool() -> Optional[ProcessPoolExecutor]:
+    """Return process pool for island workers or None.
+
+    Worker processes start sys.executable. In a frozen application, like
+    EDMC on Windows, it is the application itself, not a Python
+    interpreter, so the islands are evolved in process instead.
+    """
+    if getattr(sys, "frozen", False) or not os.path.basename(
+        sys.executable or ""
+    ).lower().startswith("python"):
+        return None
+    with _ISLAND_POOL["lock"]:
+        if _ISLAND_POOL["executor"] is None:
+            _ISLAND_POOL["executor"] = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1
+            )
+            atexit.register(_island_pool_shutdown)
+        return _ISLAND_POOL["executor"]
+
+
+def _island_pool_shutdown() -> None:
+    """Stop worker processes of the shared pool, called at exit."""
+    with _ISLAND_POOL["lock"]:
+        executor: Optional[ProcessPoolExecutor] = _ISLAND_POOL["executor"]
+        _ISLAND_POOL["executor"] = None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _island_pool_reset(executor: ProcessPoolExecutor) -> None:
+    """Drop broken process pool, the next run creates a new one."""
+    with _ISLAND_POOL["lock"]:
+        if _ISLAND_POOL["executor"] is executor:
+            _ISLAND_POOL["executor"] = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _island_epoch(
+    matrix: Any,
+    jump_range: float,
+    population: List[List[int]],
+    generations: int,
+    mutation_rate: float,
+    seed: int,
+) -> Tuple[List[List[int]], List[int], float]:
+    """Evolve one island population for given number of generations.
+
+    Returns the evolved population, its best route and the route length.
+    """
+    rnd = random.Random(seed)
+    size: int = len(population)
+
+    lengths: List[float] = _population_lengths(
+        matrix, [[0] + route for route in population], jump_range
+    )
+    best_length: float = min(lengths)
+    best_route: List[int] = population[lengths.index(best_length)][:]
+
+    for _ in range(generations):
+        fitness: List[float] = [
+            1 / length if 0 < length < float("inf") else 0.0 for length in lengths
+        ]
+        selected: List[int] = _roulette_select(fitness, size, rnd)
+        # the best route always survives
+        new_population: List[List[int]] = [best_route[:]]
+        for idx in range(0, len(selected) - 1, 2):
+            parent1: List[int] = population[selected[idx]]
+            parent2: List[int] = population[selected[idx + 1]]
+            for child in (
+                _order_crossover(parent1, parent2, rnd),
+                _order_crossover(parent2, parent1, rnd),
+            ):
+                _swap_mutation(child, mutation_rate, rnd)
+                new_population.append(child)
+        population = new_population[:size]
+        lengths = _population_lengths(
+            matrix, [[0] + route for route in population], jump_range
+        )
+        current: float = min(lengths)
+        if current < best_length:
+            best_length = current
+            best_route = population[lengths.index(current)][:]
+
+    return population, best_route, best_length
+
+
+class DistanceCache(BClasses):
+    """Bounded LRU cache of distances between star systems.
+
+    Keys are ordered pairs of SystemAddress values. Coordinates of every
+    address are remembered, if a system comes with other coordinates its
+    distances are invalidated. One instance is shared by all Euclid
+    objects in the process, see Euclid.cache. Solvers use distance
+    matrices in their inner loops, not this cache.
+    """
+
+    __lock: Lock = None  # type: ignore
+    __data: OrderedDict = None  # type: ignore
+    __positions: Dict[int, Tuple[float, ...]] = None  # type: ignore
+    __maxsize: int = 0
+    __hits: int = 0
+    __misses: int = 0
+
+    def __init__(self, maxsize: int = 100000) -> None:
+        """Create cache.
+
+        params:
+        maxsize: int - maximum number of stored distances
+        """
+        self.__lock = Lock()
+        self.__data = OrderedDict()
+        self.__positions = {}
+        self.maxsize = maxsize
+
+    def __len__(self) -> int:
+        """Return number of stored distances."""
+        return len(self.__data)
+
+    @staticmethod
+    def key(address_1: int, address_2: int) -> Tuple[int, int]:
+        """Return cache key for pair of SystemAddress values."""
+        if address_1 > address_2:
+            return address_2, address_1
+        return address_1, address_2
+
+    def __track(self, system: StarsSystem) -> None:
+        """Remember coordinates of the system, drop its distances if changed.
+
+        Has to be called with the lock held.
+        """
+        position: Tuple[float, ...] = tuple(system.star_pos)
+        known: Optional[Tuple[float, ...]] = self.__positions.get(system.address)
+        if known == position:
+            return
+        if known is not None:
+            self.__drop(system.address)  # type: ignore
+        elif len(self.__positions) >= self.__maxsize:
+            self.__data.clear()
+            self.__positions.clear()
+        self.__positions[system.address] = position  # type: ignore
+
+    def __drop(self, address: int) -> None:
+        """Drop distances of the address, has to be called with the lock held."""
+        for key in [key for key in self.__data if address in key]:
+            del self.__data[key]
+        self.__positions.pop(address, None)
+
+    def get(self, system_1: StarsSystem, system_2: StarsSystem) -> Optional[float]:
+        """Return stored distance or None."""
+        key: Tuple[int, int] = self.key(system_1.address, system_2.address)  # type: ignore
+        with self.__lock:
+            self.__track(system_1)
+            self.__track(system_2)
+            out: Optional[float] = self.__data.get(key)
+            if out is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__data.move_to_end(key)
+            return out
+
+    def put(self, system_1: StarsSystem, system_2: StarsSystem, value: float) -> None:
+        """Store distance, dropping the least recently used if full."""
+        key: Tuple[int, int] = self.key(system_1.address, system_2.address)  # type: ignore
+        with self.__lock:
+            self.__track(system_1)
+            self.__track(system_2)
+            self.__data[key] = value
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+
+    def invalidate(self, address: Optional[int] = None) -> None:
+        """Drop distances of the system, or all distances if None.
+
+        Systems with changed coordinates are invalidated by get and put.
+        """
+        with self.__lock:
+            if address is None:
+                self.__data.clear()
+                self.__positions.clear()
+                return
+            self.__drop(address)
+
+    def reset_stats(self) -> None:
+        """Reset hits and misses counters."""
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Return number of cache hits."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Return number of cache misses."""
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Return ratio of hits to all lookups."""
+        total: int = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    @property
+    def maxsize(self) -> int:
+        """Return maximum number of stored distances."""
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        """Set maximum number of stored distances."""
+        if not isinstance(value, int) or value < 1:
+            raise Raise.error(
+                f"Positive int expected, '{value}' received.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        with self.__lock:
+            self.__maxsize = value
+            while len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+
+
+# process-wide distance cache used by Euclid.system_distance
+_DISTANCE_CACHE: DistanceCache = DistanceCache()
+
+
 class Euclid(BLogClient):
     """Euclid.
 
@@ -325,6 +778,25 @@ class Euclid(BLogClient):
 
         return out
 
+    def system_distance(self, system_1: StarsSystem, system_2: StarsSystem) -> float:
+        """Return distance between star systems.
+
+        Distances between systems with known SystemAddress are taken
+        from the shared cache or stored in it after calculation.
+        """
+        if system_1.address is None or system_2.address is None:
+            return self.distance(system_1.star_pos, system_2.star_pos)
+        out: Optional[float] = _DISTANCE_CACHE.get(system_1, system_2)
+        if out is None:
+            out = self.distance(system_1.star_pos, system_2.star_pos)
+            _DISTANCE_CACHE.put(system_1, system_2, out)
+        return out
+
+    @property
+    def cache(self) -> DistanceCache:
+        """Return process-wide distance cache."""
+        return _DISTANCE_CACHE
+
 
 class AlgAStar(IAlg, BLogClient):
 
@@ -398,20 +870,12 @@ class AlgAStar(IAlg, BLogClient):
         ]
         self.__final = []
 
-    def __get_neighbors(
-        self,
-        point: StarsSystem,
-        candidates: List[StarsSystem],
-    ) -> List[StarsSystem]:
-        """Return points reachable from `point` within the jump range."""
-        neighbors: List[StarsSystem] = []
-        for candidate in candidates:
-            if (
-                self.__math.distance(point.star_pos, candidate.star_pos)
-                <= self.__jump_range
-            ):
-                neighbors.append(candidate)
-        return neighbors
+    def __get_neighbors(self, row: Any, candidates: List[int]) -> List[int]:
+        """Return candidates reachable within the jump range.
+
+        row is the distance matrix row of the current point.
+        """
+        return [idx for idx in candidates if row[idx] <= self.__jump_range]
 
     def __reconstruct_path(
         self, came_from: dict, current: StarsSystem
@@ -443,42 +907,29 @@ class AlgAStar(IAlg, BLogClient):
             self.__math,
             self.__jump_range,
         )
-        remaining: List[StarsSystem] = reachable[:]
         self.__final = []
 
-        if not remaining:
+        if not reachable:
             self.debug(currentframe(), "No reachable targets")
             return
 
-        current: StarsSystem = self.__start_point
+        points: List[StarsSystem] = [self.__start_point] + reachable
+        matrix: Any = distance_matrix(points, self.__math)
+        remaining: List[int] = list(range(1, len(points)))
+        current: int = 0
 
         while remaining:
-            neighbors = self.__get_neighbors(current, remaining)
+            row = matrix[current]
+            neighbors: List[int] = self.__get_neighbors(row, remaining)
             if not neighbors:
                 # brak dalszych punktów w zasięgu – przerywamy poszukiwanie
                 self.debug(currentframe(), "No reachable neighbors found")
                 break
-            next_point = min(
-                neighbors,
-                key=lambda point: self.__math.distance(
-                    current.star_pos, point.star_pos
-                ),
-            )
-            self.__final.append(next_point)
-            remaining.remove(next_point)
-            current = next_point
-
-        if self.__final:
-            dist = self.__math.distance(
-                self.__start_point.star_pos, self.__final[0].star_pos
-            )
-            self.__final[0].data[EdsmKeys.DISTANCE] = dist
-            for idx in range(len(self.__final) - 1):
-                dist = self.__math.distance(
-                    self.__final[idx].star_pos,
-                    self.__final[idx + 1].star_pos,
-                )
-                self.__final[idx + 1].data[EdsmKeys.DISTANCE] = dist
+            next_idx: int = min(neighbors, key=row.__getitem__)
+            points[next_idx].data[EdsmKeys.DISTANCE] = float(row[next_idx])
+            self.__final.append(points[next_idx])
+            remaining.remove(next_idx)
+            current = next_idx
 
         end_t: float = time.time()
         self.debug(
@@ -490,12 +941,10 @@ class AlgAStar(IAlg, BLogClient):
     def final_distance(self) -> float:
         if not self.__final:
             return 0.0
-        dist = self.__math.distance(
-            self.__start_point.star_pos, self.__final[0].star_pos
-        )
+        dist = self.__math.system_distance(self.__start_point, self.__final[0])
         for item in range(len(self.__final) - 1):
-            dist += self.__math.distance(
-                self.__final[item].star_pos, self.__final[item + 1].star_pos
+            dist += self.__math.system_distance(
+                self.__final[item], self.__final[item + 1]
             )
         return dist if dist else 0.0
 
@@ -619,17 +1068,9 @@ class AlgTsp(IAlg, BLogClient):
 
     def __stage_1_costs(self, points: List[StarsSystem]) -> None:
         """Stage 1: generate a cost table."""
-        self.__costs = []
-        count: int = len(points)
-        for idx in range(count):
-            row: List[float] = []
-            for idx2 in range(count):
-                row.append(
-                    self.__math.distance(
-                        points[idx].star_pos, points[idx2].star_pos
-                    )
-                )
-            self.__costs.append(row)
+        matrix: Any = distance_matrix(points, self.__math)
+        # lists are faster than numpy scalars in the permutations loop
+        self.__costs = matrix.tolist() if np is not None else matrix
         self.debug(currentframe(), f"{self.__costs}")
 
     def __stage_2_solution(self, points: List[StarsSystem]) -> None:
@@ -647,6 +1088,8 @@ class AlgTsp(IAlg, BLogClient):
         best_first_edge: float = float("inf")
 
         for i in next_permutation:
+            if self.cancelled:
+                break
             # store current path weight (open tour)
             first_edge: float = self.__costs[start][i[0]]
             current_path_weight: float = first_edge
@@ -686,10 +1129,7 @@ class AlgTsp(IAlg, BLogClient):
             prev_idx = self.__route[idx - 1]
             cur_idx = self.__route[idx]
             system: StarsSystem = points[cur_idx]
-            distance_segment = self.__math.distance(
-                points[prev_idx].star_pos,
-                system.star_pos,
-            )
+            distance_segment = self.__costs[prev_idx][cur_idx]
             system.data[EdsmKeys.DISTANCE] = distance_segment
             self.__total_distance += distance_segment
             self.__final.append(system)
@@ -810,46 +1250,33 @@ class AlgGeneric(IAlg, BLogClient):
         """
 
         start_t: float = time.time()
-        current_point: StarsSystem = self.__start_point
-        systems: List[StarsSystem] = self.__points[:]
-        remaining_systems: List[StarsSystem] = systems  # lista punktów do odwiedzenia
+        points: List[StarsSystem] = [self.__start_point] + self.__points
+        matrix: Any = distance_matrix(points, self.__math)
+        current: int = 0
+        # indeksy punktów do odwiedzenia
+        remaining: List[int] = list(range(1, len(points)))
 
-        while remaining_systems:
+        while remaining:
             # Szukamy najbliższego punktu, który jest w zasięgu jump_range z obecnego punktu
-            next_point: Optional[StarsSystem] = None
+            row = matrix[current]
+            next_idx: Optional[int] = None
             min_distance: float = float("inf")
 
-            for system in remaining_systems:
-                dist = self.__math.distance(current_point.star_pos, system.star_pos)
-                if (
-                    dist is not None
-                    and dist <= self.__jump_range
-                    and dist < min_distance
-                ):
-                    next_point = system
+            for idx in remaining:
+                dist: float = row[idx]
+                if dist <= self.__jump_range and dist < min_distance:
+                    next_idx = idx
                     min_distance = dist
 
-            if next_point is None:
+            if next_idx is None:
                 # Nie znaleziono żadnego punktu w zasięgu jump_range
                 break
 
             # Przechodzimy do znalezionego punktu i usuwamy go z listy
-            self.__final.append(next_point)
-            remaining_systems.remove(next_point)
-            current_point = next_point  # Aktualizujemy bieżący punkt
-
-        # update distance
-        if self.__final:
-            dist: float = self.__math.distance(
-                self.__start_point.star_pos, self.__final[0].star_pos
-            )
-            self.__final[0].data[EdsmKeys.DISTANCE] = dist
-            for item in range(len(self.__final) - 1):
-                dist = self.__math.distance(
-                    self.__final[item].star_pos,
-                    self.__final[item + 1].star_pos,
-                )
-                self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
+            points[next_idx].data[EdsmKeys.DISTANCE] = float(min_distance)
+            self.__final.append(points[next_idx])
+            remaining.remove(next_idx)
+            current = next_idx  # Aktualizujemy bieżący punkt
 
         end_t: float = time.time()
         self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
@@ -868,12 +1295,10 @@ class AlgGeneric(IAlg, BLogClient):
     def final_distance(self) -> float:
         if not self.__final:
             return 0.0
-        dist: float = self.__math.distance(
-            self.__start_point.star_pos, self.__final[0].star_pos
-        )
+        dist: float = self.__math.system_distance(self.__start_point, self.__final[0])
         for item in range(len(self.__final) - 1):
-            dist += self.__math.distance(
-                self.__final[item].star_pos, self.__final[item + 1].star_pos
+            dist += self.__math.system_distance(
+                self.__final[item], self.__final[item + 1]
             )
         return dist if dist else 0.0
 
@@ -899,6 +1324,7 @@ class AlgGenetic(IAlg, BLogClient):
     __mutation_rate: float = None  # type: ignore
     __crossover_rate: float = None  # type: ignore
     __stagnation_limit: int = None  # type: ignore
+    __matrix: Any = None  # type: ignore
 
     def __init__(
         self,
@@ -975,71 +1401,56 @@ class AlgGenetic(IAlg, BLogClient):
         self.__mutation_rate = 0.01
         self.__crossover_rate = 0.4
 
-    def __generate_individual(self) -> List[StarsSystem]:
-        individual: List[StarsSystem] = [self.__start_point]
-        source_points = self.__active_points or []
-        remaining_points: List[StarsSystem] = source_points[:]
+    def __generate_individual(self) -> List[int]:
+        """Build greedy nearest-neighbour route as list of matrix indexes."""
+        individual: List[int] = [0]
+        remaining_points: List[int] = list(range(1, len(self.__matrix)))
         while remaining_points:
-            closest_point: StarsSystem = min(
-                remaining_points,
-                key=lambda point: self.__math.distance(
-                    individual[-1].star_pos, point.star_pos
-                ),
-            )
-            if (
-                self.__math.distance(individual[-1].star_pos, closest_point.star_pos)
-                > self.__jump_range
-            ):
+            row = self.__matrix[individual[-1]]
+            closest_point: int = min(remaining_points, key=row.__getitem__)
+            if row[closest_point] > self.__jump_range:
                 break
             individual.append(closest_point)
             remaining_points.remove(closest_point)
         return individual
 
-    def __generate_population(self) -> List[List[StarsSystem]]:
-        population: List[List[StarsSystem]] = []
-        for _ in range(self.__population_size):
-            population.append(self.__generate_individual())
-        return population
+    def __generate_population(self) -> List[List[int]]:
+        # greedy construction is deterministic, so it is built only once
+        individual: List[int] = self.__generate_individual()
+        return [individual[:] for _ in range(self.__population_size)]
 
-    def __get_fitness(self, individual: List[StarsSystem]) -> float:
-        distance: float = 0
-        for i in range(len(individual) - 1):
-            segment = self.__math.distance(
-                individual[i].star_pos, individual[i + 1].star_pos
-            )
-            if segment > self.__jump_range:
-                return 0.0
-            distance += segment
-        return 1 / distance if distance > 0 else float("inf")
+    def __get_fitness(self, population: List[List[int]]) -> List[float]:
+        """Return fitness values for the whole population."""
+        out: List[float] = []
+        for length in _population_lengths(self.__matrix, population, self.__jump_range):
+            out.append(1 / length if 0 < length < float("inf") else 0.0)
+        return out
 
     def __select_parents(
-        self, population: List[List[StarsSystem]]
-    ) -> Tuple[List[StarsSystem], List[StarsSystem]]:
-        parent1: List[StarsSystem]
-        parent2: List[StarsSystem]
-        parent1, parent2 = random.choices(
-            population,
-            weights=[self.__get_fitness(individual) for individual in population],
-            k=2,
-        )
-        return parent1, parent2
+        self, population: List[List[int]], fitnesses: List[float], count: int
+    ) -> List[Tuple[List[int], List[int]]]:
+        """Select `count` pairs of parents using generation fitness array."""
+        selected: List[int] = _roulette_select(fitnesses, count * 2)
+        return [
+            (population[selected[idx]], population[selected[idx + 1]])
+            for idx in range(0, len(selected), 2)
+        ]
 
-    def __crossover(
-        self, parent1: List[StarsSystem], parent2: List[StarsSystem]
-    ) -> List[StarsSystem]:
-        if random.random() > self.__crossover_rate:
+    def __crossover(self, parent1: List[int], parent2: List[int]) -> List[int]:
+        if random.random() > self.__crossover_rate or len(parent1) < 3:
             return parent1
         crossover_point: int = random.randint(1, len(parent1) - 2)
-        child: List[StarsSystem] = parent1[:crossover_point] + [
-            point for point in parent2 if point not in parent1[:crossover_point]
-        ]
+        head: List[int] = parent1[:crossover_point]
+        used = set(head)
+        child: List[int] = head + [point for point in parent2 if point not in used]
         return child
 
-    def __mutate(self, individual: List[StarsSystem]) -> List[StarsSystem]:
+    def __mutate(self, individual: List[int]) -> List[int]:
         mutation_point1: int
         mutation_point2: int
-        if random.random() > self.__mutation_rate:
+        if random.random() > self.__mutation_rate or len(individual) < 4:
             return individual
+        individual = individual[:]
         mutation_point1, mutation_point2 = random.sample(
             range(1, len(individual) - 1), 2
         )
@@ -1049,21 +1460,20 @@ class AlgGenetic(IAlg, BLogClient):
         )
         return individual
 
-    def __evolve(self) -> List[StarsSystem]:
-        population: List[List[StarsSystem]] = self.__generate_population()
-        best_individual: List[StarsSystem] = None  # type: ignore
+    def __evolve(self) -> List[int]:
+        population: List[List[int]] = self.__generate_population()
+        best_individual: List[int] = None  # type: ignore
         target_length = len(self.__active_points or []) + 1
 
         for _ in range(self.__generations):
-            fitnesses: List[float] = [
-                self.__get_fitness(individual) for individual in population
-            ]
+            fitnesses: List[float] = self.__get_fitness(population)
             best_individual = population[fitnesses.index(max(fitnesses))]
-            if len(best_individual) >= target_length:
+            if len(best_individual) >= target_length or self.cancelled:
                 break
-            new_population: List[List[StarsSystem]] = [best_individual]
-            while len(new_population) < self.__population_size:
-                parent1, parent2 = self.__select_parents(population)
+            new_population: List[List[int]] = [best_individual]
+            for parent1, parent2 in self.__select_parents(
+                population, fitnesses, self.__population_size - 1
+            ):
                 child = self.__crossover(parent1, parent2)
                 child = self.__mutate(child)
                 new_population.append(child)
@@ -1085,19 +1495,18 @@ class AlgGenetic(IAlg, BLogClient):
         self.__population_size = max(points_count * 3, 6)
         self.__generations = max(200, points_count * 40)
         self.__stagnation_limit = max(25, points_count * 5)
-        self.__final = self.__evolve() or []
-        if self.__start_point in self.__final:
-            self.__final.remove(self.__start_point)
+        points: List[StarsSystem] = [self.__start_point] + self.__active_points
+        self.__matrix = distance_matrix(points, self.__math)
+        best: List[int] = self.__evolve() or []
+        self.__final = [points[idx] for idx in best if idx != 0]
         # update distance
         d_sum: float = 0.0
-        start: StarsSystem = self.__start_point
-        for item in self.__final:
-            end: StarsSystem = item
-            end.data[EdsmKeys.DISTANCE] = self.__math.distance(
-                start.star_pos, end.star_pos
-            )
-            d_sum += end.data[EdsmKeys.DISTANCE]
-            start = end
+        prev: int = 0
+        for idx in best[1:]:
+            dist: float = float(self.__matrix[prev][idx])
+            points[idx].data[EdsmKeys.DISTANCE] = dist
+            d_sum += dist
+            prev = idx
         self.debug(currentframe(), f"FINAL Distance: {d_sum:.2f} ly")
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
@@ -1114,12 +1523,10 @@ class AlgGenetic(IAlg, BLogClient):
     def final_distance(self) -> float:
         if not self.__final:
             return 0.0
-        dist: float = self.__math.distance(
-            self.__start_point.star_pos, self.__final[0].star_pos
-        )
+        dist: float = self.__math.system_distance(self.__start_point, self.__final[0])
         for item in range(len(self.__final) - 1):
-            dist += self.__math.distance(
-                self.__final[item].star_pos, self.__final[item + 1].star_pos
+            dist += self.__math.system_distance(
+                self.__final[item], self.__final[item + 1]
             )
         return dist if dist else 0.0
 
@@ -1141,9 +1548,10 @@ class AlgGenetic2(IAlg, BLogClient):
     __population_size: int = None  # type: ignore
     __generations: int = None  # type: ignore
     __mutation_rate: float = None  # type: ignore
-    __population: List[List[StarsSystem]] = None  # type: ignore
+    __population: List[List[int]] = None  # type: ignore
     __stagnation_limit: int = None  # type: ignore
     __active_points: List[StarsSystem] = None  # type: ignore
+    __matrix: Any = None  # type: ignore
 
     def __init__(
         self,
@@ -1271,98 +1679,73 @@ class AlgGenetic2(IAlg, BLogClient):
     def __initialize_population(self) -> None:
         """Initialize the population with random routes."""
         self.__population = []
-        active = self.__active_points or []
+        active: List[int] = list(range(1, len(self.__active_points or []) + 1))
         for _ in range(self.__population_size):
-            route: List[StarsSystem] = active[:]
+            route: List[int] = active[:]
             random.shuffle(route)
             self.__population.append(route)
 
-    def __fitness(self, route: List[StarsSystem]) -> float:
-        """Calculate the fitness (inverse of the total route distance)."""
-        total_distance = 0.0
-        current_point: StarsSystem = self.__start_point
-        for system in route:
-            segment = self.__math.distance(
-                current_point.star_pos, system.star_pos
-            )
-            if segment > self.__jump_range:
-                return 0.0
-            total_distance += segment
-            current_point = system
-        # Add distance back to the start if needed (optional for closed loop)
-        return 1 / total_distance if total_distance > 0 else 0.0
-
-    def __selection(self) -> Tuple[List[StarsSystem], List[StarsSystem]]:
-        """Select two parents based on their fitness (roulette wheel selection)."""
-        fitness_values: List[float] = [
-            self.__fitness(route) for route in self.__population
-        ]
-        total_fitness: float = sum(fitness_values)
-        if total_fitness == 0:
-            parent1 = random.choice(self.__population)
-            parent2 = random.choice(self.__population)
-        else:
-            probabilities: List[float] = [f / total_fitness for f in fitness_values]
-            parent1 = random.choices(
-                self.__population, weights=probabilities, k=1
-            )[0]
-            parent2 = random.choices(
-                self.__population, weights=probabilities, k=1
-            )[0]
-
-        return parent1, parent2
-
-    def __crossover(
-        self, parent1: List[StarsSystem], parent2: List[StarsSystem]
-    ) -> List[StarsSystem]:
-        """Perform Order Crossover (OX) to generate a child route."""
-        start_idx: int = random.randint(0, len(parent1) - 1)
-        end_idx: int = random.randint(start_idx, len(parent1) - 1)
+    def __fitness(self) -> List[float]:
+        """Calculate the fitness (inverse of the total route distance).
 
-        child: List[StarsSystem] = [None] * len(parent1)  # type: ignore
-        child[start_idx:end_idx] = parent1[start_idx:end_idx]
+        Returns fitness array for the whole current population.
+        """
+        out: List[float] = []
+        for length in _population_lengths(
+            self.__matrix,
+            [[0] + route for route in self.__population],
+            self.__jump_range,
+        ):
+            out.append(1 / length if 0 < length < float("inf") else 0.0)
+        return out
 
-        current_pos: int = end_idx
-        for system in parent2:
-            if system not in child:
-                if current_pos >= len(parent1):
-                    current_pos = 0
-                child[current_pos] = system
-                current_pos += 1
+    def __selection(
+        self, fitness_values: List[float]
+    ) -> List[Tuple[List[int], List[int]]]:
+        """Select parents based on their fitness (roulette wheel selection).
 
-        return child
+        All pairs for the next generation are drawn at once.
+        """
+        count: int = self.__population_size // 2
+        selected: List[int] = _roulette_select(fitness_values, count * 2)
+        return [
+            (self.__population[selected[idx]], self.__population[selected[idx + 1]])
+            for idx in range(0, len(selected), 2)
+        ]
+
+    def __crossover(self, parent1: List[int], parent2: List[int]) -> List[int]:
+        """Perform Order Crossover (OX) to generate a child route."""
+        return _order_crossover(parent1, parent2)
 
-    def __mutate(self, route: List[StarsSystem]) -> None:
+    def __mutate(self, route: List[int]) -> None:
         """Perform swap mutation with a given probability."""
-        if len(route) <= 1:
-            return
-        if random.random() < self.__mutation_rate:
-            idx1: int = random.randint(0, len(route) - 1)
-            idx2: int = random.randint(0, len(route) - 1)
-            route[idx1], route[idx2] = route[idx2], route[idx1]
+        _swap_mutation(route, self.__mutation_rate)
 
-    def __evolve(self) -> List[StarsSystem]:
+    def __evolve(self) -> List[int]:
         """Run the evolutionary algorithm over several generations."""
         self.__initialize_population()
-        best_route: Optional[List[StarsSystem]] = None
+        best_route: Optional[List[int]] = None
         best_fitness: float = float("-inf")
         stagnant_generations = 0
         target_length = len(self.__active_points or [])
+        fitness_values: List[float] = self.__fitness()
 
         for _ in range(self.__generations):
-            new_population = []
-            for _ in range(self.__population_size // 2):  # Generate new population
-                parent1, parent2 = self.__selection()
-                child1: List[StarsSystem] = self.__crossover(parent1, parent2)
-                child2: List[StarsSystem] = self.__crossover(parent2, parent1)
+            if self.cancelled:
+                break
+            new_population: List[List[int]] = []
+            for parent1, parent2 in self.__selection(fitness_values):
+                child1: List[int] = self.__crossover(parent1, parent2)
+                child2: List[int] = self.__crossover(parent2, parent1)
                 self.__mutate(child1)
                 self.__mutate(child2)
                 new_population.extend([child1, child2])
 
             # Replace old population with new population
             self.__population = new_population
-            current_best = max(self.__population, key=self.__fitness)
-            current_fitness = self.__fitness(current_best)
+            fitness_values = self.__fitness()
+            current_fitness: float = max(fitness_values)
+            current_best = self.__population[fitness_values.index(current_fitness)]
             if current_fitness > best_fitness:
                 best_fitness = current_fitness
                 best_route = current_best
@@ -1376,7 +1759,7 @@ class AlgGenetic2(IAlg, BLogClient):
                 break
 
         if best_route is None:
-            best_route = max(self.__population, key=self.__fitness)
+            best_route = self.__population[fitness_values.index(max(fitness_values))]
         return best_route
 
     def run(self) -> None:
@@ -1391,7 +1774,6 @@ class AlgGenetic2(IAlg, BLogClient):
 
         if not self.__active_points:
             self.__final = []
-            self.__total_distance = 0.0
             return
 
         points_count = max(len(self.__active_points), 1)
@@ -1399,40 +1781,28 @@ class AlgGenetic2(IAlg, BLogClient):
         self.__generations = max(100, points_count * 20)
         self.__stagnation_limit = max(25, points_count * 5)
         self.__population = []
-        best_route = self.__evolve()
+        points: List[StarsSystem] = [self.__start_point] + self.__active_points
+        self.__matrix = distance_matrix(points, self.__math)
+        best_route: List[int] = self.__evolve()
 
-        ordered: List[StarsSystem] = []
-        current = self.__start_point
-        remaining = best_route[:]
+        ordered: List[int] = []
+        current: int = 0
+        remaining: List[int] = best_route[:]
         while remaining:
-            next_point = min(
-                remaining,
-                key=lambda point: self.__math.distance(
-                    current.star_pos, point.star_pos
-                ),
-            )
-            if (
-                self.__math.distance(current.star_pos, next_point.star_pos)
-                > self.__jump_range
-            ):
+            row = self.__matrix[current]
+            next_point: int = min(remaining, key=row.__getitem__)
+            if row[next_point] > self.__jump_range:
                 break
             ordered.append(next_point)
             remaining.remove(next_point)
             current = next_point
-        self.__final = ordered
+        self.__final = [points[idx] for idx in ordered]
 
         # update distance
-        if self.__final:
-            dist: float = self.__math.distance(
-                self.__start_point.star_pos, self.__final[0].star_pos
-            )
-            self.__final[0].data[EdsmKeys.DISTANCE] = dist
-            for item in range(len(self.__final) - 1):
-                dist = self.__math.distance(
-                    self.__final[item].star_pos,
-                    self.__final[item + 1].star_pos,
-                )
-                self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
+        prev: int = 0
+        for idx in ordered:
+            points[idx].data[EdsmKeys.DISTANCE] = float(self.__matrix[prev][idx])
+            prev = idx
 
         end_t: float = time.time()
         self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
@@ -1451,12 +1821,10 @@ class AlgGenetic2(IAlg, BLogClient):
     def final_distance(self) -> float:
         if not self.__final:
             return 0.0
-        dist: float = self.__math.distance(
-            self.__start_point.star_pos, self.__final[0].star_pos
-        )
+        dist: float = self.__math.system_distance(self.__start_point, self.__final[0])
         for item in range(len(self.__final) - 1):
-            dist += self.__math.distance(
-                self.__final[item].star_pos, self.__final[item + 1].star_pos
+            dist += self.__math.system_distance(
+                self.__final[item], self.__final[item + 1]
             )
         return dist if dist else 0.0
 
@@ -1466,6 +1834,588 @@ class AlgGenetic2(IAlg, BLogClient):
         return self.__final
 
 
+class AlgGeneticParallel(IAlg, BLogClient):
+    """Island model of genetic algorithm.
+
+    Several AlgGenetic2-like populations evolve in worker processes of a
+    pool shared by all runs, each with its own seed. Without a usable
+    Python interpreter for the workers at most IN_PROCESS_ISLANDS islands
+    evolve in process. After every epoch the best routes of each island
+    migrate to the next island in the ring, replacing its worst routes.
+    """
+
+    # number of islands evolved without the process pool
+    IN_PROCESS_ISLANDS: int = 2
+
+    __plugin_name: str = None  # type: ignore
+    __math: Euclid = None  # type: ignore
+    __final: List[StarsSystem] = None  # type: ignore
+
+    __points: List[StarsSystem] = None  # type: ignore
+    __start_point: StarsSystem = None  # type: ignore
+    __jump_range: int = None  # type: ignore
+    __islands: int = None  # type: ignore
+    __migrants: int = None  # type: ignore
+    __mutation_rate: float = None  # type: ignore
+    __seed: int = None  # type: ignore
+    __matrix_data: Any = None  # type: ignore
+    __total_distance: float = 0.0
+
+    def __init__(
+        self,
+        start: StarsSystem,
+        systems: List[StarsSystem],
+        jump_range: int,
+        log_queue: Optional[Union[Queue, SimpleQueue]],
+        euclid_alg: Euclid,
+        plugin_name: str,
+        islands: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Construct instance object.
+
+        params:
+        start: StarsSystem - object with starting position.
+        systems: list(StarsSystem,...) - list with point of interest to visit
+        jump_range: int - jump range in ly
+        log_queue: queue for LogClient
+        euclid_alg: Euclid - object of initialized vectors class
+        plugin_name: str - name of plugin for debug log
+        islands: Optional[int] - number of populations, defaults to cpu count
+        seed: Optional[int] - base seed for the islands random generators
+        """
+        self.__plugin_name = plugin_name
+        # init log subsystem
+        if isinstance(log_queue, (Queue, SimpleQueue)):
+            self.logger = LogClient(log_queue)
+        else:
+            raise Raise.error(
+                f"Queue or SimpleQueue type expected, '{type(log_queue)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        # Euclid's algorithm for calculating the length of vectors
+        if isinstance(euclid_alg, Euclid):
+            self.__math = euclid_alg
+        else:
+            raise Raise.error(
+                f"Euclid type expected, '{type(euclid_alg)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if isinstance(jump_range, int):
+            self.__jump_range = jump_range
+        else:
+            raise Raise.error(
+                f"Int type expected, '{type(jump_range)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(start, StarsSystem):
+            raise Raise.error(
+                f"StarsSystem type expected, '{type(start)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(systems, list):
+            raise Raise.error(
+                f"list type expected, '{type(systems)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        self.debug(currentframe(), "Initialize dataset")
+
+        self.__start_point = start
+        self.__points = [
+            system for system in systems if isinstance(system, StarsSystem)
+        ]
+        self.__final = []
+        self.__total_distance = 0.0
+
+        self.__islands = max(2, islands or os.cpu_count() or 1)
+        self.__migrants = 2
+        self.__mutation_rate = 0.01
+        self.__seed = seed if seed is not None else random.getrandbits(32)
+
+    def __initial_population(
+        self, matrix: Any, size: int, seed: int
+    ) -> List[List[int]]:
+        """Return random island population seeded with the greedy route."""
+        rnd = random.Random(seed)
+        active: List[int] = list(range(1, len(matrix)))
+        population: List[List[int]] = []
+        greedy: List[int] = nearest_neighbour_route(matrix, self.__jump_range)
+        if len(greedy) == len(active):
+            population.append(greedy)
+        while len(population) < size:
+            route: List[int] = active[:]
+            rnd.shuffle(route)
+            population.append(route)
+        return population
+
+    def __migrate(
+        self, populations: List[List[List[int]]], bests: List[List[int]]
+    ) -> None:
+        """Replace the worst routes of each island with the best of its neighbour."""
+        for idx, population in enumerate(populations):
+            lengths: List[float] = _population_lengths(
+                self.__matrix_data,
+                [[0] + route for route in population],
+                self.__jump_range,
+            )
+            worst: List[int] = sorted(
+                range(len(population)), key=lengths.__getitem__, reverse=True
+            )
+            migrant: List[int] = bests[idx - 1]
+            for pos in worst[: self.__migrants]:
+                population[pos] = migrant[:]
+
+    def run(self) -> None:
+        """Run island populations and collect the best route."""
+        start_t: float = time.time()
+        active: List[StarsSystem] = _filter_reachable_points(
+            self.__start_point,
+            self.__points,
+            self.__math,
+            self.__jump_range,
+        )
+        self.__final = []
+        self.__total_distance = 0.0
+        if not active:
+            return
+
+        points: List[StarsSystem] = [self.__start_point] + active
+        matrix: Any = distance_matrix(points, self.__math)
+        self.__matrix_data = matrix
+
+        points_count: int = len(active)
+        population_size: int = max(20, points_count * 4)
+        generations: int = max(100, points_count * 20)
+        interval: int = max(10, generations // 20)
+        epochs: int = max(1, generations // interval)
+        stagnation_limit: int = 3
+
+        executor: Optional[ProcessPoolExecutor] = None
+        try:
+            executor = _island_pool()
+        except Exception as ex:
+            self.debug(currentframe(), f"Process pool unavailable: {ex}")
+        islands: int = self.__islands
+        if executor is None:
+            islands = min(islands, self.IN_PROCESS_ISLANDS)
+            self.debug(currentframe(), f"{islands} islands evolve in process.")
+
+        populations: List[List[List[int]]] = [
+            self.__initial_population(matrix, population_size, self.__seed + idx)
+            for idx in range(islands)
+        ]
+        best_route: List[int] = []
+        best_length: float = float("inf")
+        stagnant: int = 0
+
+        try:
+            for epoch in range(epochs):
+                if self.cancelled:
+                    break
+                seeds: List[int] = [
+                    self.__seed + (epoch + 1) * islands + idx for idx in range(islands)
+                ]
+                results: List[Tuple[List[List[int]], List[int], float]] = []
+                if executor is not None:
+                    try:
+                        futures = [
+                            executor.submit(
+                                _island_epoch,
+                                matrix,
+                                self.__jump_range,
+                                populations[idx],
+                                interval,
+                                self.__mutation_rate,
+                                seeds[idx],
+                            )
+                            for idx in range(islands)
+                        ]
+                        results = [future.result() for future in futures]
+                    except Exception as ex:
+                        self.debug(currentframe(), f"Process pool failed: {ex}")
+                        _island_pool_reset(executor)
+                        executor = None
+                if executor is None:
+                    results = [
+                        _island_epoch(
+                            matrix,
+                            self.__jump_range,
+                            populations[idx],
+                            interval,
+                            self.__mutation_rate,
+                            seeds[idx],
+                        )
+                        for idx in range(islands)
+                    ]
+
+                populations = [result[0] for result in results]
+                bests: List[List[int]] = [result[1] for result in results]
+                improved: bool = False
+                for _, route, length in results:
+                    if length < best_length:
+                        best_length = length
+                        best_route = route
+                        improved = True
+                stagnant = 0 if improved else stagnant + 1
+                if stagnant >= stagnation_limit:
+                    break
+                self.__migrate(populations, bests)
+        finally:
+            self.__matrix_data = None
+
+        if not best_route:
+            best_route = nearest_neighbour_route(matrix, self.__jump_range)
+
+        # build final route, stopping at the first jump out of range
+        prev: int = 0
+        for idx in best_route:
+            dist: float = float(matrix[prev][idx])
+            if dist > self.__jump_range:
+                break
+            points[idx].data[EdsmKeys.DISTANCE] = dist
+            self.__total_distance += dist
+            self.__final.append(points[idx])
+            prev = idx
+
+        end_t: float = time.time()
+        self.debug(
+            currentframe(),
+            f"{islands} islands took {end_t - start_t} seconds, "
+            f"FINAL Distance: {self.__total_distance:.2f} ly",
+        )
+
+    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
+        """Build debug message."""
+        p_name: str = f"{self.__plugin_name}"
+        c_name: str = f"{self._c_name}"
+        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if message != "":
+            message = f": {message}"
+        if self.logger:
+            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+
+    @property
+    def final_distance(self) -> float:
+        return self.__total_distance
+
+    @property
+    def get_final(self) -> List[StarsSystem]:
+        """Return final data."""
+        return self.__final
+
+
+class AlgAntColony(IAlg, BLogClient):
+    """Ant Colony Optimisation solving the problem of finding the best path.
+
+    Pheromone and visibility (1/distance) are kept in numpy matrices,
+    jumps longer than jump_range are masked out of the visibility matrix.
+    All ants of an iteration are constructed together as one batch.
+    Without numpy the greedy nearest neighbour route is returned.
+    """
+
+    __plugin_name: str = None  # type: ignore
+    __math: Euclid = None  # type: ignore
+    __final: List[StarsSystem] = None  # type: ignore
+
+    __points: List[StarsSystem] = None  # type: ignore
+    __start_point: StarsSystem = None  # type: ignore
+    __jump_range: int = None  # type: ignore
+    __variant: str = None  # type: ignore
+    __ants: Optional[int] = None
+    __alpha: float = None  # type: ignore
+    __beta: float = None  # type: ignore
+    __evaporation: float = None  # type: ignore
+    __elitist_weight: float = None  # type: ignore
+    __iterations: int = None  # type: ignore
+    __stagnation_limit: int = None  # type: ignore
+    __seed: Optional[int] = None
+    __total_distance: float = 0.0
+
+    def __init__(
+        self,
+        start: StarsSystem,
+        systems: List[StarsSystem],
+        jump_range: int,
+        log_queue: Optional[Union[Queue, SimpleQueue]],
+        euclid_alg: Euclid,
+        plugin_name: str,
+        variant: str = AntVariant.MMAS,
+        ants: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Construct instance object.
+
+        params:
+        start: StarsSystem - object with starting position.
+        systems: list(StarsSystem,...) - list with point of interest to visit
+        jump_range: int - jump range in ly
+        log_queue: queue for LogClient
+        euclid_alg: Euclid - object of initialized vectors class
+        plugin_name: str - name of plugin for debug log
+        variant: str - pheromone update variant, see AntVariant
+        ants: Optional[int] - number of ants in batch, default: targets count
+        seed: Optional[int] - seed for random generator
+        """
+        self.__plugin_name = plugin_name
+        # init log subsystem
+        if isinstance(log_queue, (Queue, SimpleQueue)):
+            self.logger = LogClient(log_queue)
+        else:
+            raise Raise.error(
+                f"Queue or SimpleQueue type expected, '{type(log_queue)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        # Euclid's algorithm for calculating the length of vectors
+        if isinstance(euclid_alg, Euclid):
+            self.__math = euclid_alg
+        else:
+            raise Raise.error(
+                f"Euclid type expected, '{type(euclid_alg)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if isinstance(jump_range, int):
+            self.__jump_range = jump_range
+        else:
+            raise Raise.error(
+                f"Int type expected, '{type(jump_range)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(start, StarsSystem):
+            raise Raise.error(
+                f"StarsSystem type expected, '{type(start)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(systems, list):
+            raise Raise.error(
+                f"list type expected, '{type(systems)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if variant not in (AntVariant.ELITIST, AntVariant.MMAS):
+            raise Raise.error(
+                f"Unknown variant: '{variant}'",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self.debug(currentframe(), "Initialize dataset")
+
+        self.__start_point = start
+        self.__points = [
+            system for system in systems if isinstance(system, StarsSystem)
+        ]
+        self.__final = []
+        self.__total_distance = 0.0
+
+        self.__variant = variant
+        self.__ants = ants
+        self.__seed = seed
+        self.__alpha = 1.0  # pheromone influence
+        self.__beta = 3.0  # visibility influence
+        self.__evaporation = 0.1
+        self.__elitist_weight = 2.0
+        self.__iterations = 200
+        self.__stagnation_limit = 40
+
+    def __construct(
+        self, rng: Any, tau: Any, eta_beta: Any, ants: int
+    ) -> Tuple[Any, Any]:
+        """Build routes for a batch of ants.
+
+        Returns (routes, counts): routes array (ants x targets) filled
+        with -1 after the last visited target and number of visited targets.
+        """
+        size: int = tau.shape[0]
+        routes = np.full((ants, size - 1), -1, dtype=np.intp)
+        visited = np.zeros((ants, size), dtype=bool)
+        visited[:, 0] = True
+        current = np.zeros(ants, dtype=np.intp)
+        active = np.ones(ants, dtype=bool)
+        attraction = (tau**self.__alpha) * eta_beta
+
+        for step in range(size - 1):
+            weights = attraction[current]
+            weights[visited] = 0.0
+            totals = weights.sum(axis=1)
+            active &= totals > 0
+            if not active.any():
+                break
+            cumulative = np.cumsum(weights, axis=1)
+            draw = rng.random(ants) * totals
+            chosen = (cumulative < draw[:, None]).sum(axis=1)
+            chosen = np.minimum(chosen, size - 1)
+            chosen[~active] = -1
+            rows = np.nonzero(active)[0]
+            routes[rows, step] = chosen[rows]
+            visited[rows, chosen[rows]] = True
+            current[rows] = chosen[rows]
+
+        return routes, (routes >= 0).sum(axis=1)
+
+    def __lengths(self, matrix: Any, routes: Any) -> Any:
+        """Return lengths of the batch routes."""
+        full = np.concatenate(
+            [np.zeros((routes.shape[0], 1), dtype=np.intp), routes], axis=1
+        )
+        valid = full[:, 1:] >= 0
+        segments = matrix[full[:, :-1], np.where(valid, full[:, 1:], 0)]
+        return np.where(valid, segments, 0.0).sum(axis=1)
+
+    def __deposit(self, tau: Any, route: Any, amount: float) -> None:
+        """Deposit pheromone on edges of the route."""
+        route = np.concatenate([[0], route[route >= 0]])
+        np.add.at(tau, (route[:-1], route[1:]), amount)
+        np.add.at(tau, (route[1:], route[:-1]), amount)
+
+    def __colony(self, matrix: Any) -> List[int]:
+        """Run ant colony over the distance matrix."""
+        rng = np.random.default_rng(
+            self.__seed if self.__seed is not None else random.getrandbits(64)
+        )
+        size: int = matrix.shape[0]
+        targets: int = size - 1
+        ants: int = self.__ants or max(10, min(targets, 100))
+
+        reachable = (matrix > 0) & (matrix <= self.__jump_range)
+        eta = np.zeros_like(matrix)
+        eta[reachable] = 1.0 / matrix[reachable]
+        eta_beta = eta**self.__beta
+
+        greedy: List[int] = nearest_neighbour_route(matrix, self.__jump_range)
+        best_route = np.asarray(greedy, dtype=np.intp)
+        best_count: int = len(greedy)
+        best_length: float = _route_length(matrix, [0] + greedy, self.__jump_range)
+        # penalty for every target left unvisited by an ant
+        penalty: float = 2.0 * self.__jump_range
+
+        def effective(count: int, length: float) -> float:
+            return length + (targets - count) * penalty
+
+        tau_max: float = 1.0 / (
+            self.__evaporation * max(effective(best_count, best_length), 1e-9)
+        )
+        tau_min: float = tau_max / (2.0 * size)
+        if self.__variant == AntVariant.MMAS:
+            tau = np.full_like(matrix, tau_max)
+        else:
+            tau = np.full_like(matrix, 1.0 / max(targets * best_length, 1e-9))
+
+        stagnant: int = 0
+        for _ in range(self.__iterations):
+            if self.cancelled:
+                break
+            routes, counts = self.__construct(rng, tau, eta_beta, ants)
+            lengths = self.__lengths(matrix, routes)
+            # best ant of iteration: most targets, then shortest route
+            order = np.lexsort((lengths, -counts))
+            it_best: int = int(order[0])
+            it_count: int = int(counts[it_best])
+            it_length: float = float(lengths[it_best])
+            if it_count > best_count or (
+                it_count == best_count and it_length < best_length
+            ):
+                best_route = routes[it_best].copy()
+                best_count = it_count
+                best_length = it_length
+                stagnant = 0
+            else:
+                stagnant += 1
+            if stagnant >= self.__stagnation_limit:
+                break
+
+            tau *= 1.0 - self.__evaporation
+            best_effective: float = max(effective(best_count, best_length), 1e-9)
+            if self.__variant == AntVariant.MMAS:
+                self.__deposit(tau, best_route, 1.0 / best_effective)
+                tau_max = 1.0 / (self.__evaporation * best_effective)
+                tau_min = tau_max / (2.0 * size)
+                np.clip(tau, tau_min, tau_max, out=tau)
+            else:
+                for idx in range(ants):
+                    ant_effective: float = effective(
+                        int(counts[idx]), float(lengths[idx])
+                    )
+                    self.__deposit(tau, routes[idx], 1.0 / max(ant_effective, 1e-9))
+                self.__deposit(tau, best_route, self.__elitist_weight / best_effective)
+
+        return [int(idx) for idx in best_route if idx >= 0]
+
+    def run(self) -> None:
+        """Run algorithm."""
+        start_t: float = time.time()
+        active: List[StarsSystem] = _filter_reachable_points(
+            self.__start_point,
+            self.__points,
+            self.__math,
+            self.__jump_range,
+        )
+        self.__final = []
+        self.__total_distance = 0.0
+        if not active:
+            return
+
+        points: List[StarsSystem] = [self.__start_point] + active
+        matrix: Any = distance_matrix(points, self.__math)
+        if np is None:
+            self.debug(currentframe(), "numpy not found, greedy route used")
+            route: List[int] = nearest_neighbour_route(matrix, self.__jump_range)
+        else:
+            route = self.__colony(matrix)
+
+        prev: int = 0
+        for idx in route:
+            dist: float = float(matrix[prev][idx])
+            points[idx].data[EdsmKeys.DISTANCE] = dist
+            self.__total_distance += dist
+            self.__final.append(points[idx])
+            prev = idx
+
+        end_t: float = time.time()
+        self.debug(
+            currentframe(),
+            f"Colony ({self.__variant}) took {end_t - start_t} seconds, "
+            f"FINAL Distance: {self.__total_distance:.2f} ly",
+        )
+
+    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
+        """Build debug message."""
+        p_name: str = f"{self.__plugin_name}"
+        c_name: str = f"{self._c_name}"
+        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if message != "":
+            message = f": {message}"
+        if self.logger:
+            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+
+    @property
+    def final_distance(self) -> float:
+        return self.__total_distance
+
+    @property
+    def get_final(self) -> List[StarsSystem]:
+        """Return final data."""
+        return self.__final
+
+
 class AlgSimulatedAnnealing(IAlg, BLogClient):
 
     __plugin_name: str = None  # type: ignore
@@ -1479,6 +2429,8 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
     __cooling_rate: float = 0.0
     __best_distance: float = float("inf")
     __current_solution: List[StarsSystem] = None  # type: ignore
+    __matrix: Any = None
+    __index: Dict[int, int] = None  # type: ignore
 
     def __init__(
         self,
@@ -1568,13 +2520,21 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
         # osiągnie bardzo niską wartość.
 
     def calculate_total_distance(self, path: List[StarsSystem]) -> float:
-        """Calculate the total distance of the path, starting from the start point."""
+        """Calculate the total distance of the path, starting from the start point.
+
+        Distances of the systems given to run() are taken from its local
+        matrix.
+        """
+        if self.__matrix is not None and all(id(star) in self.__index for star in path):
+            return _route_length(
+                self.__matrix,
+                [0] + [self.__index[id(star)] for star in path],
+                self.__jump_range,
+            )
         total_dist = 0
         current_star: StarsSystem = self.__start_point
         for next_star in path:
-            dist: float = self.__math.distance(
-                current_star.star_pos, next_star.star_pos
-            )
+            dist: float = self.__math.system_distance(current_star, next_star)
             if dist <= self.__jump_range:  # Only count valid jumps
                 total_dist += dist
             else:
@@ -1609,11 +2569,15 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
             self.__best_distance = float("inf")
             return
 
+        points: List[StarsSystem] = [self.__start_point] + systems
+        self.__matrix = distance_matrix(points, self.__math)
+        self.__index = {id(point): idx for idx, point in enumerate(points)}
+
         random.shuffle(self.__current_solution)
         self.__best_distance = self.calculate_total_distance(self.__current_solution)
 
         temperature: float = self.__initial_temp
-        while temperature > 1:
+        while temperature > 1 and not self.cancelled:
             # Create a new solution by swapping two random points
             new_solution: List[StarsSystem] = self.__current_solution[:]
             if len(new_solution) >= 2:
@@ -1640,14 +2604,13 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
 
         # update distance
         if self.__final:
-            dist: float = self.__math.distance(
-                self.__start_point.star_pos, self.__final[0].star_pos
+            dist: float = self.__math.system_distance(
+                self.__start_point, self.__final[0]
             )
             self.__final[0].data[EdsmKeys.DISTANCE] = dist
             for item in range(len(self.__final) - 1):
-                dist = self.__math.distance(
-                    self.__final[item].star_pos,
-                    self.__final[item + 1].star_pos,
+                dist = self.__math.system_distance(
+                    self.__final[item], self.__final[item + 1]
                 )
                 self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
 
@@ -1668,12 +2631,10 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
     def final_distance(self) -> float:
         if not self.__final:
             return 0.0
-        dist: float = self.__math.distance(
-            self.__start_point.star_pos, self.__final[0].star_pos
-        )
+        dist: float = self.__math.system_distance(self.__start_point, self.__final[0])
         for item in range(len(self.__final) - 1):
-            dist += self.__math.distance(
-                self.__final[item].star_pos, self.__final[item + 1].star_pos
+            dist += self.__math.system_distance(
+                self.__final[item], self.__final[item + 1]
             )
         return dist if dist else 0.0
 
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+"""
+planner.py
+Author : Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 19.10.2026, 10:12:40
+
+Purpose: Time-budgeted portfolio of route solvers with progressive results.
+"""
+
+from __future__ import annotations
+
+import time
+
+from inspect import currentframe
+from queue import Queue, SimpleQueue, Empty
+from threading import Event, Thread, Lock
+from typing import (
+    Any,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    Callable,
+    Iterator,
+    Type,
+    Dict,
+)
+from types import FrameType
+
+from ..raisetool import Raise
+from .base import BLogClient
+from .logs import LogClient
+from .stars import StarsSystem
+from .edsm_keys import EdsmKeys
+from .math import (
+    IAlg,
+    Euclid,
+    AlgGeneric,
+    AlgGenetic2,
+    AlgSimulatedAnnealing,
+    AlgTsp,
+    distance_matrix,
+    nearest_neighbour_route,
+    route_prefix,
+    two_opt,
+)
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+
+class RoutePlanner(BLogClient):
+    """RoutePlanner.
+
+    Runs several IAlg solvers concurrently under a wall-clock deadline
+    and reports every route better than the best one found so far.
+    A route is better if it visits more targets, or the same number of
+    targets over a shorter distance.
+
+    Solvers run in threads sharing the GIL, so the portfolio gives
+    diversity of results, not parallel speedup. At the deadline the
+    running solvers are cancelled and stop at their next iteration.
+
+    After a jump off the planned route, replan() updates the remaining
+    part of the route from the new position within a small time budget.
+    """
+
+    # maximum number of cached distance matrix points for re-planning
+    CACHE_LIMIT: int = 512
+
+    # maximum number of targets for exact (permutations) solver
+    EXACT_LIMIT: int = 8
+
+    # time in seconds to wait for cancelled solvers to stop
+    CANCEL_TIMEOUT: float = 1.0
+
+    __plugin_name: str = None  # type: ignore
+    __math: Euclid = None  # type: ignore
+    __start_point: StarsSystem = None  # type: ignore
+    __points: List[StarsSystem] = None  # type: ignore
+    __jump_range: int = None  # type: ignore
+    __solvers: List[Type[IAlg]] = None  # type: ignore
+    __best: List[StarsSystem] = None  # type: ignore
+    __best_distance: float = 0.0
+    __best_solver: str = ""
+    __lock: Lock = None  # type: ignore
+    __matrix: Any = None
+    __matrix_keys: Dict[Any, int] = None  # type: ignore
+    __matrix_points: List[StarsSystem] = None  # type: ignore
+
+    def __init__(
+        self,
+        start: StarsSystem,
+        systems: List[StarsSystem],
+        jump_range: int,
+        log_queue: Optional[Union[Queue, SimpleQueue]],
+        euclid_alg: Euclid,
+        plugin_name: str,
+        solvers: Optional[List[Type[IAlg]]] = None,
+    ) -> None:
+        """Construct instance object.
+
+        params:
+        start: StarsSystem - object with starting position.
+        systems: list(StarsSystem,...) - list with point of interest to visit
+        jump_range: int - jump range in ly
+        log_queue: queue for LogClient
+        euclid_alg: Euclid - object of initialized vectors class
+        plugin_name: str - name of plugin for debug log
+        solvers: Optional[list] - IAlg classes to run, default portfolio if None
+        """
+        self.__plugin_name = plugin_name
+        # init log subsystem
+        if isinstance(log_queue, (Queue, SimpleQueue)):
+            self.logger = LogClient(log_queue)
+        else:
+            raise Raise.error(
+                f"Queue or SimpleQueue type expected, '{type(log_queue)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if isinstance(euclid_alg, Euclid):
+            self.__math = euclid_alg
+        else:
+            raise Raise.error(
+                f"Euclid type expected, '{type(euclid_alg)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if isinstance(jump_range, int):
+            self.__jump_range = jump_range
+        else:
+            raise Raise.error(
+                f"Int type expected, '{type(jump_range)}' received",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(start, StarsSystem):
+            raise Raise.error(
+                f"StarsSystem type expected, '{type(start)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(systems, list):
+            raise Raise.error(
+                f"list type expected, '{type(systems)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__start_point = start
+        self.__points = [
+            system for system in systems if isinstance(system, StarsSystem)
+        ]
+        if solvers is None:
+            solvers = [AlgGeneric, AlgSimulatedAnnealing, AlgGenetic2]
+            if len(self.__points) <= self.EXACT_LIMIT:
+                solvers.append(AlgTsp)
+        self.__solvers = solvers
+        self.__best = []
+        self.__best_distance = 0.0
+        self.__lock = Lock()
+        self.__matrix_keys = {}
+        self.__matrix_points = []
+        self.debug(currentframe(), f"Initialize dataset, solvers: {solvers}")
+
+    def __clone(self, system: StarsSystem) -> StarsSystem:
+        """Return copy of the system for exclusive use by one solver."""
+        out = StarsSystem(system.name, system.address, system.star_pos)
+        out.star_class = system.star_class
+        out.data = dict(system.data)
+        return out
+
+    def __worker(
+        self,
+        solver: Type[IAlg],
+        results: SimpleQueue,
+        running: List[IAlg],
+        stop: Event,
+    ) -> None:
+        """Run a solver on private copies of the systems."""
+        originals: Dict[int, StarsSystem] = {}
+        systems: List[StarsSystem] = []
+        for system in self.__points:
+            clone: StarsSystem = self.__clone(system)
+            originals[id(clone)] = system
+            systems.append(clone)
+        try:
+            alg: IAlg = solver(
+                self.__clone(self.__start_point),
+                systems,
+                self.__jump_range,
+                self.logger.queue,
+                self.__math,
+                self.__plugin_name,
+            )  # type: ignore
+            with self.__lock:
+                running.append(alg)
+                if stop.is_set():
+                    alg.cancel()
+            alg.run()
+            route: List[Tuple[StarsSystem, Optional[float]]] = [
+                (originals[id(system)], system.data.get(EdsmKeys.DISTANCE))
+                for system in alg.get_final
+                if id(system) in originals
+            ]
+            results.put((solver.__name__, route, alg.final_distance))
+        except Exception as ex:
+            self.debug(currentframe(), f"{solver.__name__} failed: {ex}")
+            results.put((solver.__name__, None, 0.0))
+
+    def __is_better(self, count: int, distance: float) -> bool:
+        """Check if route is better than the best one."""
+        if count != len(self.__best):
+            return count > len(self.__best)
+        return distance < self.__best_distance
+
+    def routes(self, timeout: float) -> Iterator[Tuple[str, List[StarsSystem], float]]:
+        """Run solvers and yield each improving route until the deadline.
+
+        Yields tuples: (solver name, route, route distance).
+        Solvers still running at the deadline, or when the iteration is
+        closed, are cancelled and their results are ignored.
+        """
+        deadline: float = time.time() + timeout
+        results: SimpleQueue = SimpleQueue()
+        running: List[IAlg] = []
+        threads: List[Thread] = []
+        stop = Event()
+        with self.__lock:
+            self.__best = []
+            self.__best_distance = 0.0
+            self.__best_solver = ""
+        for solver in self.__solvers:
+            th = Thread(
+                target=self.__worker,
+                args=(solver, results, running, stop),
+                name=f"{self.__plugin_name} {solver.__name__} worker",
+                daemon=True,
+            )
+            th.start()
+            threads.append(th)
+
+        try:
+            yield from self.__collect(results, len(self.__solvers), deadline)
+        finally:
+            self.__cancel(running, threads, stop)
+
+    def __cancel(self, running: List[IAlg], threads: List[Thread], stop: Event) -> None:
+        """Cancel running solvers and wait up to CANCEL_TIMEOUT for them."""
+        with self.__lock:
+            stop.set()
+            for alg in running:
+                alg.cancel()
+        deadline: float = time.time() + self.CANCEL_TIMEOUT
+        for th in threads:
+            th.join(max(0.0, deadline - time.time()))
+        alive: int = sum(1 for th in threads if th.is_alive())
+        if alive:
+            self.debug(currentframe(), f"{alive} cancelled solvers still running")
+
+    def __collect(
+        self, results: SimpleQueue, pending: int, deadline: float
+    ) -> Iterator[Tuple[str, List[StarsSystem], float]]:
+        """Yield improving routes from the results queue until the deadline."""
+        while pending:
+            remaining: float = deadline - time.time()
+            if remaining <= 0:
+                self.debug(currentframe(), f"Deadline reached, {pending} running")
+                break
+            try:
+                name, route, distance = results.get(timeout=remaining)
+            except Empty:
+                continue
+            pending -= 1
+            if route is None:
+                continue
+            with self.__lock:
+                if not self.__is_better(len(route), distance):
+                    continue
+                for system, dist in route:
+                    if dist is not None:
+                        system.data[EdsmKeys.DISTANCE] = dist
+                self.__best = [system for system, _ in route]
+                self.__best_distance = distance
+                self.__best_solver = name
+                best: List[StarsSystem] = self.__best[:]
+            self.debug(
+                currentframe(),
+                f"{name}: {len(best)} targets, {distance:.2f} ly",
+            )
+            yield name, best, distance
+
+    def run(
+        self,
+        timeout: float,
+        callback: Optional[Callable[[str, List[StarsSystem], float], None]] = None,
+    ) -> List[StarsSystem]:
+        """Run solvers until the deadline and return the best route.
+
+        The optional callback is called with every improving route.
+        """
+        for name, route, distance in self.routes(timeout):
+            if callback is not None:
+                callback(name, route, distance)
+        return self.get_final
+
+    def __key(self, system: StarsSystem) -> Any:
+        """Return distance cache key of the system.
+
+        The key is the address, or name with position if the address is
+        not known. Returns None if there is neither.
+        """
+        if system.address is not None:
+            return system.address
+        if system.name:
+            return (system.name, *system.star_pos)
+        return None
+
+    def __cached_matrix(self, points: List[StarsSystem]) -> Any:
+        """Return distance matrix of points, reusing cached rows.
+
+        Only rows of points missing from the cache are computed. If any
+        point has no cache key, the matrix is computed without the cache.
+        """
+        if any(self.__key(point) is None for point in points):
+            return distance_matrix(points, self.__math)
+        missing: List[StarsSystem] = []
+        for point in points:
+            key: Any = self.__key(point)
+            if key not in self.__matrix_keys:
+                self.__matrix_keys[key] = -1
+                missing.append(point)
+        if len(self.__matrix_points) + len(missing) > self.CACHE_LIMIT:
+            self.__matrix = None
+            self.__matrix_points = []
+            self.__matrix_keys = {}
+            missing = points[:]
+        if missing:
+            old: int = len(self.__matrix_points)
+            self.__matrix_points.extend(missing)
+            for idx in range(old, len(self.__matrix_points)):
+                self.__matrix_keys[self.__key(self.__matrix_points[idx])] = idx
+            if self.__matrix is None:
+                self.__matrix = distance_matrix(self.__matrix_points, self.__math)
+            elif np is not None:
+                pos = np.array(
+                    [point.star_pos for point in self.__matrix_points],
+                    dtype=np.float64,
+                )
+                diff = pos[old:, None, :] - pos[None, :, :]
+                rows = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+                matrix = np.empty((len(pos), len(pos)), dtype=np.float64)
+                matrix[:old, :old] = self.__matrix
+                matrix[old:, :] = rows
+                matrix[:old, old:] = rows[:, :old].T
+                self.__matrix = matrix
+            else:
+                for row in self.__matrix:
+                    row.extend([0.0] * len(missing))
+                for idx in range(old, len(self.__matrix_points)):
+                    row = [
+                        self.__math.distance(
+                            self.__matrix_points[idx].star_pos, point.star_pos
+                        )
+                        for point in self.__matrix_points
+                    ]
+                    self.__matrix.append(row)
+                    for idx2 in range(idx):
+                        self.__matrix[idx2][idx] = row[idx2]
+        index: List[int] = [self.__matrix_keys[self.__key(point)] for point in points]
+        if np is not None:
+            return self.__matrix[np.ix_(index, index)]
+        return [[self.__matrix[idx][idx2] for idx2 in index] for idx in index]
+
+    def replan(
+        self,
+        route: List[StarsSystem],
+        position: StarsSystem,
+        timeout: float = 0.2,
+    ) -> List[StarsSystem]:
+        """Update route after a jump to the given position.
+
+        params:
+        route: list(StarsSystem,...) - previously planned route
+        position: StarsSystem - current position of the commander
+        timeout: float - time budget in seconds
+
+        If the position is a waypoint of the route, the part up to it is
+        dropped. The remaining waypoints are reordered from the position
+        by 2-opt local search warm-started from the previous order and
+        from a greedy route. Distance matrix rows are cached between
+        calls, so only rows of new positions are computed.
+        Returns the new route, also available from get_final.
+        """
+        deadline: float = time.time() + timeout
+        tail: List[StarsSystem] = route[:]
+        key: Any = self.__key(position)
+        for idx, system in enumerate(route):
+            if (
+                key is not None and self.__key(system) == key
+            ) or system.star_pos == position.star_pos:
+                tail = route[idx + 1 :]
+                break
+        matrix: Any = self.__cached_matrix([position] + tail)
+        warm: List[int] = list(range(1, len(tail) + 1))
+        greedy: List[int] = nearest_neighbour_route(matrix, self.__jump_range)
+        visited: set = set(greedy)
+        greedy.extend(idx for idx in warm if idx not in visited)
+        best: List[int] = []
+        best_score: Tuple[int, float] = (-1, 0.0)
+        for candidate in (warm, greedy):
+            candidate = two_opt(matrix, candidate, self.__jump_range, deadline)
+            count, length = route_prefix(matrix, candidate, self.__jump_range)
+            if count > best_score[0] or (
+                count == best_score[0] and length < best_score[1]
+            ):
+                best, best_score = candidate, (count, length)
+
+        out: List[StarsSystem] = []
+        current: int = 0
+        for idx in best[: best_score[0]]:
+            tail[idx - 1].data[EdsmKeys.DISTANCE] = float(matrix[current][idx])
+            out.append(tail[idx - 1])
+            current = idx
+        with self.__lock:
+            self.__best = out
+            self.__best_distance = best_score[1]
+            self.__best_solver = "replan"
+        self.debug(
+            currentframe(),
+            f"{len(out)}/{len(tail)} targets, {best_score[1]:.2f} ly",
+        )
+        return out[:]
+
+    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
+        """Build debug message."""
+        p_name: str = f"{self.__plugin_name}"
+        c_name: str = f"{self._c_name}"
+        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if message != "":
+            message = f": {message}"
+        if self.logger:
+            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+
+    @property
+    def best_solver(self) -> str:
+        """Return name of the solver that found the best route."""
+        return self.__best_solver
+
+    @property
+    def final_distance(self) -> float:
+        """Return distance of the best route."""
+        return self.__best_distance
+
+    @property
+    def get_final(self) -> List[StarsSystem]:
+        """Return the best route."""
+        with self.__lock:
+            return self.__best[:]
+
+
+# #[EOF]#######################################################################
@@ -7,14 +7,20 @@ Created: 7.10.2024, 13:39:31
 Purpose: StarsSystem container.
 """
 
+from array import array
 from inspect import currentframe
-from typing import Optional, List, Dict, Union, Any
+from typing import Optional, List, Dict, Union, Any, Iterable
 
 from ..attribtool import ReadOnlyClass
 from ..raisetool import Raise
 from ..basetool.data import BData
 from .edsm_keys import EdsmKeys
 
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
 
 class _Keys(object, metaclass=ReadOnlyClass):
     """Internal Keys container class."""
@@ -28,6 +34,13 @@ class _Keys(object, metaclass=ReadOnlyClass):
     SS_POS_Z: str = "__ss_pos_z__"
     SS_STAR_CLASS: str = "__ss_star_class__"
 
+    # StarsSystemArray
+    SA_ADDRESSES: str = "__sa_addresses__"
+    SA_COUNT: str = "__sa_count__"
+    SA_EXTRA: str = "__sa_extra__"
+    SA_NAMES: str = "__sa_names__"
+    SA_POSITIONS: str = "__sa_positions__"
+
 
 class StarsSystem(BData):
     """StarsSystem container class."""
@@ -188,4 +201,210 @@ class StarsSystem(BData):
             self.data[EdsmKeys.BODIES] = len(data[EdsmKeys.BODIES])
 
 
+class StarsSystemArray(BData):
+    """Compact collection of star systems for route solvers.
+
+    Coordinates are kept in one contiguous float64 (N x 3) buffer,
+    addresses in an int64 buffer and names in a list. Star class and
+    data dict are stored only for rows that have them. StarsSystem
+    objects are built on demand, e.g. for the final route.
+    Without numpy the buffers are `array.array` objects.
+    """
+
+    def __init__(self, systems: Optional[Iterable[StarsSystem]] = None) -> None:
+        """Create array, optionally filled from StarsSystem objects."""
+        self._set_data(key=_Keys.SA_COUNT, value=0, set_default_type=int)
+        self._set_data(key=_Keys.SA_NAMES, value=[], set_default_type=List)
+        self._set_data(key=_Keys.SA_EXTRA, value={}, set_default_type=Dict)
+        if np is not None:
+            self._set_data(
+                key=_Keys.SA_POSITIONS,
+                value=np.empty((0, 3), dtype=np.float64),
+                set_default_type=np.ndarray,
+            )
+            self._set_data(
+                key=_Keys.SA_ADDRESSES,
+                value=np.empty(0, dtype=np.int64),
+                set_default_type=np.ndarray,
+            )
+        else:
+            self._set_data(
+                key=_Keys.SA_POSITIONS, value=array("d"), set_default_type=array
+            )
+            self._set_data(
+                key=_Keys.SA_ADDRESSES, value=array("q"), set_default_type=array
+            )
+        if systems is not None:
+            self.extend(systems)
+
+    def __len__(self) -> int:
+        """Returns number of systems."""
+        return self._get_data(key=_Keys.SA_COUNT)  # type: ignore
+
+    def __repr__(self) -> str:
+        """Give me class dump."""
+        return f"{self._c_name}(count={len(self)})"
+
+    def __reserve(self, count: int) -> None:
+        """Grow numpy buffers to hold at least count rows."""
+        positions = self._get_data(key=_Keys.SA_POSITIONS)
+        capacity: int = positions.shape[0]
+        if count <= capacity:
+            return
+        capacity = max(count, capacity * 2, 16)
+        new_pos = np.empty((capacity, 3), dtype=np.float64)
+        new_pos[: len(self)] = positions[: len(self)]
+        new_addr = np.empty(capacity, dtype=np.int64)
+        new_addr[: len(self)] = self._get_data(key=_Keys.SA_ADDRESSES)[: len(self)]
+        self._set_data(key=_Keys.SA_POSITIONS, value=new_pos)
+        self._set_data(key=_Keys.SA_ADDRESSES, value=new_addr)
+
+    def append(
+        self,
+        name: Optional[str],
+        address: Optional[int],
+        star_pos: List,
+        star_class: str = "",
+        data: Optional[Dict] = None,
+    ) -> int:
+        """Add system and return its index.
+
+        Missing address is stored as -1.
+        """
+        if not isinstance(star_pos, (List, tuple)) or len(star_pos) != 3:
+            raise Raise.error(
+                f"List type with 3 coordinates expected, '{star_pos}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        idx: int = len(self)
+        addr: int = -1 if address is None else int(address)
+        if np is not None:
+            self.__reserve(idx + 1)
+            self._get_data(key=_Keys.SA_POSITIONS)[idx] = star_pos
+            self._get_data(key=_Keys.SA_ADDRESSES)[idx] = addr
+        else:
+            self._get_data(key=_Keys.SA_POSITIONS).extend(  # type: ignore
+                float(axis) for axis in star_pos
+            )
+            self._get_data(key=_Keys.SA_ADDRESSES).append(addr)  # type: ignore
+        self._get_data(key=_Keys.SA_NAMES).append(name)  # type: ignore
+        if star_class or data:
+            self._get_data(key=_Keys.SA_EXTRA)[idx] = (  # type: ignore
+                star_class,
+                data,
+            )
+        self._set_data(key=_Keys.SA_COUNT, value=idx + 1)
+        return idx
+
+    def extend(self, systems: Iterable[StarsSystem]) -> None:
+        """Add StarsSystem objects."""
+        systems = list(systems)
+        if np is not None:
+            self.__reserve(len(self) + len(systems))
+        for system in systems:
+            if not isinstance(system, StarsSystem):
+                raise Raise.error(
+                    f"StarsSystem type expected, '{type(system)}' received.",
+                    TypeError,
+                    self._c_name,
+                    currentframe(),
+                )
+            self.append(
+                system.name,
+                system.address,
+                system.star_pos,
+                system.star_class,
+                system.data if system.data else None,
+            )
+
+    @property
+    def addresses(self) -> Any:
+        """Returns addresses.
+
+        With numpy this is an int64 ndarray view of the collection,
+        otherwise a list copy, so the buffer can still grow.
+        """
+        if np is not None:
+            return self._get_data(key=_Keys.SA_ADDRESSES)[: len(self)]  # type: ignore
+        return self._get_data(key=_Keys.SA_ADDRESSES).tolist()  # type: ignore
+
+    @property
+    def names(self) -> List[Optional[str]]:
+        """Returns list of names."""
+        return self._get_data(key=_Keys.SA_NAMES)  # type: ignore
+
+    @property
+    def positions(self) -> Any:
+        """Returns coordinates.
+
+        With numpy this is a (N x 3) float64 ndarray sharing memory with
+        the collection, otherwise a list of (x, y, z) tuples copied from
+        the buffer.
+        """
+        positions = self._get_data(key=_Keys.SA_POSITIONS)
+        if np is not None:
+            return positions[: len(self)]  # type: ignore
+        return [
+            tuple(positions[idx : idx + 3])  # type: ignore
+            for idx in range(0, 3 * len(self), 3)
+        ]
+
+    def position(self, idx: int) -> List[float]:
+        """Returns coordinates of the system as list."""
+        positions = self._get_data(key=_Keys.SA_POSITIONS)
+        if np is not None:
+            return positions[idx].tolist()  # type: ignore
+        return positions[idx * 3 : idx * 3 + 3].tolist()  # type: ignore
+
+    def distances(self, star_pos: List) -> Any:
+        """Returns distances from given point to all systems.
+
+        Result is a numpy array, or list of floats without numpy.
+        """
+        if np is not None:
+            diff = self.positions - np.asarray(star_pos, dtype=np.float64)
+            return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        positions = self._get_data(key=_Keys.SA_POSITIONS)
+        x, y, z = star_pos
+        out: List[float] = []
+        for idx in range(0, len(positions), 3):  # type: ignore
+            dx: float = positions[idx] - x  # type: ignore
+            dy: float = positions[idx + 1] - y  # type: ignore
+            dz: float = positions[idx + 2] - z  # type: ignore
+            out.append((dx * dx + dy * dy + dz * dz) ** 0.5)
+        return out
+
+    def system(self, idx: int) -> StarsSystem:
+        """Returns StarsSystem object built from the row."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise Raise.error(
+                f"Index out of range: {idx}",
+                IndexError,
+                self._c_name,
+                currentframe(),
+            )
+        address: Optional[int] = int(
+            self._get_data(key=_Keys.SA_ADDRESSES)[idx]  # type: ignore
+        )
+        out = StarsSystem(
+            self.names[idx], None if address == -1 else address, self.position(idx)
+        )
+        extra = self._get_data(key=_Keys.SA_EXTRA).get(idx)  # type: ignore
+        if extra is not None:
+            out.star_class = extra[0]
+            if extra[1]:
+                out.data = dict(extra[1])
+        return out
+
+    def systems(self, indexes: Optional[Iterable[int]] = None) -> List[StarsSystem]:
+        """Returns StarsSystem objects for given indexes, all if None."""
+        if indexes is None:
+            indexes = range(len(self))
+        return [self.system(int(idx)) for idx in indexes]
+
+
 # #[EOF]#######################################################################
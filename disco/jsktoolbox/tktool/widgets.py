@@ -14,7 +14,7 @@ VerticalScrolledFrame based on https://gist.github.com/novel-yet-trivial/3eddfce
 
 import tkinter as tk
 from tkinter import Toplevel, ttk
-from typing import Any, Optional, List, Tuple, Union, Dict
+from typing import Any, Callable, Iterable, Optional, List, Tuple, Union, Dict
 
 from .base import TkBase
 
@@ -170,12 +170,19 @@ class CreateToolTip(TkBase):
     __wrap_length: int = None  # type: ignore
     __text: Union[str, List[str], Tuple[str]] = None  # type: ignore
     __text_variable: tk.StringVar = None  # type: ignore
+    __text_factory: Optional[Callable[[], Union[str, List[str], Tuple[str]]]] = None
     __label_attr: Dict[str, Any] = None  # type: ignore
 
     def __init__(
         self,
         widget: tk.Misc,
-        text: Union[str, List[str], Tuple[str], tk.StringVar] = "widget info",
+        text: Union[
+            str,
+            List[str],
+            Tuple[str],
+            tk.StringVar,
+            Callable[[], Union[str, List[str], Tuple[str]]],
+        ] = "widget info",
         wait_time: int = 500,
         wrap_length: int = 0,
         **kwargs,
@@ -184,7 +191,7 @@ class CreateToolTip(TkBase):
 
         ### Arguments:
         * widget: tk.Misc - Widget that triggers tooltip display on hover.
-        * text: Union[str, List[str], Tuple[str], tk.StringVar] - Tooltip message or Tk variable.
+        * text: Union[str, List[str], Tuple[str], tk.StringVar, Callable] - Tooltip message, Tk variable or callable returning the message when the tooltip is shown first.
         * wait_time: int - Delay in milliseconds before the tooltip appears.
         * wrap_length: int - Maximum tooltip line width in pixels; 0 keeps Tk defaults.
         * **kwargs: Any - Extra keyword arguments forwarded to the tooltip label configuration.
@@ -289,6 +296,8 @@ class CreateToolTip(TkBase):
         ### Raises:
         * None: Tkinter manages window creation behaviour.
         """
+        if not self.text:
+            return
         __x: int = 0
         __y: int = 0
         __cx: int
@@ -341,8 +350,11 @@ class CreateToolTip(TkBase):
         Union[str, tk.StringVar] - Current text payload, flattened when a list or tuple is provided.
 
         ### Raises:
-        * None: Text retrieval is free of side effects.
+        * None: Only a pending text callable is evaluated and memoized.
         """
+        if self.__text_factory is not None:
+            self.__text = self.__text_factory()
+            self.__text_factory = None
         if self.__text is None and self.__text_variable is None:
             self.__text = ""
         if self.__text_variable is None:
@@ -356,11 +368,23 @@ class CreateToolTip(TkBase):
             return self.__text_variable
 
     @text.setter
-    def text(self, value: Union[str, List[str], Tuple[str], tk.StringVar]) -> None:
+    def text(
+        self,
+        value: Union[
+            str,
+            List[str],
+            Tuple[str],
+            tk.StringVar,
+            Callable[[], Union[str, List[str], Tuple[str]]],
+        ],
+    ) -> None:
         """Set the tooltip text content.
 
+        A callable is evaluated lazily, on the first tooltip display, and its
+        result is kept until the next assignment.
+
         ### Arguments:
-        * value: Union[str, List[str], Tuple[str], tk.StringVar] - Tooltip message or Tk variable.
+        * value: Union[str, List[str], Tuple[str], tk.StringVar, Callable] - Tooltip message, Tk variable or message callable.
 
         ### Returns:
         None - Updates internal references for future tooltip displays.
@@ -370,8 +394,12 @@ class CreateToolTip(TkBase):
         """
         if isinstance(value, tk.StringVar):
             self.__text_variable = value
+        elif callable(value):
+            self.__text = None  # type: ignore
+            self.__text_factory = value
         else:
             self.__text = value
+            self.__text_factory = None
 
 
 class VerticalScrolledTkFrame(tk.Frame, TkBase):
@@ -604,4 +632,265 @@ class VerticalScrolledTtkFrame(ttk.Frame, TkBase):
             self.__canvas.yview_scroll(1, "units")
 
 
+class VirtualListTkFrame(tk.Frame, TkBase):
+    """Virtualised vertical list container.
+
+    Materialises only the rows visible in the viewport plus a small buffer.
+    Row widgets scrolled out of view are recycled for the rows scrolled in,
+    so the number of Tk widgets does not depend on the number of rows.
+    All rows share the same height.
+    """
+
+    __vscrollbar: tk.Scrollbar = None  # type: ignore
+    __canvas: tk.Canvas = None  # type: ignore
+    __factory: Callable[[tk.Misc], tk.Widget] = None  # type: ignore
+    __render: Callable[[tk.Widget, int], None] = None  # type: ignore
+    __count: int = 0
+    __row_height: int = 0
+    __buffer: int = 0
+    __rows: Dict[int, Tuple[tk.Widget, int]] = None  # type: ignore
+    __pool: List[Tuple[tk.Widget, int]] = None  # type: ignore
+    __busy: bool = False
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        factory: Callable[[tk.Misc], tk.Widget],
+        render: Callable[[tk.Widget, int], None],
+        row_height: int = 0,
+        buffer: int = 5,
+        *args,
+        **kw,
+    ) -> None:
+        """Initialise the virtualised list.
+
+        ### Arguments:
+        * parent: tk.Misc - Parent widget that owns this frame.
+        * factory: Callable[[tk.Misc], tk.Widget] - Creates an empty row widget for the given parent.
+        * render: Callable[[tk.Widget, int], None] - Fills the row widget with data of the row index.
+        * row_height: int - Height of the row in pixels; 0 measures the first rendered row.
+        * buffer: int - Number of rows materialised above and below the viewport.
+        * *args: Any - Positional arguments forwarded to `tk.Frame`.
+        * **kw: Any - Keyword arguments forwarded to `tk.Frame`.
+
+        ### Returns:
+        None - Constructor configures widget state.
+
+        ### Raises:
+        * None: Construction relies on Tkinter widget creation only.
+        """
+        tk.Frame.__init__(self, parent, *args, **kw)
+        self.__factory = factory
+        self.__render = render
+        self.__row_height = row_height
+        self.__buffer = buffer
+        self.__rows = {}
+        self.__pool = []
+
+        self.__vscrollbar = tk.Scrollbar(self, orient=tk.VERTICAL)
+        self.__vscrollbar.pack(fill=tk.Y, side=tk.RIGHT)
+        self.__canvas = tk.Canvas(
+            self, bd=0, highlightthickness=0, yscrollcommand=self.__on_yview
+        )
+        self.__canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=tk.TRUE)
+        self.__vscrollbar.config(command=self.__canvas.yview)
+        if self.__row_height:
+            self.__canvas.config(yscrollincrement=self.__row_height)
+
+        # Configure Events
+        self.__canvas.bind("<Configure>", self.__configure_canvas)
+        self.bind("<Enter>", self.__bind_mouse)
+        self.bind("<Leave>", self.__unbind_mouse)
+
+    @property
+    def count(self) -> int:
+        """Return the number of rows.
+
+        ### Arguments:
+        * None: No public arguments.
+
+        ### Returns:
+        int - Number of rows in the list.
+
+        ### Raises:
+        * None: Accessors return cached values only.
+        """
+        return self.__count
+
+    @count.setter
+    def count(self, value: int) -> None:
+        """Set the number of rows.
+
+        Materialised rows beyond the new size are recycled, the others keep
+        their content until `refresh` is called.
+
+        ### Arguments:
+        * value: int - New number of rows.
+
+        ### Returns:
+        None - Updates the scroll region and the viewport.
+
+        ### Raises:
+        * None: Assignment updates internal state without validation errors.
+        """
+        self.__count = max(0, int(value))
+        for index in [idx for idx in self.__rows if idx >= self.__count]:
+            self.__recycle(index)
+        self.__update_scrollregion()
+        self.__update_view()
+
+    def refresh(self, indexes: Optional[Iterable[int]] = None) -> None:
+        """Render again the materialised rows.
+
+        ### Arguments:
+        * indexes: Optional[Iterable[int]] - Rows to render, all materialised rows if None.
+
+        ### Returns:
+        None - Calls the render callback for the visible rows.
+
+        ### Raises:
+        * None: Rendering errors are propagated from the render callback.
+        """
+        if indexes is None:
+            indexes = list(self.__rows.keys())
+        for index in indexes:
+            if index in self.__rows:
+                self.__render(self.__rows[index][0], index)
+
+    def reset(self) -> None:
+        """Recycle all rows and scroll to the top of the list.
+
+        ### Arguments:
+        * None: No public arguments.
+
+        ### Returns:
+        None - Next viewport update renders rows from scratch.
+
+        ### Raises:
+        * None: Tkinter handles canvas errors internally.
+        """
+        for index in list(self.__rows.keys()):
+            self.__recycle(index)
+        self.__canvas.yview_moveto(0)
+        self.__update_view()
+
+    def __new_row(self) -> Tuple[tk.Widget, int]:
+        """Create new row widget placed in the canvas."""
+        widget: tk.Widget = self.__factory(self.__canvas)
+        item: int = self.__canvas.create_window(
+            0, -self.__row_height - 10000, window=widget, anchor=tk.NW
+        )
+        width: int = self.__canvas.winfo_width()
+        if width > 1:
+            self.__canvas.itemconfigure(item, width=width)
+        return widget, item
+
+    def __recycle(self, index: int) -> None:
+        """Move row widget out of the viewport and return it to the pool."""
+        widget, item = self.__rows.pop(index)
+        self.__canvas.coords(item, 0, -self.__row_height - 10000)
+        self.__pool.append((widget, item))
+
+    def __measure(self) -> None:
+        """Measure the row height with the first row."""
+        row: Tuple[tk.Widget, int] = self.__new_row()
+        self.__render(row[0], 0)
+        row[0].update_idletasks()
+        self.__row_height = max(1, row[0].winfo_reqheight())
+        self.__canvas.config(yscrollincrement=self.__row_height)
+        self.__pool.append(row)
+        self.__update_scrollregion()
+
+    def __update_scrollregion(self) -> None:
+        """Set the scroll region to the size of all rows."""
+        self.__canvas.config(
+            scrollregion=(
+                0,
+                0,
+                self.__canvas.winfo_width(),
+                self.__count * self.__row_height,
+            )
+        )
+
+    def __update_view(self) -> None:
+        """Materialise rows visible in the viewport, recycle the others."""
+        if self.__busy:
+            return
+        self.__busy = True
+        try:
+            if self.__count and not self.__row_height:
+                self.__measure()
+            height: int = max(1, self.__row_height)
+            top: float = self.__canvas.canvasy(0)
+            first: int = max(0, int(top // height) - self.__buffer)
+            last: int = min(
+                self.__count,
+                int((top + self.__canvas.winfo_height()) // height) + 1 + self.__buffer,
+            )
+            for index in [idx for idx in self.__rows if idx < first or idx >= last]:
+                self.__recycle(index)
+            for index in range(first, last):
+                if index in self.__rows:
+                    continue
+                row: Tuple[tk.Widget, int] = (
+                    self.__pool.pop() if self.__pool else self.__new_row()
+                )
+                self.__render(row[0], index)
+                self.__canvas.coords(row[1], 0, index * height)
+                self.__rows[index] = row
+        finally:
+            self.__busy = False
+
+    def __on_yview(self, first: str, last: str) -> None:
+        """Update the scrollbar and the viewport after the view change."""
+        self.__vscrollbar.set(first, last)
+        self.__update_view()
+
+    def __configure_canvas(self, event: Optional[tk.Event] = None) -> None:
+        # Update rows width to fill the canvas.
+        width: int = self.__canvas.winfo_width()
+        for _, item in list(self.__rows.values()) + self.__pool:
+            self.__canvas.itemconfigure(item, width=width)
+        self.__update_scrollregion()
+        self.__update_view()
+
+    def __bind_mouse(self, event: Optional[tk.Event] = None) -> None:
+        self.__canvas.bind_all("<4>", self.__on_mousewheel)
+        self.__canvas.bind_all("<5>", self.__on_mousewheel)
+        self.__canvas.bind_all("<MouseWheel>", self.__on_mousewheel)
+
+    def __unbind_mouse(self, event: Optional[tk.Event] = None) -> None:
+        # Leave event is also generated when pointer enters a row widget.
+        if event is not None:
+            widget: Optional[tk.Misc] = self.winfo_containing(
+                event.x_root, event.y_root
+            )
+            if widget is not None and (
+                str(widget) == str(self) or str(widget).startswith(f"{self}.")
+            ):
+                return
+        self.__canvas.unbind_all("<4>")
+        self.__canvas.unbind_all("<5>")
+        self.__canvas.unbind_all("<MouseWheel>")
+
+    def __on_mousewheel(self, event: tk.Event) -> None:
+        """Translate mouse wheel events into vertical scrolling.
+
+        Linux relies on `event.num` while Windows and macOS provide `event.delta`.
+
+        ### Arguments:
+        * event: tk.Event - Mouse wheel event emitted by Tkinter.
+
+        ### Returns:
+        None - Adjusts the canvas viewport in response to the event.
+
+        ### Raises:
+        * None: Scroll handling defers to Tkinter canvas methods.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.__canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.__canvas.yview_scroll(1, "units")
+
+
 # #[EOF]#######################################################################
@@ -0,0 +1,354 @@
+# -*- coding: UTF-8 -*-
+"""
+  Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+  Created: 19.10.2026
+
+  Purpose: multi-hop route planner over the local systems database.
+"""
+
+import heapq
+import math
+
+from inspect import currentframe
+from queue import Queue, SimpleQueue
+from typing import Optional, List, Dict, Tuple, Union
+from types import FrameType
+
+from sqlalchemy.orm import Session
+
+from disco.jsktoolbox.attribtool import ReadOnlyClass
+from disco.jsktoolbox.raisetool import Raise
+from disco.jsktoolbox.basetool.classes import BClasses
+from disco.jsktoolbox.edmctool.base import BLogClient
+from disco.jsktoolbox.edmctool.logs import LogClient
+from disco.jsktoolbox.edmctool.edsm_keys import EdsmKeys
+from disco.jsktoolbox.edmctool.stars import StarsSystem, StarsSystemArray
+
+import disco.db_models as db
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+
+class RouteKeys(object, metaclass=ReadOnlyClass):
+    """Keys for StarsSystem.data of the route elements."""
+
+    # jump range multiplier used for the jump to the system
+    BOOST: str = "boost"
+
+
+class SystemsGrid(BClasses):
+    """Uniform grid spatial index over StarsSystemArray coordinates.
+
+    Every cell is a cube with `cell_size` edge and holds indexes of the
+    systems placed inside it.
+    """
+
+    __cell_size: float = None  # type: ignore
+    __cells: Dict[Tuple[int, int, int], List[int]] = None  # type: ignore
+    __systems: StarsSystemArray = None  # type: ignore
+
+    def __init__(self, systems: StarsSystemArray, cell_size: float) -> None:
+        """Build index.
+
+        params:
+        systems: StarsSystemArray - indexed systems
+        cell_size: float - edge of the grid cell in ly
+        """
+        if cell_size <= 0:
+            raise Raise.error(
+                f"Positive cell size expected, '{cell_size}' received.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__cell_size = float(cell_size)
+        self.__systems = systems
+        self.__cells = {}
+        for idx in range(len(systems)):
+            self.__cells.setdefault(self.cell(systems.position(idx)), []).append(idx)
+
+    def cell(self, star_pos: List[float]) -> Tuple[int, int, int]:
+        """Return grid cell of the point."""
+        size: float = self.__cell_size
+        return (
+            math.floor(star_pos[0] / size),
+            math.floor(star_pos[1] / size),
+            math.floor(star_pos[2] / size),
+        )
+
+    def neighbours(
+        self, star_pos: List[float], radius: float
+    ) -> List[Tuple[int, float]]:
+        """Return (index, distance) of systems within radius from the point."""
+        span: int = math.ceil(radius / self.__cell_size)
+        cx, cy, cz = self.cell(star_pos)
+        candidates: List[int] = []
+        for x in range(cx - span, cx + span + 1):
+            for y in range(cy - span, cy + span + 1):
+                for z in range(cz - span, cz + span + 1):
+                    cell: Optional[List[int]] = self.__cells.get((x, y, z))
+                    if cell:
+                        candidates.extend(cell)
+        if not candidates:
+            return []
+        if np is not None:
+            diff = self.__systems.positions[candidates] - np.asarray(
+                star_pos, dtype=np.float64
+            )
+            dists = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+            mask = dists <= radius
+            return list(
+                zip(
+                    np.asarray(candidates)[mask].tolist(),
+                    dists[mask].tolist(),
+                )
+            )
+        out: List[Tuple[int, float]] = []
+        for idx in candidates:
+            dist: float = math.dist(star_pos, self.__systems.position(idx))
+            if dist <= radius:
+                out.append((idx, dist))
+        return out
+
+
+class DBRoutePlanner(BLogClient):
+    """A* route planner over systems known from the local database.
+
+    Nodes are systems from the 'systems' table, edges connect systems
+    closer than the jump range. Jump cost is its length in ly plus
+    `jump_cost`, the heuristic is the straight-line distance to the
+    target plus `jump_cost` for every jump still needed at least.
+
+    Systems tagged in 'system_boosts' extend the range of the next jump
+    by the FSD supercharge multiplier, at the price of `supercharge_cost`
+    for every boosted jump.
+    """
+
+    __plugin_name: str = None  # type: ignore
+    __session: Session = None  # type: ignore
+    __systems: StarsSystemArray = None  # type: ignore
+    __by_address: Dict[int, int] = None  # type: ignore
+    __by_name: Dict[str, int] = None  # type: ignore
+    __boost: Dict[int, float] = None  # type: ignore
+    __grid: Optional[SystemsGrid] = None
+    __final: List[StarsSystem] = None  # type: ignore
+
+    def __init__(
+        self,
+        session: Session,
+        log_queue: Optional[Union[Queue, SimpleQueue]],
+        plugin_name: str,
+    ) -> None:
+        """Construct instance object.
+
+        params:
+        session: Session - database session
+        log_queue: queue for LogClient
+        plugin_name: str - name of plugin for debug log
+        """
+        self.__plugin_name = plugin_name
+        # init log subsystem
+        if isinstance(log_queue, (Queue, SimpleQueue)):
+            self.logger = LogClient(log_queue)
+        else:
+            raise Raise.error(
+                f"Queue or SimpleQueue type expected, '{type(log_queue)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(session, Session):
+            raise Raise.error(
+                f"Session type expected, '{type(session)}' received.",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__session = session
+        self.__final = []
+
+    def load(self, cell_size: float = 50.0) -> int:
+        """Load known systems from database and build spatial index.
+
+        Returns number of loaded systems.
+        """
+        self.__systems = StarsSystemArray()
+        self.__by_address = {}
+        self.__by_name = {}
+        self.__boost = {}
+        query = self.__session.query(
+            db.TSystem.name,
+            db.TSystem.systemaddress,
+            db.TSystem.pos_x,
+            db.TSystem.pos_y,
+            db.TSystem.pos_z,
+            db.TSystemBoost.star_type,
+            db.TSystemBoost.multiplier,
+        ).outerjoin(db.TSystemBoost, db.TSystemBoost.system_id == db.TSystem.id)
+        for name, address, pos_x, pos_y, pos_z, star_type, multiplier in query:
+            idx: int = self.__systems.append(
+                name, address, [pos_x, pos_y, pos_z], star_type or ""
+            )
+            self.__by_address[address] = idx
+            if name:
+                self.__by_name[name.lower()] = idx
+            if multiplier and multiplier > 1.0:
+                self.__boost[idx] = multiplier
+        self.__grid = SystemsGrid(self.__systems, cell_size)
+        self.debug(
+            currentframe(),
+            f"Loaded {len(self.__systems)} systems, boosts: {len(self.__boost)}",
+        )
+        return len(self.__systems)
+
+    def __index(self, system: Union[int, str]) -> int:
+        """Return node index of the system given by address or name."""
+        if self.__grid is None:
+            self.load()
+        idx: Optional[int] = None
+        if isinstance(system, int):
+            idx = self.__by_address.get(system)
+        elif isinstance(system, str):
+            idx = self.__by_name.get(system.lower())
+        if idx is None:
+            raise Raise.error(
+                f"System not found in database: '{system}'",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        return idx
+
+    def route(
+        self,
+        start: Union[int, str],
+        target: Union[int, str],
+        jump_range: float,
+        jump_cost: Optional[float] = None,
+        boost: bool = True,
+        supercharge_cost: Optional[float] = None,
+    ) -> List[StarsSystem]:
+        """Find jump-by-jump route between two known systems.
+
+        params:
+        start: int|str - SystemAddress or name of the starting system
+        target: int|str - SystemAddress or name of the target system
+        jump_range: float - jump range in ly
+        jump_cost: Optional[float] - extra cost of every jump in ly,
+                   half of the jump range if None
+        boost: bool - use FSD supercharge in tagged systems
+        supercharge_cost: Optional[float] - extra cost of the supercharge
+                   stop in ly, the jump range if None
+
+        Returns list of StarsSystem from start to target with the jump
+        length in data[EdsmKeys.DISTANCE] and multiplier of boosted jump
+        in data[RouteKeys.BOOST], or empty list if the target is
+        unreachable through known systems.
+        """
+        if jump_range <= 0:
+            raise Raise.error(
+                f"Positive jump range expected, '{jump_range}' received.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        if jump_cost is None:
+            jump_cost = jump_range / 2
+        if supercharge_cost is None:
+            supercharge_cost = jump_range
+        start_idx: int = self.__index(start)
+        goal_idx: int = self.__index(target)
+        goal_pos: List[float] = self.__systems.position(goal_idx)
+        count: int = len(self.__systems)
+        boosts: Dict[int, float] = self.__boost if boost else {}
+        # the longest possible jump, keeps the heuristic admissible
+        max_range: float = jump_range * max(boosts.values(), default=1.0)
+
+        def heuristic(pos: List[float]) -> float:
+            dist: float = math.dist(pos, goal_pos)
+            return dist + jump_cost * math.ceil(dist / max_range)
+
+        g_score: List[float] = [math.inf] * count
+        parent: List[int] = [-1] * count
+        jump: List[float] = [0.0] * count
+        boosted: Dict[int, float] = {}
+        closed: bytearray = bytearray(count)
+        g_score[start_idx] = 0.0
+        open_set: List[Tuple[float, float, int]] = [
+            (heuristic(self.__systems.position(start_idx)), 0.0, start_idx)
+        ]
+        expanded: int = 0
+        while open_set:
+            _, cost, idx = heapq.heappop(open_set)
+            if closed[idx]:
+                continue
+            if idx == goal_idx:
+                break
+            closed[idx] = 1
+            expanded += 1
+            multiplier: float = boosts.get(idx, 1.0)
+            for n_idx, dist in self.__grid.neighbours(  # type: ignore
+                self.__systems.position(idx), jump_range * multiplier
+            ):
+                if closed[n_idx] or n_idx == idx:
+                    continue
+                n_cost: float = cost + dist + jump_cost
+                if dist > jump_range:
+                    n_cost += supercharge_cost
+                if n_cost < g_score[n_idx]:
+                    g_score[n_idx] = n_cost
+                    parent[n_idx] = idx
+                    jump[n_idx] = dist
+                    if dist > jump_range:
+                        boosted[n_idx] = multiplier
+                    else:
+                        boosted.pop(n_idx, None)
+                    heapq.heappush(
+                        open_set,
+                        (
+                            n_cost + heuristic(self.__systems.position(n_idx)),
+                            n_cost,
+                            n_idx,
+                        ),
+                    )
+        self.debug(currentframe(), f"Expanded nodes: {expanded}")
+
+        self.__final = []
+        if g_score[goal_idx] == math.inf:
+            return []
+        path: List[int] = [goal_idx]
+        while path[-1] != start_idx:
+            path.append(parent[path[-1]])
+        for idx in reversed(path):
+            system: StarsSystem = self.__systems.system(idx)
+            system.data[EdsmKeys.DISTANCE] = jump[idx]
+            if idx in boosted:
+                system.data[RouteKeys.BOOST] = boosted[idx]
+            self.__final.append(system)
+        return self.__final[:]
+
+    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
+        """Build debug message."""
+        p_name: str = f"{self.__plugin_name}"
+        c_name: str = f"{self._c_name}"
+        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if message != "":
+            message = f": {message}"
+        if self.logger:
+            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+
+    @property
+    def final_distance(self) -> float:
+        """Return length of the last route in ly."""
+        return sum(system.data.get(EdsmKeys.DISTANCE, 0.0) for system in self.__final)
+
+    @property
+    def get_final(self) -> List[StarsSystem]:
+        """Return the last route."""
+        return self.__final[:]
+
+
+# #[EOF]#######################################################################
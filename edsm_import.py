@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+  Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+  Created: 19.10.2026
+
+  Purpose: importer for EDSM 'systemsWithCoordinates' nightly dumps.
+
+  usage: ./edsm_import.py systemsWithCoordinates.json.gz [--db path] [--restart]
+"""
+
+import argparse
+
+from sqlalchemy import create_engine
+
+from disco.jsktoolbox.edmctool.system import EnvLocal
+from disco.edsm_store import EdsmStore, ImportStats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EDSM systems dump importer.")
+    parser.add_argument("dump", help="gzip compressed EDSM systems dump")
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="SQLite file, 'data/edsm.db' in the plugin directory if not set",
+    )
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore saved import progress"
+    )
+    args = parser.parse_args()
+
+    print("Starting EDSM dump importer")
+
+    path: str = args.db or f"{EnvLocal().plugin_dir}/data/edsm.db"
+    engine = create_engine(f"sqlite+pysqlite:///{path}")
+    store = EdsmStore(engine)
+
+    def progress(stats: ImportStats) -> None:
+        print(f"\r{stats}", end="", flush=True)
+
+    out: ImportStats = store.load(
+        args.dump, batch=args.batch, resume=not args.restart, progress=progress
+    )
+    print(f"\nDone: {out}")
+
+
+# #[EOF]#######################################################################
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+  Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+  Created: 19.10.2026
+
+  Purpose: import time profile of the plugin entry point.
+
+  The plugin module is imported in a fresh interpreter started with
+  '-X importtime'. The slowest imports are listed and the run fails if
+  the import loads modules reserved for the database worker thread or
+  takes longer than the budget.
+
+  usage: ./import_profile.py --top 15 --budget 0.5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from typing import Dict, List, Optional, Tuple
+
+# modules which must not be loaded when EDMC imports the plugin
+DEFERRED: Tuple[str, ...] = ("sqlalchemy", "disco.database", "disco.db_models")
+
+# EDMC provides 'config' module, a stub is enough for import
+IMPORT_CODE: str = (
+    "import sys, types\n"
+    "config = types.ModuleType('config')\n"
+    "config.config = None\n"
+    "sys.modules['config'] = config\n"
+    "import load\n"
+)
+
+
+def profile(python: str) -> Dict[str, Tuple[int, int]]:
+    """Return {module: (self us, cumulative us)} of the plugin import."""
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", IMPORT_CODE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+    out: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        t_self, t_cumulative, name = line[len("import time:") :].split("|")
+        out[name.strip()] = (int(t_self), int(t_cumulative))
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run profile."""
+    parser = argparse.ArgumentParser(description="Plugin import time profile.")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget", type=float, default=0.5, help="import time limit in seconds"
+    )
+    parser.add_argument("--python", default=sys.executable)
+    args = parser.parse_args(argv)
+
+    modules: Dict[str, Tuple[int, int]] = profile(args.python)
+    total: float = modules.get("load", (0, 0))[1] / 1e6
+    for name, (t_self, t_cumulative) in sorted(
+        modules.items(), key=lambda item: item[1][1], reverse=True
+    )[: args.top]:
+        print(f"{t_cumulative / 1000:10.2f} ms {t_self / 1000:10.2f} ms  {name}")
+    print(f"plugin import: {total:.3f}s, budget: {args.budget:.3f}s")
+
+    result: int = 0
+    deferred: List[str] = [
+        item
+        for item in DEFERRED
+        if any(name == item or name.startswith(f"{item}.") for name in modules)
+    ]
+    if deferred:
+        print(f"deferred modules imported: {', '.join(deferred)}", file=sys.stderr)
+        result = 1
+    if total > args.budget:
+        print("plugin import exceeds the budget", file=sys.stderr)
+        result = 1
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# #[EOF]#######################################################################
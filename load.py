@@ -4,8 +4,12 @@
   Created: 18.12.2023
 
   Purpose: edmc plugin entry point
+
+  Import of this module is kept light: SQLAlchemy and the database are
+  loaded by the worker thread started from plugin_start3.
 """
 
+import math
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Optional
@@ -16,9 +20,20 @@ from disco.jsktoolbox.edmctool.logs import LogLevels
 from disco.jsktoolbox.edmctool.ed_keys import EDKeys
 
 from disco.dialogs import DiscoMainDialog, DiscoSystemDialog
+from disco.dialogs_helper import DialogKeys
 from disco.disco import Disco
 
-disco = Disco()
+# polling interval in ms for events buffered until the database is ready
+DB_POLL_INTERVAL: int = 100
+# polling interval in ms for the end of system neighbours update
+DB_UPDATE_POLL_INTERVAL: int = 1000
+
+# EDMC config keys: maximum jump range from ship loadouts and the range
+# the system neighbours table was built for
+JUMP_RANGE_KEY: str = "eddisco_jump_range"
+NEIGHBOUR_RANGE_KEY: str = "eddisco_neighbour_range"
+
+disco: Disco = None  # type: ignore
 
 
 def plugin_start3(plugin_dir: str) -> str:
@@ -27,8 +42,14 @@ def plugin_start3(plugin_dir: str) -> str:
     plugin_dir:     plugin directory
     return:         local name of the plugin
     """
+    global disco
+    if disco is None:
+        disco = Disco()
     if disco.logger:
         disco.logger.debug = f"{disco.data.plugin_name}->plugin_start3 start..."
+    # open database in background
+    disco.data.jump_range = config.get_int(JUMP_RANGE_KEY)
+    disco.start_database(config.get_int(NEIGHBOUR_RANGE_KEY))
     # loglevel set from config
     if disco.log_processor:
         disco.log_processor.loglevel = LogLevels().get(
@@ -50,7 +71,8 @@ def plugin_stop() -> None:
         )
     # something to do
 
-    disco.data.db_processor.close()
+    if disco.data.db_processor is not None:
+        disco.data.db_processor.close()
 
     # shut down logger at last
     if disco.logger:
@@ -68,6 +90,12 @@ def plugin_app(parent: tk.Frame) -> ttk.Button:
     """
     if disco.data.dialog is None:
         disco.data.dialog = DiscoMainDialog(parent, disco.qlog, disco.data)
+        if disco.db_ready:
+            _database_ready(parent)
+        elif disco.db_failed:
+            _database_failed()
+        else:
+            parent.after(DB_POLL_INTERVAL, _wait_database, parent)
     button = disco.data.dialog.button  # type: ignore
     CreateToolTip(
         button,
@@ -109,6 +137,83 @@ def journal_entry(
     entry:      The journal event
     state:      More info about the commander, their ship, and their cargo
     """
+    if disco.db_failed:
+        return None
+    if not disco.db_ready:
+        # processed after the database is opened, the oldest are dropped
+        disco.events.append(entry)
+        return None
+    test = _flush_events()
+    if _process_entry(entry):
+        test = True
+    if test:
+        dialog: DiscoSystemDialog = disco.data.dialog  # type: ignore
+        dialog.dialog_update(disco.data.system)
+    return None
+
+
+def _wait_database(parent: tk.Frame) -> None:
+    """Process buffered journal events when the database is ready."""
+    if disco.data.shutting_down:
+        return
+    if disco.db_failed:
+        _database_failed()
+        return
+    if not disco.db_ready:
+        parent.after(DB_POLL_INTERVAL, _wait_database, parent)
+        return
+    _database_ready(parent)
+
+
+def _database_ready(parent: tk.Frame) -> None:
+    """Pass opened database to the dialog and process buffered events."""
+    # dialog was created with a copy of data before the database was opened
+    dialog: DiscoMainDialog = disco.data.dialog  # type: ignore
+    dialog.db_processor = disco.data.db_processor
+    if _flush_events():
+        dialog.dialog_update(disco.data.system)
+    _wait_update(parent)
+
+
+def _wait_update(parent: tk.Frame) -> None:
+    """Save the neighbour range when the neighbours table is rebuilt."""
+    if disco.data.shutting_down:
+        return
+    # checked first, a stopped worker does not change db_updated anymore
+    busy: bool = disco.db_busy
+    if not disco.db_updated:
+        # if the worker stopped without the update, the range is not saved
+        if busy:
+            parent.after(DB_UPDATE_POLL_INTERVAL, _wait_update, parent)
+        return
+    config.set(NEIGHBOUR_RANGE_KEY, int(disco.data.db_processor.neighbour_range))
+
+
+def _database_failed() -> None:
+    """Drop buffered events and show that the database is not available."""
+    disco.events.clear()
+    dialog: DiscoMainDialog = disco.data.dialog  # type: ignore
+    dialog.button[DialogKeys.TEXT] = "Database error"
+
+
+def _flush_events() -> bool:
+    """Process journal events buffered before the database was ready.
+
+    return:     True if the current system was updated
+    """
+    test = False
+    while disco.events:
+        if _process_entry(disco.events.popleft()):
+            test = True
+    return test
+
+
+def _process_entry(entry: Dict) -> bool:
+    """Store the journal event in the database.
+
+    entry:      The journal event
+    return:     True if the current system was updated
+    """
     test = False
 
     if entry[EDKeys.EVENT] in (EDKeys.FSD_JUMP, EDKeys.CARRIER_JUMP):
@@ -151,14 +256,19 @@ def journal_entry(
     elif entry[EDKeys.EVENT] == EDKeys.SAA_SCAN_COMPLETE:
         disco.data.system = disco.data.db_processor.mapped_body(entry)  # type: ignore
         test = True
+    elif entry[EDKeys.EVENT] == EDKeys.LOADOUT and EDKeys.MAX_JUMP_RANGE in entry:
+        # neighbours are rebuilt for the new range on next start
+        jump_range: int = math.ceil(entry[EDKeys.MAX_JUMP_RANGE])
+        if jump_range > disco.data.jump_range:
+            config.set(JUMP_RANGE_KEY, jump_range)
+            disco.data.jump_range = jump_range
+            disco.logger.debug = f"{EDKeys.LOADOUT}: jump range {jump_range} ly"
     elif entry[EDKeys.EVENT] == EDKeys.LOCATION and EDKeys.STAR_SYSTEM in entry:
         disco.data.system = disco.data.db_processor.get_system_by_name(
             entry[EDKeys.STAR_SYSTEM]
         )  # type: ignore
         test = True
-    if test:
-        dialog: DiscoSystemDialog = disco.data.dialog  # type: ignore
-        dialog.dialog_update(disco.data.system)
+    return test
 
 
 # #[EOF]#######################################################################
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+  Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+  Created: 19.10.2026
+
+  Purpose: benchmark of route solvers on synthetic star fields.
+
+  Every IAlg implementation from edmctool.math is run on reproducible
+  uniform, clustered and filament-shaped star fields. Wall time, peak
+  memory, route length against the best known and the fraction of
+  reached targets are written as JSON and/or CSV. Routes are counted up
+  to the first jump longer than the jump range, such routes are marked
+  infeasible and are not used as the best known.
+
+  usage: ./route_benchmark.py --sizes 20 50 --jump-ranges 90 150 --json out.json
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from queue import SimpleQueue
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from disco.jsktoolbox.edmctool.data import RscanData
+from disco.jsktoolbox.edmctool.stars import StarsSystem
+from disco.jsktoolbox.edmctool import math as ed_math
+from disco.jsktoolbox.edmctool.math import IAlg, Euclid, AlgTsp
+
+# field extent in ly
+FIELD_SIZE: float = 200.0
+# maximum number of targets for exact (permutations) solver
+EXACT_LIMIT: int = 8
+# default field sizes and jump ranges in ly; in the field of FIELD_SIZE
+# the ranges span from partly to fully reachable routes
+DEFAULT_SIZES: List[int] = [8, 25, 50]
+DEFAULT_JUMP_RANGES: List[int] = [90, 150]
+
+
+def uniform_field(rnd: random.Random, count: int) -> List[List[float]]:
+    """Return points distributed uniformly in the field."""
+    return [[rnd.uniform(0, FIELD_SIZE) for _ in range(3)] for _ in range(count)]
+
+
+def clustered_field(rnd: random.Random, count: int) -> List[List[float]]:
+    """Return points gathered in a few gaussian clusters."""
+    centers: List[List[float]] = uniform_field(rnd, max(2, count // 15))
+    spread: float = FIELD_SIZE / 20
+    out: List[List[float]] = []
+    for _ in range(count):
+        center: List[float] = rnd.choice(centers)
+        out.append([rnd.gauss(axis, spread) for axis in center])
+    return out
+
+
+def filament_field(rnd: random.Random, count: int) -> List[List[float]]:
+    """Return points scattered along a random polyline."""
+    nodes: List[List[float]] = uniform_field(rnd, 4)
+    spread: float = FIELD_SIZE / 40
+    out: List[List[float]] = []
+    for _ in range(count):
+        idx: int = rnd.randrange(len(nodes) - 1)
+        step: float = rnd.random()
+        out.append(
+            [
+                rnd.gauss(a + (b - a) * step, spread)
+                for a, b in zip(nodes[idx], nodes[idx + 1])
+            ]
+        )
+    return out
+
+
+FIELDS: Dict[str, Callable[[random.Random, int], List[List[float]]]] = {
+    "uniform": uniform_field,
+    "clustered": clustered_field,
+    "filament": filament_field,
+}
+
+
+def solvers() -> Dict[str, Type[IAlg]]:
+    """Return all IAlg implementations found in edmctool.math."""
+    out: Dict[str, Type[IAlg]] = {}
+    for name in dir(ed_math):
+        item = getattr(ed_math, name)
+        if isinstance(item, type) and issubclass(item, IAlg) and item is not IAlg:
+            out[name] = item
+    return out
+
+
+def drain(queue: SimpleQueue) -> None:
+    """Drop collected log messages."""
+    while not queue.empty():
+        queue.get()
+
+
+def feasible_prefix(
+    start: List[float], route: List[StarsSystem], jump_range: int
+) -> Tuple[int, float]:
+    """Return (count, length) of the route up to the first jump out of range."""
+    count: int = 0
+    length: float = 0.0
+    current: List[float] = start
+    for system in route:
+        jump: float = math.dist(current, system.star_pos)
+        if jump > jump_range:
+            break
+        count += 1
+        length += jump
+        current = system.star_pos
+    return count, length
+
+
+def run_case(
+    solver: Type[IAlg],
+    start: List[float],
+    points: List[List[float]],
+    jump_range: int,
+    queue: SimpleQueue,
+    euclid: Euclid,
+) -> Dict:
+    """Run single solver on fresh StarsSystem objects and measure it."""
+    systems: List[StarsSystem] = [
+        StarsSystem(f"S{idx}", idx + 1, pos[:]) for idx, pos in enumerate(points)
+    ]
+    # addresses are reused by every field, every solver starts with empty cache
+    euclid.cache.invalidate()
+    tracemalloc.start()
+    t_start: float = time.perf_counter()
+    alg: IAlg = solver(
+        StarsSystem("Start", 0, start[:]),
+        systems,
+        jump_range,
+        queue,
+        euclid,
+        "Benchmark",
+    )  # type: ignore
+    alg.run()
+    wall: float = time.perf_counter() - t_start
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    drain(queue)
+    route: List[StarsSystem] = alg.get_final
+    reached, length = feasible_prefix(start, route, jump_range)
+    return {
+        "wall_time": wall,
+        "peak_memory": peak,
+        "length": length,
+        "reached": reached,
+        "targets": len(points),
+        "feasible": reached == len(route),
+        "reported_length": float(alg.final_distance),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmark."""
+    available: Dict[str, Type[IAlg]] = solvers()
+    parser = argparse.ArgumentParser(description="Route solvers benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--jump-ranges", type=int, nargs="+", default=DEFAULT_JUMP_RANGES
+    )
+    parser.add_argument(
+        "--fields", nargs="+", choices=sorted(FIELDS), default=sorted(FIELDS)
+    )
+    parser.add_argument("--solvers", nargs="+", choices=sorted(available))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_file", default=None)
+    parser.add_argument("--csv", dest="csv_file", default=None)
+    args = parser.parse_args(argv)
+
+    queue: SimpleQueue = SimpleQueue()
+    r_data = RscanData()
+    r_data.plugin_name = "Benchmark"
+    euclid = Euclid(queue, r_data)
+    euclid.benchmark()
+    drain(queue)
+
+    selected: List[str] = args.solvers or sorted(available)
+    results: List[Dict] = []
+
+    for field in args.fields:
+        for size in args.sizes:
+            rnd = random.Random(f"{args.seed}:{field}:{size}")
+            points: List[List[float]] = FIELDS[field](rnd, size)
+            start: List[float] = points.pop(0)
+            for jump_range in args.jump_ranges:
+                case: List[Dict] = []
+                for name in selected:
+                    if available[name] is AlgTsp and len(points) > EXACT_LIMIT:
+                        continue
+                    random.seed(args.seed)
+                    row: Dict = {
+                        "field": field,
+                        "size": size,
+                        "jump_range": jump_range,
+                        "solver": name,
+                    }
+                    row.update(
+                        run_case(
+                            available[name], start, points, jump_range, queue, euclid
+                        )
+                    )
+                    case.append(row)
+                    print(
+                        f"{field:10} n={size:<5} jr={jump_range:<4} {name:24}"
+                        f" {row['wall_time']:9.4f}s {row['length']:10.2f} ly"
+                        f" {row['reached']}/{row['targets']}"
+                        f"{'' if row['feasible'] else ' infeasible'}",
+                        file=sys.stderr,
+                    )
+                # best known: shortest feasible route among solvers
+                # reaching most targets
+                feasible: List[Dict] = [row for row in case if row["feasible"]]
+                most: int = max((row["reached"] for row in feasible), default=0)
+                best: float = min(
+                    (row["length"] for row in feasible if row["reached"] == most),
+                    default=0.0,
+                )
+                for row in case:
+                    row["best_known"] = best
+                    row["reached_fraction"] = (
+                        row["reached"] / row["targets"] if row["targets"] else 1.0
+                    )
+                    row["length_ratio"] = (
+                        row["length"] / best
+                        if row["feasible"] and row["reached"] == most and best > 0
+                        else None
+                    )
+                results.extend(case)
+
+    if args.json_file:
+        with open(args.json_file, "w") as file:
+            json.dump(results, file, indent=2, default=str)
+    if args.csv_file and results:
+        with open(args.csv_file, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    if not args.json_file and not args.csv_file:
+        json.dump(results, sys.stdout, indent=2, default=str)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# #[EOF]#######################################################################